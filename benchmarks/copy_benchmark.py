@@ -0,0 +1,124 @@
+"""
+Compares the copy-on-write rewriting of the return statements in
+Block.traverse with the previous implementation that deep copied every if,
+while, for, switch and case statement before rewriting it.
+
+For each synthetic input it reports the wall time and the peak memory
+allocated while generating the block function with both implementations.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pycparser import CParser, c_ast  # noqa: E402
+from block import Block  # noqa: E402
+import synthetic  # noqa: E402
+import utils  # noqa: E402
+
+
+def deepcopy_traverse(items, convert_return):
+    """The deep copying implementation of Block.traverse it replaced."""
+    new_items = []
+    for item in items:
+        if isinstance(item, c_ast.Return):
+            new_items.extend(convert_return(item))
+        elif isinstance(item, c_ast.If):
+            item_clone = deepcopy(item)
+            if item.iftrue is not None:
+                item_clone.iftrue.block_items = deepcopy_traverse(
+                    item.iftrue.block_items, convert_return
+                )
+            if item.iffalse is not None:
+                if isinstance(item.iffalse, c_ast.If):
+                    item_clone.iffalse = deepcopy_traverse(
+                        [item.iffalse], convert_return
+                    )[0]
+                else:
+                    item_clone.iffalse.block_items = deepcopy_traverse(
+                        item.iffalse.block_items, convert_return
+                    )
+            new_items.append(item_clone)
+        elif isinstance(item, (c_ast.While, c_ast.For, c_ast.Switch)):
+            item_clone = deepcopy(item)
+            if item.stmt is not None:
+                item_clone.stmt.block_items = deepcopy_traverse(
+                    item.stmt.block_items, convert_return
+                )
+            new_items.append(item_clone)
+        else:
+            new_items.append(item)
+    return new_items
+
+
+def generate_block_function(source, traverse):
+    """
+    Parses the source and generates its block function with the given
+    implementation of Block.traverse. Returns the wall time and the peak
+    memory of the generation, not including the parsing.
+    """
+    ast = CParser().parse(source)
+    func_def_map = utils.get_functions_def_map(ast)
+    involved_functions = utils.identify_involved_functions(ast, func_def_map)
+
+    original_traverse = Block.traverse
+    Block.traverse = staticmethod(traverse)
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        Block.generate_block_function(involved_functions)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        Block.traverse = original_traverse
+    return elapsed, peak
+
+
+def strip_directives(source):
+    _, code = utils.split_directives(source.splitlines(keepends=True))
+    return "".join(code)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--functions", type=int, default=10)
+    parser.add_argument("--body-size", type=int, default=50)
+    parser.add_argument(
+        "--depths",
+        type=int,
+        nargs="+",
+        default=[4, 8, 16],
+        help="nesting depths of the synthetic inputs",
+    )
+    arguments = parser.parse_args()
+
+    print(
+        f"{'depth':>6} {'deepcopy s':>11} {'cow s':>9} "
+        f"{'deepcopy KiB':>13} {'cow KiB':>9}"
+    )
+    for depth in arguments.depths:
+        source = strip_directives(
+            synthetic.generate_program(
+                functions=arguments.functions,
+                body_size=arguments.body_size,
+                depth=depth,
+                cycle_size=arguments.functions,
+                tail_calls=4,
+            )
+        )
+        old_time, old_peak = generate_block_function(source, deepcopy_traverse)
+        new_time, new_peak = generate_block_function(source, Block.traverse)
+        print(
+            f"{depth:>6} {old_time:>11.4f} {new_time:>9.4f} "
+            f"{old_peak / 1024:>13.0f} {new_peak / 1024:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
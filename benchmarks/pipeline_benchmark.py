@@ -0,0 +1,280 @@
+"""
+Measures how each stage of the tail call elimination scales with the size
+and shape of the input, on synthetic programs generated by synthetic.py.
+
+Every combination of the given parameters is benchmarked. The wall time of
+each stage is the best of several runs, and its peak memory is measured in a
+separate run with tracemalloc, which would otherwise slow the stages down.
+The results can be saved as JSON and compared against a baseline saved by a
+previous run.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pycparser  # noqa: E402
+from block import Block  # noqa: E402
+from new_functions import NewFunctions  # noqa: E402
+import synthetic  # noqa: E402
+import utils  # noqa: E402
+
+STAGES = (
+    "parse_file",
+    "identify_involved_functions",
+    "generate_block_function",
+    "change_function_definitions",
+    "write_result_to_disk",
+)
+
+PARAMETERS = ("functions", "body_size", "depth", "cycle_size", "tail_calls")
+
+
+class StageTimer:
+    """
+    Runs the stages of the pipeline and records the wall time of each, and
+    its peak memory if trace_memory is set.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.times = dict()
+        self.peak_memory = dict()
+
+    def run(self, stage, function, *args):
+        if self.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        result = function(*args)
+        self.times[stage] = time.perf_counter() - start
+        if self.trace_memory:
+            self.peak_memory[stage] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return result
+
+
+def generate_blocks(blocks, loop_functions, options):
+    for function_definition in loop_functions:
+        Block.generate_loop_function(function_definition)
+    for block in blocks:
+        block.call_union = Block.generate_block_call_union(
+            block.involved_functions, block.call_union_name
+        )
+        block.function = Block.generate_block_function(
+            block.involved_functions,
+            block.name,
+            block.call_union_name,
+            options,
+        )
+
+
+def change_function_definitions(blocks):
+    for block in blocks:
+        NewFunctions.change_function_definitions(
+            block.involved_functions, block.call_union, block.name
+        )
+
+
+def run_pipeline(source, filename, options, timer):
+    """Runs the stages of main.transform_source one by one with the timer."""
+    directives, code = utils.split_directives(source.splitlines(keepends=True))
+    ast = timer.run(
+        "parse_file", utils.get_parser().parse, "".join(code), filename
+    )
+    func_def_map = utils.get_functions_def_map(ast)
+    blocks, loop_functions = timer.run(
+        "identify_involved_functions",
+        utils.partition_involved_functions,
+        ast,
+        func_def_map,
+        options,
+    )
+    timer.run(
+        "generate_block_function",
+        generate_blocks,
+        blocks,
+        loop_functions,
+        options,
+    )
+    timer.run(
+        "change_function_definitions", change_function_definitions, blocks
+    )
+    timer.run(
+        "write_result_to_disk",
+        utils.write_result_to_disk,
+        directives,
+        blocks,
+        ast,
+        filename,
+    )
+
+
+def benchmark(parameters, options, repeat, directory):
+    """
+    Benchmarks the pipeline on the synthetic program with the given
+    parameters. Returns the best time and the peak memory of each stage.
+    """
+    source = synthetic.generate_program(**parameters)
+    filename = os.path.join(directory, "synthetic.c")
+    with open(filename, "w") as file:
+        file.write(source)
+
+    best_times = dict.fromkeys(STAGES, float("inf"))
+    for _ in range(repeat):
+        timer = StageTimer()
+        run_pipeline(source, filename, options, timer)
+        for stage in STAGES:
+            best_times[stage] = min(best_times[stage], timer.times[stage])
+    timer = StageTimer(trace_memory=True)
+    run_pipeline(source, filename, options, timer)
+
+    return {
+        "parameters": parameters,
+        "source_size": len(source),
+        "stages": {
+            stage: {
+                "time": best_times[stage],
+                "peak_memory": timer.peak_memory[stage],
+            }
+            for stage in STAGES
+        },
+        "total_time": sum(best_times.values()),
+    }
+
+
+def get_result_key(result):
+    return tuple(result["parameters"][name] for name in PARAMETERS)
+
+
+def compare_with_baseline(results, baseline, max_regression):
+    """
+    Prints the ratio between the time of each stage and its time in the
+    baseline, for the parameters both have results for. Returns the number
+    of stages that are slower than the baseline by more than max_regression.
+    """
+    baseline_results = {
+        get_result_key(result): result for result in baseline["results"]
+    }
+    regressions = 0
+    print(
+        f"\n{'parameters':<24} {'stage':<30} {'baseline s':>11} "
+        f"{'current s':>10} {'ratio':>6}"
+    )
+    for result in results:
+        key = get_result_key(result)
+        if key not in baseline_results:
+            continue
+        for stage in STAGES:
+            old_time = baseline_results[key]["stages"][stage]["time"]
+            new_time = result["stages"][stage]["time"]
+            ratio = new_time / old_time if old_time else float("inf")
+            marker = ""
+            if ratio > 1 + max_regression:
+                marker = " !"
+                regressions += 1
+            print(
+                f"{str(key):<24} {stage:<30} {old_time:>11.4f} "
+                f"{new_time:>10.4f} {ratio:>6.2f}{marker}"
+            )
+    return regressions
+
+
+def print_results(results):
+    print(f"{'parameters':<24} {'stage':<30} {'time s':>9} {'peak KiB':>9}")
+    for result in results:
+        key = get_result_key(result)
+        for stage in STAGES:
+            measurement = result["stages"][stage]
+            print(
+                f"{str(key):<24} {stage:<30} {measurement['time']:>9.4f} "
+                f"{measurement['peak_memory'] / 1024:>9.0f}"
+            )
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--functions", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--body-size", type=int, nargs="+", default=[10])
+    parser.add_argument("--depth", type=int, nargs="+", default=[3])
+    parser.add_argument("--cycle-size", type=int, nargs="+", default=[2, 10])
+    parser.add_argument("--tail-calls", type=int, nargs="+", default=[2])
+    parser.add_argument(
+        "--partition",
+        choices=utils.TransformOptions.partition_strategies,
+        default="single",
+    )
+    parser.add_argument(
+        "--dispatch",
+        choices=utils.TransformOptions.dispatch_strategies,
+        default="switch",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="number of timed runs of each benchmark, the best is kept",
+    )
+    parser.add_argument("--output", help="file the results are saved to")
+    parser.add_argument(
+        "--baseline", help="results of a previous run to compare against"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="fraction by which a stage can be slower than the baseline "
+        "before the benchmark fails (default: 0.1)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+    options = utils.TransformOptions(
+        partition=arguments.partition, dispatch=arguments.dispatch
+    )
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for values in itertools.product(
+            arguments.functions,
+            arguments.body_size,
+            arguments.depth,
+            arguments.cycle_size,
+            arguments.tail_calls,
+        ):
+            parameters = dict(zip(PARAMETERS, values))
+            results.append(
+                benchmark(parameters, options, arguments.repeat, directory)
+            )
+    print_results(results)
+
+    report = {
+        "version": utils.VERSION,
+        "python": platform.python_version(),
+        "pycparser": pycparser.__version__,
+        "options": options.to_dict(),
+        "results": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)
+        if compare_with_baseline(results, baseline, arguments.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+Compares the binaries of C programs before and after their tail calls are
+removed.
+
+Each program and its converted version are compiled with the local C compiler
+at several optimization levels and run with deep recursion workloads. For
+each build the harness reports the best wall time, the maximum resident set
+size and the smallest stack the program runs to completion with, which is
+found by running it under decreasing stack limits. Builds whose output or
+exit status differ between the original and the converted program are
+flagged. With several frame ABIs, the program is converted once with each of
+them and every converted version is measured.
+
+Without input files, synthetic programs from synthetic.py are used.
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import main as tail_call_elimination  # noqa: E402
+import synthetic  # noqa: E402
+import utils  # noqa: E402
+
+# The synthetic workloads used when no input file is given, as arguments of
+# synthetic.generate_program. The recursion depth is the one given on the
+# command line unless the workload sets its own, like call_heavy, which
+# enters its cycles many times with shallow recursions to weigh the cost of
+# the calls into the block functions. mixed_types has parameters of different
+# sizes and alignments, so that its call structs have different layouts.
+SYNTHETIC_WORKLOADS = {
+    "self_recursion": {"functions": 4, "cycle_size": 1, "tail_calls": 1},
+    "mutual_recursion": {"functions": 4, "cycle_size": 2, "tail_calls": 2},
+    "wide_cycle": {"functions": 16, "cycle_size": 16, "tail_calls": 3},
+    "call_heavy": {
+        "functions": 4,
+        "body_size": 2,
+        "depth": 1,
+        "cycle_size": 2,
+        "tail_calls": 1,
+        "recursion_depth": 8,
+        "calls": 2000000,
+    },
+    "mixed_types": {
+        "functions": 4,
+        "cycle_size": 4,
+        "tail_calls": 2,
+        "mixed_types": True,
+    },
+}
+
+# The bounds of the search for the smallest stack a program runs with
+MIN_STACK_LIMIT = 16 * 1024
+MAX_STACK_LIMIT = 16 * 1024 * 1024 * 1024
+STACK_SEARCH_PRECISION = 1.05
+
+
+# A small program that runs a binary with a stack limit and reports its wall
+# time, maximum resident set size and exit status. The binaries are not run
+# directly from Python, as a process keeps the maximum resident set size of
+# the process it was forked from, which would report the size of Python
+# instead of the size of the binary.
+RUNNER_SOURCE = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/resource.h>
+#include <sys/wait.h>
+#include <time.h>
+#include <unistd.h>
+
+int main(int argc, char **argv) {
+  struct rlimit limit;
+  struct rusage usage;
+  struct timespec start, end;
+  int status;
+  pid_t pid;
+  FILE *report;
+
+  if (argc < 4) {
+    return 2;
+  }
+  clock_gettime(CLOCK_MONOTONIC, &start);
+  pid = fork();
+  if (pid == 0) {
+    getrlimit(RLIMIT_STACK, &limit);
+    if (strcmp(argv[2], "unlimited") == 0) {
+      limit.rlim_cur = limit.rlim_max;
+    } else {
+      limit.rlim_cur = strtoull(argv[2], NULL, 10);
+    }
+    setrlimit(RLIMIT_STACK, &limit);
+    execv(argv[3], argv + 3);
+    _exit(127);
+  }
+  wait4(pid, &status, 0, &usage);
+  clock_gettime(CLOCK_MONOTONIC, &end);
+  report = fopen(argv[1], "w");
+  fprintf(report, "%.9f %ld %d\n",
+          (end.tv_sec - start.tv_sec) + (end.tv_nsec - start.tv_nsec) / 1e9,
+          usage.ru_maxrss, status);
+  fclose(report);
+  return 0;
+}
+"""
+
+
+class RunResult:
+    """A class used to store the outcome of a single run of a binary."""
+
+    def __init__(self, exit_code, output, wall_time, max_rss):
+        self.exit_code = exit_code
+        self.output = output
+        self.wall_time = wall_time
+        # In bytes, the kernel reports it in kilobytes on Linux
+        self.max_rss = max_rss * 1024
+
+    def matches(self, other):
+        return (
+            self.exit_code == other.exit_code and self.output == other.output
+        )
+
+
+class Runner:
+    """
+    Runs binaries through the runner program, which is compiled on creation
+    into the given directory.
+    """
+
+    def __init__(self, compiler, directory, timeout=None):
+        self.path = os.path.join(directory, "runner")
+        self.report_path = os.path.join(directory, "runner_report")
+        self.timeout = timeout
+        source = os.path.join(directory, "runner.c")
+        with open(source, "w") as file:
+            file.write(RUNNER_SOURCE)
+        error = compile_program(compiler, source, self.path, "2", [])
+        if error is not None:
+            raise RuntimeError(f"Cannot compile the runner: {error}")
+
+    def run(self, path, stack_limit=None):
+        """
+        Runs the binary with the given stack limit in bytes, or without a
+        limit, and returns its exit code, output, wall time and maximum
+        resident set size. A run that takes longer than the timeout is
+        killed along with the runner.
+        """
+        if os.path.exists(self.report_path):
+            os.remove(self.report_path)
+        limit = "unlimited" if stack_limit is None else str(stack_limit)
+        with tempfile.TemporaryFile() as output:
+            process = subprocess.Popen(
+                [self.path, self.report_path, limit, path],
+                stdout=output,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            try:
+                process.wait(self.timeout)
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+                process.wait()
+            output.seek(0)
+            content = output.read()
+        try:
+            with open(self.report_path) as file:
+                wall_time, max_rss, status = file.read().split()
+        except FileNotFoundError:
+            return RunResult(-signal.SIGKILL, content, self.timeout, 0)
+        return RunResult(
+            os.waitstatus_to_exitcode(int(status)),
+            content,
+            float(wall_time),
+            int(max_rss),
+        )
+
+
+def find_min_stack(runner, path, reference):
+    """
+    Finds the smallest stack limit the binary still runs to completion with,
+    producing the same result as the reference run. The limit is found with a
+    geometric binary search, up to STACK_SEARCH_PRECISION.
+    """
+    high = 8 * 1024 * 1024
+    while not runner.run(path, high).matches(reference):
+        if high >= MAX_STACK_LIMIT:
+            return None
+        high *= 2
+    low = MIN_STACK_LIMIT
+    while high / low > STACK_SEARCH_PRECISION:
+        middle = int((low * high) ** 0.5)
+        if runner.run(path, middle).matches(reference):
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def compile_program(compiler, source, binary, level, cflags):
+    """Compiles the source and returns the error message if it fails."""
+    completed = subprocess.run(
+        [compiler, f"-O{level}", *cflags, source, "-o", binary],
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        return completed.stderr.strip()
+    return None
+
+
+def measure_binary(runner, binary, runs, search_stack):
+    """
+    Runs the binary the given number of times without a stack limit and
+    returns the reference run along with its measurements.
+    """
+    results = [runner.run(binary) for _ in range(runs)]
+    reference = results[0]
+    measurement = {
+        "exit_code": reference.exit_code,
+        "wall_time": min(result.wall_time for result in results),
+        "max_rss": max(result.max_rss for result in results),
+        "min_stack": None,
+    }
+    if search_stack and reference.exit_code == 0:
+        measurement["min_stack"] = find_min_stack(runner, binary, reference)
+    return reference, measurement
+
+
+def get_version_name(frame_abi):
+    """
+    Returns the name of the version of a program converted with the frame
+    ABI, which is removed for the default one.
+    """
+    return "removed" if frame_abi == "copy" else f"removed_{frame_abi}"
+
+
+def benchmark_program(name, source, options, arguments, runner, directory):
+    """
+    Converts the program with every frame ABI, compiles the original and
+    the converted versions at every optimization level and measures them.
+    Returns the results of every level.
+    """
+    original_source = os.path.join(directory, f"{name}.c")
+    with open(original_source, "w") as file:
+        file.write(source)
+    versions = [("original", original_source)]
+    for frame_abi in arguments.frame_abi:
+        version = get_version_name(frame_abi)
+        version_source = os.path.join(directory, f"{name}_{version}.c")
+        with open(version_source, "w") as file:
+            file.write(
+                tail_call_elimination.transform_source(
+                    source,
+                    utils.TransformOptions(
+                        **{**options.to_dict(), "frame_abi": frame_abi}
+                    ),
+                    filename=original_source,
+                )
+            )
+        versions.append((version, version_source))
+
+    results = []
+    for level in arguments.levels:
+        result = {"program": name, "level": level}
+        references = dict()
+        for version, version_source in versions:
+            binary = os.path.join(directory, f"{name}_{version}_O{level}")
+            error = compile_program(
+                arguments.compiler,
+                version_source,
+                binary,
+                level,
+                arguments.cflags,
+            )
+            if error is not None:
+                result[version] = {"error": error}
+                continue
+            references[version], result[version] = measure_binary(
+                runner, binary, arguments.runs, arguments.stack
+            )
+        result["versions"] = [version for version, _ in versions]
+        result["same_output"] = len(references) == len(versions) and all(
+            references["original"].matches(reference)
+            for reference in references.values()
+        )
+        results.append(result)
+        print_result(result)
+    return results
+
+
+def format_size(size):
+    return "-" if size is None else f"{size / 1024:.0f}"
+
+
+def print_header():
+    print(
+        f"{'program':<20} {'level':>5} {'version':<14} {'exit':>4} "
+        f"{'time s':>9} {'rss KiB':>9} {'stack KiB':>10}"
+    )
+
+
+def print_result(result):
+    for version in result["versions"]:
+        measurement = result[version]
+        if "error" in measurement:
+            print(
+                f"{result['program']:<20} {'-O' + result['level']:>5} "
+                f"{version:<14} compilation failed"
+            )
+            continue
+        print(
+            f"{result['program']:<20} {'-O' + result['level']:>5} "
+            f"{version:<14} {measurement['exit_code']:>4} "
+            f"{measurement['wall_time']:>9.4f} "
+            f"{format_size(measurement['max_rss']):>9} "
+            f"{format_size(measurement['min_stack']):>10}"
+        )
+    if not result["same_output"]:
+        print(
+            f"{result['program']:<20} {'-O' + result['level']:>5} "
+            "OUTPUT DIFFERS"
+        )
+
+
+def get_programs(arguments):
+    """Returns the name and source code of every program to benchmark."""
+    if arguments.inputs:
+        programs = []
+        for filename in arguments.inputs:
+            with open(filename) as file:
+                name = os.path.splitext(os.path.basename(filename))[0]
+                programs.append((name, file.read()))
+        return programs
+    return [
+        (
+            name,
+            synthetic.generate_program(
+                **{"recursion_depth": arguments.recursion_depth, **parameters}
+            ),
+        )
+        for name, parameters in SYNTHETIC_WORKLOADS.items()
+    ]
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "inputs", nargs="*", help="C programs with a main function"
+    )
+    parser.add_argument("--compiler", default="gcc")
+    parser.add_argument(
+        "--levels",
+        nargs="+",
+        default=["0", "1", "2", "3"],
+        help="optimization levels to compile with (default: 0 1 2 3)",
+    )
+    parser.add_argument(
+        "--cflags",
+        nargs="*",
+        default=["-w"],
+        help="extra flags of the compiler (default: -w)",
+    )
+    parser.add_argument(
+        "--recursion-depth",
+        type=int,
+        default=1000000,
+        help="recursion depth of the synthetic workloads",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="number of timed runs of each binary, the best is kept",
+    )
+    parser.add_argument(
+        "--no-stack",
+        dest="stack",
+        action="store_false",
+        help="do not search for the smallest stack of each binary",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="seconds after which a run is killed",
+    )
+    parser.add_argument(
+        "--partition",
+        choices=utils.TransformOptions.partition_strategies,
+        default="single",
+    )
+    parser.add_argument(
+        "--dispatch",
+        choices=utils.TransformOptions.dispatch_strategies,
+        default="switch",
+    )
+    parser.add_argument(
+        "--frame-abi",
+        nargs="+",
+        choices=utils.TransformOptions.frame_abis,
+        default=["copy"],
+        help="frame ABIs to convert the programs with (default: copy)",
+    )
+    parser.add_argument("--output", help="file the results are saved to")
+    return parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+    options = utils.TransformOptions(
+        partition=arguments.partition, dispatch=arguments.dispatch
+    )
+    results = []
+    print_header()
+    with tempfile.TemporaryDirectory() as directory:
+        runner = Runner(arguments.compiler, directory, arguments.timeout)
+        for name, source in get_programs(arguments):
+            results.extend(
+                benchmark_program(
+                    name, source, options, arguments, runner, directory
+                )
+            )
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(
+                {"options": options.to_dict(), "results": results},
+                file,
+                indent=2,
+            )
+    return 0 if all(result["same_output"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
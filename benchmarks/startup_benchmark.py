@@ -0,0 +1,215 @@
+"""
+Measures how long it takes to start the tail call elimination, which is most
+of the time of converting a single small file, as build systems do for every
+file they compile.
+
+Each scenario runs main.py in a new Python process, or only imports it, and
+its wall time is the best of several runs. The number of modules loaded by
+each scenario is recorded as well, so that a module that is imported by
+every run again is noticed. The results can be saved as JSON and compared
+against a baseline saved by a previous run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "src")
+sys.path.insert(0, SOURCE_DIRECTORY)
+
+import synthetic  # noqa: E402
+import utils  # noqa: E402
+
+# The code run by each scenario, after which the number of loaded modules is
+# printed. The names of the input file, of the output file and of the cache
+# directory are given as the arguments of the scenario.
+SCENARIOS = {
+    "import": "import main",
+    "parser": "import utils; utils.get_parser()",
+    "convert": "import main; main.main([sys.argv[1], '-o', sys.argv[2]])",
+    "cached": "import main; main.main([sys.argv[1], '-o', sys.argv[2], "
+    "'--cache', '--cache-dir', sys.argv[3]])",
+}
+
+
+def generate_command(python, scenario):
+    """
+    Returns the command that runs the scenario and prints the number of
+    modules it loaded. The scenarios are run as scripts, so that the process
+    is the same as the one of python main.py.
+    """
+    return [
+        python,
+        "-c",
+        f"import sys; sys.path.insert(0, {SOURCE_DIRECTORY!r}); "
+        f"{SCENARIOS[scenario]}; print(len(sys.modules))",
+    ]
+
+
+def run_scenario(python, scenario, arguments):
+    """
+    Runs the scenario once. Returns its wall time and the number of modules
+    it loaded.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        generate_command(python, scenario) + arguments,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_time = time.perf_counter() - start
+    return wall_time, int(completed.stdout.split()[-1])
+
+
+def benchmark(python, scenarios, repeat, directory):
+    """
+    Benchmarks the scenarios on a small synthetic program. Returns the best
+    wall time and the number of loaded modules of each.
+    """
+    filename = os.path.join(directory, "synthetic.c")
+    with open(filename, "w") as file:
+        file.write(synthetic.generate_program(functions=4, body_size=2))
+    arguments = [
+        filename,
+        os.path.join(directory, "synthetic_removed.c"),
+        os.path.join(directory, "cache"),
+    ]
+
+    results = []
+    for scenario in scenarios:
+        # The first run fills the cache of the cached scenario and the
+        # bytecode caches of the modules, which every run after it uses
+        _, modules = run_scenario(python, scenario, arguments)
+        best_time = min(
+            run_scenario(python, scenario, arguments)[0] for _ in range(repeat)
+        )
+        results.append(
+            {"scenario": scenario, "time": best_time, "modules": modules}
+        )
+    return results
+
+
+def compare_with_baseline(results, baseline, max_regression):
+    """
+    Prints the ratio between the time of each scenario and its time in the
+    baseline. Returns the number of scenarios that are slower than the
+    baseline by more than max_regression.
+    """
+    baseline_results = {
+        result["scenario"]: result for result in baseline["results"]
+    }
+    regressions = 0
+    print(
+        f"\n{'scenario':<10} {'baseline s':>11} {'current s':>10} "
+        f"{'ratio':>6} {'modules':>9}"
+    )
+    for result in results:
+        if result["scenario"] not in baseline_results:
+            continue
+        old_result = baseline_results[result["scenario"]]
+        ratio = (
+            result["time"] / old_result["time"]
+            if old_result["time"]
+            else float("inf")
+        )
+        marker = ""
+        if ratio > 1 + max_regression:
+            marker = " !"
+            regressions += 1
+        modules = f"{old_result['modules']}->{result['modules']}"
+        print(
+            f"{result['scenario']:<10} {old_result['time']:>11.4f} "
+            f"{result['time']:>10.4f} {ratio:>6.2f} {modules:>9}{marker}"
+        )
+    return regressions
+
+
+def print_results(results):
+    print(f"{'scenario':<10} {'time s':>9} {'modules':>8}")
+    for result in results:
+        print(
+            f"{result['scenario']:<10} {result['time']:>9.4f} "
+            f"{result['modules']:>8}"
+        )
+
+
+def get_pycparser_version(python):
+    completed = subprocess.run(
+        [python, "-c", "import pycparser; print(pycparser.__version__)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.strip()
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=SCENARIOS,
+        default=list(SCENARIOS),
+    )
+    parser.add_argument(
+        "--python",
+        default=sys.executable,
+        help="Python interpreter the scenarios are run with, for example "
+        "the one of an environment with another version of pycparser "
+        "(default: this one)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="number of timed runs of each scenario, the best is kept",
+    )
+    parser.add_argument("--output", help="file the results are saved to")
+    parser.add_argument(
+        "--baseline", help="results of a previous run to compare against"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.1,
+        help="fraction by which a scenario can be slower than the baseline "
+        "before the benchmark fails (default: 0.1)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    arguments = parse_arguments()
+    with tempfile.TemporaryDirectory() as directory:
+        results = benchmark(
+            arguments.python, arguments.scenarios, arguments.repeat, directory
+        )
+    print_results(results)
+
+    report = {
+        "version": utils.VERSION,
+        "python": platform.python_version(),
+        "pycparser": get_pycparser_version(arguments.python),
+        "results": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if arguments.baseline:
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)
+        if compare_with_baseline(results, baseline, arguments.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Generates synthetic C programs with tail calls for benchmarking the tail call
+elimination.
+
+The functions of a program are split into cycles of mutually recursive
+functions. Each function tail calls the next function of its cycle at the end
+of its body and can tail call other functions of its cycle from inside a tower
+of nested if, while and for statements. Every call decreases the first
+argument, so running the program always terminates. With mixed types, each
+function takes a third parameter of one of MIXED_PARAMETER_TYPES, so that the
+call structs of a cycle have different layouts.
+"""
+
+import argparse
+
+NESTING_STATEMENTS = ("if", "while", "for")
+MIXED_PARAMETER_TYPES = ("long", "char", "double", "short")
+
+
+def function_name(index):
+    return f"f{index}"
+
+
+def generate_statements(count, indent):
+    """Generates straight-line arithmetic on the locals of a function."""
+    lines = []
+    for i in range(count):
+        lines.append(
+            f"{indent}local{i % 4} = local{(i + 1) % 4} * {i % 7 + 2} "
+            f"+ (n ^ {i});"
+        )
+    return lines
+
+
+def generate_parameters(index, mixed_types):
+    if not mixed_types:
+        return "int n, int acc"
+    parameter_type = MIXED_PARAMETER_TYPES[index % len(MIXED_PARAMETER_TYPES)]
+    return f"int n, int acc, {parameter_type} extra"
+
+
+def generate_tail_call(callee, increment, indent, mixed_types=False):
+    arguments = f"n - 1, acc + {increment}"
+    if mixed_types:
+        arguments += ", n % 100"
+    return f"{indent}return {function_name(callee)}({arguments});"
+
+
+def generate_nested_tower(
+    callees, body_size, depth, indent, mixed_types=False
+):
+    """
+    Generates depth nested statements. The statements of the body are spread
+    over the levels and the tail calls are put at evenly spaced levels, so
+    that the rewriting has to go through the whole tower to reach them.
+    """
+    statements_per_level = max(1, body_size // max(depth, 1))
+    call_levels = {
+        (depth * (i + 1)) // (len(callees) + 1): callee
+        for i, callee in enumerate(callees)
+    }
+    return generate_nesting_level(
+        0, depth, call_levels, statements_per_level, indent, mixed_types
+    )
+
+
+def generate_nesting_level(
+    level, depth, call_levels, statements_per_level, indent, mixed_types
+):
+    if level == depth:
+        return []
+    kind = NESTING_STATEMENTS[level % len(NESTING_STATEMENTS)]
+    inner_indent = indent + "  "
+    if kind == "if":
+        lines = [f"{indent}if ((n + {level}) % 3 == 0) {{"]
+    elif kind == "while":
+        lines = [
+            f"{indent}int w{level} = 2;",
+            f"{indent}while (w{level} > 0) {{",
+        ]
+    else:
+        lines = [
+            f"{indent}for (int i{level} = 0; i{level} < 2; i{level}++) {{"
+        ]
+    lines.extend(generate_statements(statements_per_level, inner_indent))
+    if level in call_levels:
+        lines.append(f"{inner_indent}if (local{level % 4} % 5 == 1) {{")
+        lines.append(
+            generate_tail_call(
+                call_levels[level], level, inner_indent + "  ", mixed_types
+            )
+        )
+        lines.append(f"{inner_indent}}}")
+    lines.extend(
+        generate_nesting_level(
+            level + 1,
+            depth,
+            call_levels,
+            statements_per_level,
+            inner_indent,
+            mixed_types,
+        )
+    )
+    if kind == "while":
+        lines.append(f"{inner_indent}w{level}--;")
+    lines.append(f"{indent}}}")
+    return lines
+
+
+def generate_function(
+    index, cycle, body_size, depth, tail_calls, mixed_types=False
+):
+    """
+    Generates a function of the given cycle. The first tail call goes to the
+    next function of the cycle, the rest go to other members of the cycle.
+    With mixed types, the third parameter is added to the result.
+    """
+    position = cycle.index(index)
+    callees = [
+        cycle[(position + i + 1) % len(cycle)] for i in range(tail_calls)
+    ]
+    lines = [
+        f"int {function_name(index)}"
+        f"({generate_parameters(index, mixed_types)}) {{",
+        "  unsigned local0 = n, local1 = acc, local2 = 1, local3 = 2;",
+        "  if (n <= 0) {",
+        "    return acc;",
+        "  }",
+    ]
+    if mixed_types:
+        lines.append("  acc += (int) extra % 10;")
+    lines.extend(generate_statements(body_size, "  "))
+    lines.extend(
+        generate_nested_tower(callees[1:], body_size, depth, "  ", mixed_types)
+    )
+    lines.append(
+        "  acc = (acc + (int) ((local0 ^ local1 ^ local2) % 1000)) % 1000;"
+    )
+    lines.append(generate_tail_call(callees[0], index, "  ", mixed_types))
+    lines.append("}")
+    return lines
+
+
+def generate_program(
+    functions=10,
+    body_size=10,
+    depth=3,
+    cycle_size=2,
+    tail_calls=2,
+    recursion_depth=1000,
+    calls=1,
+    mixed_types=False,
+):
+    """
+    Generates a C program with the given number of functions split into
+    cycles of cycle_size mutually recursive functions. Each function has
+    body_size arithmetic statements at the top and inside a tower of depth
+    nested statements, and tail_calls tail calls to functions of its cycle.
+    The main function starts every cycle with the given recursion depth and
+    prints the results. With more than one call, each cycle is started that
+    many times and the results are accumulated, so that the cost of entering
+    the cycles weighs as much as the cost of the tail calls inside them.
+    With mixed types, the functions take parameters of different types, see
+    MIXED_PARAMETER_TYPES.
+    """
+    cycle_size = max(1, min(cycle_size, functions))
+    tail_calls = max(1, tail_calls)
+    cycles = [
+        list(range(start, min(start + cycle_size, functions)))
+        for start in range(0, functions, cycle_size)
+    ]
+    lines = ["#include <stdio.h>", ""]
+    for cycle in cycles:
+        for index in cycle:
+            lines.append(
+                f"int {function_name(index)}"
+                f"({generate_parameters(index, mixed_types)});"
+            )
+    lines.append("")
+    for cycle in cycles:
+        for index in cycle:
+            lines.extend(
+                generate_function(
+                    index, cycle, body_size, depth, tail_calls, mixed_types
+                )
+            )
+            lines.append("")
+    lines.append("int main() {")
+    extra_argument = ", 0" if mixed_types else ""
+    for cycle in cycles:
+        if calls == 1:
+            lines.append(
+                f'  printf("%d\\n", {function_name(cycle[0])}'
+                f"({recursion_depth}, 0{extra_argument}));"
+            )
+            continue
+        lines.extend(
+            [
+                "  {",
+                "    int total = 0;",
+                f"    for (int call = 0; call < {calls}; call++) {{",
+                f"      total = (total + {function_name(cycle[0])}"
+                f"({recursion_depth}, call % 1000{extra_argument})) % 1000;",
+                "    }",
+                '    printf("%d\\n", total);',
+                "  }",
+            ]
+        )
+    lines.append("  return 0;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def add_program_arguments(parser):
+    """Adds the parameters of generate_program to an argument parser."""
+    parser.add_argument("--functions", type=int, default=10)
+    parser.add_argument("--body-size", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--cycle-size", type=int, default=2)
+    parser.add_argument("--tail-calls", type=int, default=2)
+    parser.add_argument("--recursion-depth", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=1)
+    parser.add_argument("--mixed-types", action="store_true")
+
+
+def generate_program_from_arguments(arguments):
+    return generate_program(
+        functions=arguments.functions,
+        body_size=arguments.body_size,
+        depth=arguments.depth,
+        cycle_size=arguments.cycle_size,
+        tail_calls=arguments.tail_calls,
+        recursion_depth=arguments.recursion_depth,
+        calls=arguments.calls,
+        mixed_types=arguments.mixed_types,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Prints a synthetic C program with tail calls."
+    )
+    add_program_arguments(parser)
+    print(generate_program_from_arguments(parser.parse_args()), end="")
@@ -28,12 +28,18 @@ struct foo_ios
   int y;
 };
 
+#include <stddef.h>
+/* union block_call: about 12 bytes, 1 cache line */
 union block_call
 {
   struct bar_ios bar;
   struct gar_ios gar;
   struct foo_ios foo;
 };
+_Static_assert((sizeof(union block_call)) <= 64, "union block_call does not fit in 64 bytes");
+_Static_assert(offsetof(struct bar_ios, result) == 0, "the result of struct bar_ios is not at its start");
+_Static_assert(offsetof(struct gar_ios, result) == 0, "the result of struct gar_ios is not at its start");
+_Static_assert(offsetof(struct foo_ios, result) == 0, "the result of struct foo_ios is not at its start");
 
 void block(int index, union block_call *frame)
 {
@@ -49,11 +55,8 @@ void block(int index, union block_call *frame)
       {
         frame->gar.y = 12;
         goto gar_LABEL;
-        break;
       }
 
-      frame->gar.y = 7 + x;
-      goto gar_LABEL;
     }
 
 
@@ -68,7 +71,6 @@ void block(int index, union block_call *frame)
     }
 
 
-    foo_LABEL:
     case foo_INDEX:
     {
       int x = frame->foo.x;
@@ -90,20 +92,8 @@ void block(int index, union block_call *frame)
         frame->bar.x = x / x;
         goto bar_LABEL;
       }
-      for (int i = 0; i < 10; i++)
-      {
-        if (i == 5)
-        {
-          frame->bar.x = 10 + (47 * 31);
-          goto bar_LABEL;
-        }
-      }
-
-      frame->bar.x = x * y;
-      goto bar_LABEL;
     }
 
-
   }
 
 }
@@ -0,0 +1,364 @@
+from block import Block
+from pycparser import c_ast
+from utils import GlobalParameters
+import profiling
+import utils
+
+# The associative operators a recursive call can be combined with, mapped to
+# their identity elements, which the accumulator starts with
+ACCUMULATION_OPERATORS = {"+": "0", "*": "1", "&": "~0", "|": "0", "^": "0"}
+
+# The names of the integer types, for which the operators are associative
+INTEGER_TYPE_NAMES = {"char", "short", "int", "long", "signed", "unsigned"}
+
+
+def introduce_accumulators(ast, func_def_map):
+    """
+    Rewrites the functions of func_def_map whose recursive calls are only
+    combined with their results by an associative operator into tail
+    recursive functions with an accumulator. For example:
+        int fact(int n) {
+            if (n <= 1) return 1;
+            return n * fact(n - 1);
+        }
+    becomes:
+        static int fact_ACC(int n, int accumulator_ACC) {
+            if (n <= 1) return accumulator_ACC * 1;
+            return fact_ACC(n - 1, accumulator_ACC * n);
+        }
+        int fact(int n) {
+            return fact_ACC(n, 1);
+        }
+    The new function is added to the AST right before the function and to
+    func_def_map, so that its tail calls are eliminated like any other.
+    Only functions returning integers are rewritten, as the operators are
+    not associative for floating point numbers. The intermediate results are
+    computed in a different order, so a signed result that overflows can
+    differ. Returns the names of the rewritten functions.
+    """
+    declarations, typedefs, _ = utils.collect_file_scope_types(ast)
+    rewritten_functions = []
+    for function_name, function_definition in list(func_def_map.items()):
+        accumulator_function_name = get_accumulator_function_name(
+            function_name
+        )
+        if (
+            accumulator_function_name in func_def_map
+            or accumulator_function_name in declarations
+            or not returns_integer(function_definition, typedefs)
+        ):
+            continue
+        operator = find_accumulation_operator(function_definition)
+        if operator is None:
+            continue
+
+        accumulator_function = generate_accumulator_function(
+            function_definition, operator
+        )
+        ast.ext.insert(
+            ast.ext.index(function_definition), accumulator_function
+        )
+        func_def_map[accumulator_function_name] = accumulator_function
+        function_definition.body = generate_accumulator_call(
+            function_definition, operator
+        )
+        rewritten_functions.append(function_name)
+    profiling.count("accumulated_functions", len(rewritten_functions))
+    return rewritten_functions
+
+
+def remove_unused_accumulator_functions(ast, blocks, accumulated_functions):
+    """
+    Removes the accumulator functions of the accumulated_functions that are
+    in the same block as their function from the AST. They are only called
+    by their function and by themselves, so once these tail calls jump to
+    them in the block function, their static wrappers are never called and
+    the compilers would warn that they are unused. Their prototypes are not
+    written either, as their function infos are marked as having no wrapper.
+    """
+    for block in blocks:
+        for function_name in accumulated_functions:
+            function_info = block.involved_functions.get(
+                get_accumulator_function_name(function_name)
+            )
+            if (
+                function_info is None
+                or function_name not in block.involved_functions
+            ):
+                continue
+            ast.ext.remove(function_info.function_definition)
+            function_info.has_wrapper = False
+            profiling.count("removed_accumulator_functions")
+
+
+def get_accumulator_function_name(function_name):
+    return f"{function_name}_ACC"
+
+
+def returns_integer(function_definition, typedefs):
+    """
+    Checks whether the function returns an integer and has a prototype, as
+    its parameters are needed to add the accumulator to them.
+    """
+    if function_definition.param_decls:
+        return False
+    return_type = utils.resolve_typedefs(
+        function_definition.decl.type.type, typedefs
+    )
+    return (
+        isinstance(return_type, c_ast.TypeDecl)
+        and isinstance(return_type.type, c_ast.IdentifierType)
+        and set(return_type.type.names) <= INTEGER_TYPE_NAMES
+    )
+
+
+def find_accumulation_operator(function_definition):
+    """
+    Returns the operator the recursive calls of the function are combined
+    with, if every one of them is returned either as it is or combined with
+    the other operands by the same associative operator, like in
+    return n * fact(n - 1) or return x + (y + sum(rest)). The other operands
+    must not call the function. Returns None otherwise, or if the function
+    is already tail recursive.
+    """
+    function_name = function_definition.decl.name
+    recursive_calls = find_recursive_calls(
+        function_definition.body, function_name
+    )
+    if not recursive_calls:
+        return None
+
+    operators = set()
+    returned_calls = []
+    for return_stmt in find_return_statements(function_definition.body):
+        if not collect_accumulated_calls(
+            return_stmt.expr, function_name, operators, returned_calls
+        ):
+            return None
+    if len(operators) != 1 or len(returned_calls) != len(recursive_calls):
+        return None
+    return operators.pop()
+
+
+def find_recursive_calls(node, function_name):
+    """Finds the calls to the function by name inside the node."""
+    calls = []
+    nodes = [node] if node is not None else []
+    while nodes:
+        current = nodes.pop()
+        if is_recursive_call(current, function_name):
+            calls.append(current)
+        nodes.extend(child for _, child in current.children())
+    return calls
+
+
+def is_recursive_call(node, function_name):
+    return (
+        isinstance(node, c_ast.FuncCall)
+        and isinstance(node.name, c_ast.ID)
+        and node.name.name == function_name
+    )
+
+
+def find_return_statements(node):
+    """Finds the return statements inside the body of a function."""
+    returns = []
+    nodes = [node]
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.Return):
+            returns.append(current)
+        else:
+            nodes.extend(child for _, child in current.children())
+    return returns
+
+
+def collect_accumulated_calls(expr, function_name, operators, calls):
+    """
+    Checks whether the recursive calls inside the returned expression can
+    be accumulated. The calls are added to calls and the operators they are
+    combined with to operators.
+    """
+    if expr is None or not find_recursive_calls(expr, function_name):
+        return True
+    if is_recursive_call(expr, function_name):
+        if find_recursive_calls(expr.args, function_name):
+            return False
+        calls.append(expr)
+        return True
+    if isinstance(expr, c_ast.TernaryOp):
+        return (
+            not find_recursive_calls(expr.cond, function_name)
+            and collect_accumulated_calls(
+                expr.iftrue, function_name, operators, calls
+            )
+            and collect_accumulated_calls(
+                expr.iffalse, function_name, operators, calls
+            )
+        )
+    if isinstance(expr, c_ast.ExprList):
+        return not any(
+            find_recursive_calls(operand, function_name)
+            for operand in expr.exprs[:-1]
+        ) and collect_accumulated_calls(
+            expr.exprs[-1], function_name, operators, calls
+        )
+    if isinstance(expr, c_ast.BinaryOp) and expr.op in ACCUMULATION_OPERATORS:
+        recursive_operand, other_operand = split_operands(expr, function_name)
+        if find_recursive_calls(other_operand, function_name):
+            return False
+        operators.add(expr.op)
+        return collect_accumulated_calls(
+            recursive_operand, function_name, operators, calls
+        )
+    return False
+
+
+def split_operands(expr, function_name):
+    """
+    Returns the operand of the binary operation that calls the function,
+    followed by the other one.
+    """
+    if find_recursive_calls(expr.left, function_name):
+        return expr.left, expr.right
+    return expr.right, expr.left
+
+
+def accumulate_expression(expr, function_name, operator, accumulator):
+    """
+    Returns the expression that evaluates to the given expression combined
+    with the accumulator, where the recursive calls are replaced by tail
+    calls to the accumulator function. As the operator is associative and
+    commutative, accumulator op (x op fact(n)) is the same as
+    fact_ACC(n, accumulator op x).
+    """
+    if not find_recursive_calls(expr, function_name):
+        return c_ast.BinaryOp(operator, accumulator, expr, expr.coord)
+    if is_recursive_call(expr, function_name):
+        args = expr.args.exprs if expr.args is not None else []
+        return c_ast.FuncCall(
+            c_ast.ID(get_accumulator_function_name(function_name)),
+            c_ast.ExprList([*args, accumulator]),
+            expr.coord,
+        )
+    if isinstance(expr, c_ast.TernaryOp):
+        return c_ast.TernaryOp(
+            expr.cond,
+            accumulate_expression(
+                expr.iftrue, function_name, operator, accumulator
+            ),
+            accumulate_expression(
+                expr.iffalse, function_name, operator, accumulator
+            ),
+            expr.coord,
+        )
+    if isinstance(expr, c_ast.ExprList):
+        return c_ast.ExprList(
+            [
+                *expr.exprs[:-1],
+                accumulate_expression(
+                    expr.exprs[-1], function_name, operator, accumulator
+                ),
+            ],
+            expr.coord,
+        )
+    recursive_operand, other_operand = split_operands(expr, function_name)
+    return accumulate_expression(
+        recursive_operand,
+        function_name,
+        operator,
+        c_ast.BinaryOp(operator, accumulator, other_operand, expr.coord),
+    )
+
+
+def generate_accumulator_function(function_definition, operator):
+    """
+    Generates the tail recursive version of the function, which takes the
+    accumulator as its last parameter and combines it with the values it
+    returns.
+    """
+    function_name = function_definition.decl.name
+    accumulator_function_name = get_accumulator_function_name(function_name)
+    function_type = function_definition.decl.type
+    accumulator_param = utils.generate_param_variable(
+        c_ast.Decl(None, [], [], [], [], function_type.type, None, None),
+        GlobalParameters.accumulator_name,
+    )
+    declaration_type = c_ast.FuncDecl(
+        c_ast.ParamList(
+            [
+                *utils.get_function_params(function_definition),
+                accumulator_param,
+            ]
+        ),
+        utils.rename_declaration_type(
+            function_type.type, accumulator_function_name
+        ),
+    )
+    declaration = c_ast.Decl(
+        accumulator_function_name,
+        [],
+        [],
+        ["static"],
+        [],
+        declaration_type,
+        None,
+        None,
+    )
+    body = c_ast.Compound(
+        Block.traverse(
+            function_definition.body.block_items or [],
+            lambda return_stmt: [
+                accumulate_return(return_stmt, function_name, operator)
+            ],
+        ),
+        function_definition.body.coord,
+    )
+    return c_ast.FuncDef(declaration, None, body, function_definition.coord)
+
+
+def accumulate_return(return_stmt, function_name, operator):
+    """Rewrites a return statement of the accumulator function."""
+    if return_stmt.expr is None:
+        return return_stmt
+    return c_ast.Return(
+        accumulate_expression(
+            return_stmt.expr,
+            function_name,
+            operator,
+            c_ast.ID(GlobalParameters.accumulator_name),
+        ),
+        return_stmt.coord,
+    )
+
+
+def generate_identity_element(operator):
+    value = ACCUMULATION_OPERATORS[operator]
+    if value.startswith("~"):
+        return c_ast.UnaryOp("~", c_ast.Constant("int", value[1:]))
+    return c_ast.Constant("int", value)
+
+
+def generate_accumulator_call(function_definition, operator):
+    """
+    Generates the new body of the function, which calls the accumulator
+    function with the identity element of the operator as the accumulator.
+    """
+    function_name = function_definition.decl.name
+    args = [
+        c_ast.ID(param.name)
+        for param in utils.get_function_params(function_definition)
+    ]
+    return c_ast.Compound(
+        [
+            c_ast.Return(
+                c_ast.FuncCall(
+                    c_ast.ID(get_accumulator_function_name(function_name)),
+                    c_ast.ExprList(
+                        [*args, generate_identity_element(operator)]
+                    ),
+                )
+            )
+        ],
+        function_definition.body.coord,
+    )
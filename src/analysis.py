@@ -0,0 +1,252 @@
+from pycparser import c_ast
+import json
+import accumulator
+import frame_layout
+import prelude
+import utils
+
+# The return address and the saved frame pointer, which every frame holds
+FRAME_OVERHEAD = 2 * frame_layout.POINTER_SIZE
+# The alignment of the stack pointer at calls on x86-64 and AArch64
+STACK_ALIGNMENT = 16
+
+
+def analyze_source(source, options=None, filename="<source>"):
+    """
+    Analyzes the tail calls of the source code without changing it, see
+    analyze. The directives are handled the same way main.transform_source
+    handles them.
+    """
+    options = options or utils.TransformOptions()
+    line_numbers = []
+    directives, code = utils.split_directives(
+        source.splitlines(keepends=True), line_numbers
+    )
+    file_scope = None
+    if options.preprocessor is not None:
+        file_scope = prelude.load_file_scope(
+            directives, options.preprocessor, filename
+        )
+    ast = utils.parse("".join(code), filename, file_scope)
+    return analyze(ast, options, filename, line_numbers)
+
+
+def analyze(ast, options, filename="<source>", line_numbers=None):
+    """
+    Finds what the tail call elimination would do to the functions of the
+    AST with the given options, and returns it as a report that can be saved
+    as JSON:
+        functions: the line and the estimated frame size of each function,
+            see estimate_frame_size.
+        tail_call_graph: the names of the functions each function tail
+            calls, as returned by utils.build_tail_call_graph.
+        recursion_cycles: the recursion cycles of the tail call graph.
+        blocks: the block functions, with the functions merged into each of
+            them, as given by utils.BlockInfo.to_dict.
+        loop_functions: the functions that would be rewritten into loops.
+        tail_calls: every call in tail position, as given by
+            utils.generate_tail_call_records, with the reason it cannot be
+            eliminated, if any, and the bytes of stack it saves each time it
+            runs once eliminated, which is the frame of its caller that is no
+            longer kept while the callee runs.
+        summary: the number of calls in tail position, of eliminated calls
+            and of the others.
+    The same steps as main.eliminate_tail_calls decide which calls are
+    eliminated, so the report matches the result of the transformation.
+    The AST is changed only by the accumulation, if enabled, and the call
+    structs are laid out to estimate the sizes of the unions.
+    """
+    func_def_map = utils.get_functions_def_map(ast)
+    if options.accumulate:
+        accumulator.introduce_accumulators(ast, func_def_map)
+    resolved_tail_calls = utils.resolve_indirect_tail_calls(ast, func_def_map)
+    graph = utils.build_tail_call_graph(func_def_map, resolved_tail_calls)
+    blocks, loop_functions = utils.partition_involved_functions(
+        ast, func_def_map, options
+    )
+    declarations, typedefs, structs = utils.collect_file_scope_types(ast)
+    tail_calls = utils.generate_tail_call_records(
+        utils.classify_tail_calls(
+            func_def_map,
+            blocks,
+            loop_functions,
+            declarations,
+            resolved_tail_calls,
+        ),
+        line_numbers,
+    )
+
+    for block in blocks:
+        frame_layout.layout_block(block, typedefs, structs)
+    functions = dict()
+    for function_name, function_definition in func_def_map.items():
+        line = function_definition.coord.line
+        if line_numbers:
+            line = line_numbers[line - 1]
+        functions[function_name] = {
+            "line": line,
+            "frame_size": estimate_frame_size(
+                function_definition, typedefs, structs
+            ),
+        }
+    for tail_call in tail_calls:
+        tail_call["stack_saved"] = (
+            functions[tail_call["function_name"]]["frame_size"]
+            if tail_call["reason"] is None
+            else 0
+        )
+
+    eliminated = sum(
+        1 for tail_call in tail_calls if tail_call["reason"] is None
+    )
+    return {
+        "file": filename,
+        "options": options.to_dict(),
+        "functions": functions,
+        "tail_call_graph": graph,
+        "recursion_cycles": utils.find_recursion_cycles(graph),
+        "blocks": [block.to_dict() for block in blocks],
+        "loop_functions": [
+            function_definition.decl.name
+            for function_definition in loop_functions
+        ],
+        "tail_calls": tail_calls,
+        "summary": {
+            "tail_calls": len(tail_calls),
+            "eliminated": eliminated,
+            "not_eliminated": len(tail_calls) - eliminated,
+        },
+    }
+
+
+def estimate_frame_size(function_definition, typedefs, structs):
+    """
+    Estimates the size of the stack frame of a function in bytes: its
+    parameters and the local variables of its body, each aligned as its
+    type requires, along with FRAME_OVERHEAD, rounded up to STACK_ALIGNMENT.
+    This is the frame of the function compiled without optimizations, where
+    each of them has a slot of its own. With optimizations, many are kept in
+    registers instead, and the locals of different scopes can share slots,
+    so the frame is often smaller. Returns None if the size of one of them
+    is unknown, like for the types of headers that are not parsed or for
+    variable length arrays.
+    """
+    declarations = [
+        utils.generate_param_variable(param, param.name)
+        for param in utils.get_function_params(function_definition)
+    ]
+    declarations.extend(function_definition.param_decls or [])
+    declarations.extend(find_local_variables(function_definition.body))
+
+    size = FRAME_OVERHEAD
+    for declaration in declarations:
+        declaration_size = frame_layout.estimate_type_size(
+            declaration.type, typedefs, structs
+        )
+        if declaration_size is None:
+            return None
+        size = (
+            frame_layout.align_offset(size, declaration_size[1])
+            + declaration_size[0]
+        )
+    return frame_layout.align_offset(size, STACK_ALIGNMENT)
+
+
+def find_local_variables(body):
+    """
+    Finds the declarations of the variables of the body of a function that
+    live on its stack, in every scope of it. The static and extern variables
+    and the declarations of functions and types are left out.
+    """
+    variables = []
+    nodes = [body]
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.Decl):
+            if (
+                current.name is not None
+                and not isinstance(current.type, c_ast.FuncDecl)
+                and "static" not in current.storage
+                and "extern" not in current.storage
+            ):
+                variables.append(current)
+            continue
+        if isinstance(current, c_ast.Typedef):
+            continue
+        nodes.extend(child for _, child in reversed(current.children()))
+    return variables
+
+
+def generate_dot(report):
+    """
+    Generates the tail call graph of the report in the DOT language of
+    Graphviz, with the functions that tail call or are tail called. The
+    functions merged into the same block function are grouped in a cluster,
+    and the functions rewritten into loops are boxes. Each function is
+    labeled with its estimated frame size. The eliminated tail calls are
+    solid edges, and the others are dashed edges labeled with the reason
+    they are not eliminated, including the calls of functions that are not
+    defined in the file. Each call through a function pointer is an edge to
+    a node of its own, with dotted edges to the functions it can call.
+    """
+    functions = report["functions"]
+    edges = dict()
+    for tail_call in report["tail_calls"]:
+        callee_name = tail_call["callee_name"]
+        if tail_call["candidates"] is not None:
+            pointer_name = callee_name or "function pointer"
+            callee_name = (
+                f"{tail_call['function_name']}: {pointer_name} "
+                f"(line {tail_call['line']})"
+            )
+            for candidate in tail_call["candidates"]:
+                edges.setdefault((callee_name, candidate), "dotted")
+        edges.setdefault(
+            (tail_call["function_name"], callee_name), tail_call["reason"]
+        )
+
+    lines = [f"digraph {quote_dot(report['file'])} {{"]
+    for index, block in enumerate(report["blocks"]):
+        lines.append(f"  subgraph cluster_{index} {{")
+        lines.append(f"    label={quote_dot(block['name'])};")
+        for function_name in block["functions"]:
+            lines.append(f"    {quote_dot(function_name)};")
+        lines.append("  }")
+    names = list(dict.fromkeys(name for edge in edges for name in edge))
+    for name in names:
+        if name not in functions:
+            lines.append(f"  {quote_dot(name)} [shape=plaintext];")
+            continue
+        frame_size = functions[name]["frame_size"]
+        size = f"{frame_size} B" if frame_size is not None else "? B"
+        shape = "box" if name in report["loop_functions"] else "ellipse"
+        label = quote_dot(f"{name}\n{size}")
+        lines.append(f"  {quote_dot(name)} [label={label}, shape={shape}];")
+    for (caller_name, callee_name), reason in edges.items():
+        attributes = ""
+        if reason == "dotted":
+            attributes = " [style=dotted]"
+        elif reason is not None:
+            attributes = f" [style=dashed, label={quote_dot(reason)}]"
+        lines.append(
+            f"  {quote_dot(caller_name)} -> {quote_dot(callee_name)}"
+            f"{attributes};"
+        )
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def quote_dot(text):
+    """Quotes the text as a string of the DOT language."""
+    return json.dumps(text, ensure_ascii=False)
+
+
+def write_report(stream, report, format="json"):
+    """
+    Writes the report to the stream, as a JSON line or as a DOT graph, so
+    that the reports of several files can be written to the same stream.
+    """
+    if format == "dot":
+        stream.write(generate_dot(report))
+    else:
+        stream.write(json.dumps(report) + "\n")
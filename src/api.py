@@ -0,0 +1,150 @@
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import threading
+import batch
+import main
+import utils
+
+# The pool of worker processes shared by every call of transform_async in
+# this process, created on the first call that does not give its own
+shared_executor = None
+shared_executor_lock = threading.Lock()
+
+
+class TransformResult:
+    """
+    A class used to store the outcome of the tail call elimination of a
+    source code:
+        output: the resulting source code.
+        blocks: a dictionary per block function, with its name, the name of
+            its union, the index of each function merged into it and the
+            estimated layout of its union, as given by
+            utils.BlockInfo.to_dict.
+        loop_functions: the names of the functions that only tail call
+            themselves and were rewritten into loops.
+        tail_calls: a dictionary per call in tail position, as given by
+            utils.TailCall.to_dict, with the line of the call in the source
+            and the reason it was not eliminated, which is None if it was.
+    It only holds plain data, so that it can be sent back from a worker
+    process.
+    """
+
+    def __init__(self, filename="<source>", output=None):
+        self.filename = filename
+        self.output = output
+        self.blocks = []
+        self.loop_functions = []
+        self.tail_calls = []
+
+    @property
+    def diagnostics(self):
+        """The calls in tail position that could not be eliminated."""
+        return [
+            tail_call
+            for tail_call in self.tail_calls
+            if tail_call["reason"] is not None
+        ]
+
+    @property
+    def involved_functions(self):
+        """Maps the functions merged into block functions to their indices."""
+        return {
+            function_name: index
+            for block in self.blocks
+            for function_name, index in block["functions"].items()
+        }
+
+    def record(self, blocks, tail_calls, line_numbers=None):
+        """
+        Records the blocks returned by main.eliminate_tail_calls and the tail
+        calls it found. The line numbers of the parsed code, as filled in by
+        utils.split_directives, map the lines of the calls back to the lines
+        of the source.
+        """
+        self.blocks = [block.to_dict() for block in blocks]
+        self.tail_calls = utils.generate_tail_call_records(
+            tail_calls, line_numbers
+        )
+        # A self tail call that is eliminated outside of a block function
+        # was turned into a jump back to the top of a loop function
+        involved_functions = self.involved_functions
+        self.loop_functions = sorted(
+            {
+                tail_call["function_name"]
+                for tail_call in self.tail_calls
+                if tail_call["reason"] is None
+                and tail_call["callee_name"] == tail_call["function_name"]
+                and tail_call["function_name"] not in involved_functions
+            }
+        )
+
+    def to_dict(self):
+        return {**vars(self), "diagnostics": self.diagnostics}
+
+
+def transform(source, options=None, filename="<source>"):
+    """
+    Removes the tail calls of the source code with the given
+    utils.TransformOptions and returns a TransformResult. The filename is
+    only used in the errors of the parser and to find the headers when the
+    directives are preprocessed. Errors, like the
+    pycparser.c_parser.ParseError of code that cannot be parsed, are raised
+    to the caller. For example:
+        result = api.transform(source, utils.TransformOptions("scc"))
+        print(result.output, result.diagnostics)
+    """
+    result = TransformResult(filename)
+    result.output = main.transform_source(
+        source, options, filename=filename, result=result
+    )
+    return result
+
+
+def get_shared_executor(jobs=None):
+    """
+    Returns the pool of worker processes shared by the calls of
+    transform_async, which is created on the first call with jobs workers,
+    one per available core by default. Each worker creates the parser once,
+    before its first transformation.
+    """
+    global shared_executor
+    with shared_executor_lock:
+        if shared_executor is None:
+            shared_executor = ProcessPoolExecutor(
+                max_workers=jobs or batch.available_cores(),
+                initializer=batch.warm_up_worker,
+            )
+        return shared_executor
+
+
+def shutdown_shared_executor():
+    """
+    Stops the worker processes of the shared pool, if it was created. The
+    next call of transform_async creates it again.
+    """
+    global shared_executor
+    with shared_executor_lock:
+        if shared_executor is not None:
+            shared_executor.shutdown()
+            shared_executor = None
+
+
+async def transform_async(
+    source, options=None, filename="<source>", executor=None
+):
+    """
+    Like transform, but the work is done by a worker process of the given
+    executor, or of the pool returned by get_shared_executor, so that the
+    event loop is not blocked and many sources can be awaited concurrently:
+        results = await asyncio.gather(
+            *(api.transform_async(source) for source in sources)
+        )
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or get_shared_executor(),
+        transform,
+        source,
+        options,
+        filename,
+    )
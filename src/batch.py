@@ -0,0 +1,163 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import glob
+import os
+import main
+import utils
+
+
+class BatchResult:
+    """
+    A class used to store the outcome of the tail call elimination of a single
+    file in batch mode.
+    """
+
+    def __init__(self, filename, error=None):
+        self.filename = filename
+        self.error = error
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+
+def is_source_file(filename):
+    """
+    Checks whether the given file is a C source file that should be converted.
+    The files generated by this program itself (the "_removed" results and the
+    "_temp" files) are skipped so that running the batch mode twice over the
+    same tree does not convert its own outputs.
+    """
+    return (
+        filename.endswith(".c")
+        and not filename.endswith("_removed.c")
+        and not filename.endswith("_temp.c")
+    )
+
+
+def collect_source_files(inputs):
+    """
+    Expands the given inputs into the list of C source files to be converted.
+    Each input can be a file, a directory, which is searched recursively, or a
+    glob pattern. Returns the sorted list of files and the list of inputs that
+    did not match anything.
+    """
+    filenames, missing_inputs = set(), []
+    for path in inputs:
+        if os.path.isdir(path):
+            for directory, _, files in os.walk(path):
+                for file in files:
+                    if is_source_file(file):
+                        filenames.add(os.path.join(directory, file))
+        elif os.path.isfile(path):
+            filenames.add(path)
+        else:
+            matches = [
+                match
+                for match in glob.glob(path, recursive=True)
+                if os.path.isfile(match) and is_source_file(match)
+            ]
+            if not matches:
+                missing_inputs.append(path)
+            filenames.update(matches)
+    return sorted(filenames), missing_inputs
+
+
+def available_cores():
+    """
+    Returns the number of cores this process is allowed to run on, which can
+    be fewer than the number of cores of the machine.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def warm_up_worker():
+    """
+    Prepares a worker process of a pool that serves requests, like the ones
+    of the daemon, before the first of them, so that no request pays for
+    creating the parser or for loading the modules that main.py imports once
+    they are needed.
+    """
+    import block  # noqa: F401
+    import frame_layout  # noqa: F401
+    import new_functions  # noqa: F401
+
+    utils.get_parser()
+
+
+def transform_file(
+    filename, options=None, cache=None, profile=None, report=None
+):
+    """
+    Removes the tail calls of a single file inside a worker process. Errors
+    are caught and reported in the result so that one broken file does not
+    stop the conversion of the rest of the batch.
+    """
+    try:
+        main.remove_tail_calls(
+            filename,
+            options=options,
+            cache=cache,
+            profile=profile,
+            report=report,
+        )
+    except Exception as error:
+        return BatchResult(filename, f"{type(error).__name__}: {error}")
+    return BatchResult(filename)
+
+
+def transform_files(
+    filenames, jobs=None, options=None, cache=None, profile=None, report=None
+):
+    """
+    Removes the tail calls of all the given files using a pool of worker
+    processes, one per available core by default. Each worker imports
+    Pycparser once and then converts many files, so the interpreter startup and
+    the parser setup are not paid per file. Yields a BatchResult per file in
+    the order of the given filenames.
+    """
+    jobs = jobs or available_cores()
+    if jobs == 1 or len(filenames) == 1:
+        for filename in filenames:
+            yield transform_file(
+                filename,
+                options=options,
+                cache=cache,
+                profile=profile,
+                report=report,
+            )
+        return
+
+    jobs = min(jobs, len(filenames))
+    chunksize = max(1, len(filenames) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(
+            partial(
+                transform_file,
+                options=options,
+                cache=cache,
+                profile=profile,
+                report=report,
+            ),
+            filenames,
+            chunksize=chunksize,
+        )
+
+
+def report_results(results):
+    """
+    Prints the outcome of each file as it finishes and a summary at the end.
+    Returns the number of files that failed.
+    """
+    succeeded, failed = 0, 0
+    for result in results:
+        if result.succeeded:
+            succeeded += 1
+            print(f"OK      {result.filename}")
+        else:
+            failed += 1
+            print(f"FAILED  {result.filename}: {result.error}")
+    print(f"{succeeded} file(s) converted, {failed} file(s) failed.")
+    return failed
@@ -1,6 +1,7 @@
 from utils import GlobalParameters
 from pycparser import c_ast
-from copy import deepcopy
+import dead_code
+import profiling
 import utils
 
 
@@ -16,7 +17,9 @@ class Block:
     """
 
     @staticmethod
-    def generate_block_call_union(involved_functions):
+    def generate_block_call_union(
+        involved_functions, name=GlobalParameters.block_call_union_name
+    ):
         """
         This function generates the union that contains all the involved
         function's call structs. For example if the involved functions are foo
@@ -27,7 +30,6 @@ class Block:
               struct foo_ios foo;
             };
         """
-        name = GlobalParameters.block_call_union_name
         decls = []
         for function in involved_functions:
             function_call_struct = involved_functions[function].call_struct
@@ -61,7 +63,9 @@ class Block:
         return declaration
 
     @staticmethod
-    def generate_block_function_union_arg():
+    def generate_block_function_union_arg(
+        union_name=GlobalParameters.block_call_union_name,
+    ):
         """
         In the block function declaration, the second parameters is the union
         block_call. In order to make the code cleaner, the logic for generating
@@ -72,9 +76,7 @@ class Block:
         This function generates the second argument which is
         'union block_call *frame'
         """
-        pointer_union_type = c_ast.Union(
-            GlobalParameters.block_call_union_name, None
-        )
+        pointer_union_type = c_ast.Union(union_name, None)
         pointer_type = c_ast.TypeDecl(
             GlobalParameters.block_call_union_instance_name,
             [],
@@ -95,14 +97,17 @@ class Block:
         return declaration
 
     @staticmethod
-    def generate_block_function_declaration():
+    def generate_block_function_declaration(
+        block_name=GlobalParameters.block_name,
+        union_name=GlobalParameters.block_call_union_name,
+    ):
         """
         Generates the declaration of the block function. For instance, it can
         be like this:
             void block(int index, union block_call *frame)
         """
         return_type = c_ast.TypeDecl(
-            GlobalParameters.block_name,
+            block_name,
             [],
             None,
             c_ast.IdentifierType(["void"]),
@@ -110,12 +115,12 @@ class Block:
         args = c_ast.ParamList(
             [
                 Block.generate_block_function_index_arg(),
-                Block.generate_block_function_union_arg(),
+                Block.generate_block_function_union_arg(union_name),
             ]
         )
         declaration_type = c_ast.FuncDecl(args, return_type)
         function_declaration = c_ast.Decl(
-            GlobalParameters.block_name,
+            block_name,
             [],
             [],
             [],
@@ -139,23 +144,47 @@ class Block:
         values as its parameters
         """
         assignments = []
-        function_params = (
-            function_info.function_definition.decl.type.args.params
+        function_params = utils.get_function_params(
+            function_info.function_definition
         )
         function_name = function_info.function_definition.decl.name
         for param in function_params:
-            param_clone = deepcopy(param)
-            param_clone.init = utils.generate_2d_struct_ref(
-                GlobalParameters.block_call_union_instance_name,
-                function_name,
+            param_assignment = utils.generate_param_variable(
+                param,
                 param.name,
-                inner_ptr=True,
+                utils.generate_2d_struct_ref(
+                    GlobalParameters.block_call_union_instance_name,
+                    function_name,
+                    param.name,
+                    inner_ptr=True,
+                ),
             )
-            assignments.append(param_clone)
+            assignments.append(param_assignment)
         return assignments
 
     @staticmethod
-    def convert_return_in_block(function_name, return_expr, func_def_map):
+    def is_tail_call_in_block(function_name, return_expr, involved_functions):
+        """
+        Checks whether the return statement tail calls a function that is
+        merged into the same block function and returns the same type as the
+        caller, see utils.returns_same_type, so that it can become a goto.
+        """
+        return (
+            isinstance(return_expr.expr, c_ast.FuncCall)
+            and isinstance(return_expr.expr.name, c_ast.ID)
+            and return_expr.expr.name.name in involved_functions
+            and utils.returns_same_type(
+                involved_functions[function_name].function_definition,
+                involved_functions[
+                    return_expr.expr.name.name
+                ].function_definition,
+            )
+        )
+
+    @staticmethod
+    def convert_return_in_block(
+        function_name, return_expr, involved_functions, frame_abi="copy"
+    ):
         """
         Converts the return statement of original function to the form it should
         have in block function.
@@ -169,44 +198,421 @@ class Block:
         it converts this into:
             frame->foo.result = 2;
             return;
+        Tail calls to functions that are not merged into the same block
+        function are converted like any other returned value, and tail calls
+        through function pointers are converted by
+        convert_indirect_return_in_block. With the direct frame ABI, the
+        arguments are assigned to the locals of the called function instead,
+        see generate_direct_jump_in_block.
         """
-        items = []
-        if isinstance(return_expr.expr, c_ast.FuncCall):
+        profiling.count("rewritten_returns")
+        indirect_tail_calls = involved_functions[
+            function_name
+        ].indirect_tail_calls
+        if Block.is_tail_call_in_block(
+            function_name, return_expr, involved_functions
+        ):
             called_function_name = return_expr.expr.name.name
-            function_params = func_def_map[
-                called_function_name
-            ].decl.type.args.params
-            args = return_expr.expr.args.exprs
-            for i, param in enumerate(function_params):
-                param_assignment = c_ast.Assignment(
-                    op="=",
-                    rvalue=args[i],
-                    lvalue=utils.generate_2d_struct_ref(
-                        GlobalParameters.block_call_union_instance_name,
-                        called_function_name,
-                        param.name,
-                        inner_ptr=True,
-                    ),
+            return Block.generate_jump_in_block(
+                function_name,
+                called_function_name,
+                return_expr.expr.args,
+                involved_functions,
+                frame_abi,
+            )
+        elif return_expr.expr in indirect_tail_calls:
+            return [
+                Block.convert_indirect_return_in_block(
+                    function_name,
+                    indirect_tail_calls[return_expr.expr],
+                    involved_functions,
+                    frame_abi,
                 )
-                items.append(param_assignment)
-            items.append(c_ast.Goto(f"{called_function_name}_LABEL"))
-        else:
-            return_assignment = c_ast.Assignment(
+            ]
+        return Block.generate_return_in_block(
+            function_name,
+            return_expr.expr,
+            involved_functions[function_name].returns_void,
+        )
+
+    @staticmethod
+    def generate_jump_in_block(
+        function_name,
+        called_function_name,
+        call_args,
+        involved_functions,
+        frame_abi="copy",
+    ):
+        """
+        Generates the statements that pass the arguments of a tail call to the
+        called function in the union of the block function and jump to it:
+            frame->foo.x = x;
+            goto foo_LABEL;
+        """
+        if frame_abi == "direct":
+            return Block.generate_direct_jump_in_block(
+                function_name,
+                called_function_name,
+                call_args,
+                involved_functions,
+            )
+        items = []
+        function_params = utils.get_function_params(
+            involved_functions[called_function_name].function_definition
+        )
+        args = call_args.exprs if call_args is not None else []
+        for i, param in enumerate(function_params):
+            param_assignment = c_ast.Assignment(
                 op="=",
-                rvalue=return_expr.expr,
+                rvalue=args[i],
                 lvalue=utils.generate_2d_struct_ref(
                     GlobalParameters.block_call_union_instance_name,
-                    function_name,
-                    GlobalParameters.function_return_val_name,
+                    called_function_name,
+                    param.name,
                     inner_ptr=True,
                 ),
             )
-            items.append(return_assignment)
-            items.append(c_ast.Return(None))
+            items.append(param_assignment)
+        items.append(c_ast.Goto(f"{called_function_name}_LABEL"))
         return items
 
     @staticmethod
-    def traverse(items, function_name, func_def_map):
+    def generate_direct_jump_in_block(
+        function_name, called_function_name, call_args, involved_functions
+    ):
+        """
+        Generates the statements that pass the arguments of a tail call to the
+        called function with the direct frame ABI, where its parameters are
+        locals of the block function, and jump past the copying of its
+        arguments out of the frame:
+            foo_x_PARAM = x;
+            goto foo_BODY;
+        The parameters of the caller are renamed to its own locals afterwards,
+        see generate_function_case_body_in_block. Only a self tail call can
+        read the locals it assigns, in which case the arguments are saved in
+        temporaries first when needed, as in convert_return_in_loop. A self
+        tail call that passes a parameter on as it is does not assign it,
+        unless the body declares another variable of the same name, which
+        the argument could be.
+        """
+        called_function_info = involved_functions[called_function_name]
+        params = utils.get_function_params(
+            called_function_info.function_definition
+        )
+        args = call_args.exprs if call_args is not None else []
+        unchanged_names = set()
+        if called_function_name == function_name:
+            unchanged_names = {
+                param.name for param in params
+            } - utils.find_declared_names(
+                called_function_info.function_definition.body
+            )
+        assignments = [
+            (param, arg)
+            for param, arg in zip(params, args)
+            if not (
+                isinstance(arg, c_ast.ID)
+                and arg.name == param.name
+                and arg.name in unchanged_names
+            )
+        ]
+        goto = c_ast.Goto(called_function_info.body_label)
+        if called_function_name != function_name or not (
+            Block.need_temporaries(
+                [(param.name, arg) for param, arg in assignments]
+            )
+        ):
+            return [
+                c_ast.Assignment(
+                    "=",
+                    c_ast.ID(
+                        utils.get_param_variable_name(
+                            called_function_name, param.name
+                        )
+                    ),
+                    arg,
+                )
+                for param, arg in assignments
+            ] + [goto]
+
+        temporaries, items = [], []
+        for param, arg in assignments:
+            temporary = utils.generate_param_variable(
+                param, f"{param.name}_TMP", arg
+            )
+            temporaries.append(temporary)
+            items.append(
+                c_ast.Assignment(
+                    "=",
+                    c_ast.ID(
+                        utils.get_param_variable_name(
+                            called_function_name, param.name
+                        )
+                    ),
+                    c_ast.ID(temporary.name),
+                )
+            )
+        return [c_ast.Compound(temporaries + items + [goto])]
+
+    @staticmethod
+    def generate_return_in_block(function_name, expr, returns_void=False):
+        """
+        Generates the statements that return the value of the expression from
+        the function named function_name inside the block function:
+            frame->foo.result = expr;
+            return;
+        A function that returns void has no result, so the expression, if
+        any, is only evaluated before returning.
+        """
+        if returns_void:
+            return ([expr] if expr is not None else []) + [c_ast.Return(None)]
+        return_assignment = c_ast.Assignment(
+            op="=",
+            rvalue=expr,
+            lvalue=utils.generate_2d_struct_ref(
+                GlobalParameters.block_call_union_instance_name,
+                function_name,
+                GlobalParameters.function_return_val_name,
+                inner_ptr=True,
+            ),
+        )
+        return [return_assignment, c_ast.Return(None)]
+
+    @staticmethod
+    def convert_indirect_return_in_block(
+        function_name, indirect_tail_call, involved_functions, frame_abi="copy"
+    ):
+        """
+        Converts a tail call through a function pointer whose candidates are
+        merged into the same block function. The pointer is compared with the
+        address of each candidate, and the call jumps to the case of the one
+        it points to. A pointer to any other function is called as it is. For
+        example if the candidates of the call in:
+            return handlers[op](vm);
+        are add and sub, it converts this into:
+            {
+              int (*target_TMP)(struct vm *) = handlers[op];
+              if (target_TMP == add) {
+                frame->add.vm = vm;
+                goto add_LABEL;
+              }
+              if (target_TMP == sub) {
+                frame->sub.vm = vm;
+                goto sub_LABEL;
+              }
+              frame->foo.result = target_TMP(vm);
+              return;
+            }
+        """
+        call = indirect_tail_call.call
+        target_name = GlobalParameters.indirect_call_target_name
+        target = c_ast.Decl(
+            target_name,
+            [],
+            [],
+            [],
+            [],
+            utils.rename_declaration_type(
+                indirect_tail_call.pointer_type, target_name
+            ),
+            call.name,
+            None,
+        )
+        items = [target]
+        for candidate in indirect_tail_call.candidates:
+            items.append(
+                c_ast.If(
+                    c_ast.BinaryOp(
+                        "==", c_ast.ID(target_name), c_ast.ID(candidate)
+                    ),
+                    c_ast.Compound(
+                        Block.generate_jump_in_block(
+                            function_name,
+                            candidate,
+                            call.args,
+                            involved_functions,
+                            frame_abi,
+                        )
+                    ),
+                    None,
+                )
+            )
+        items.extend(
+            Block.generate_return_in_block(
+                function_name,
+                c_ast.FuncCall(c_ast.ID(target_name), call.args, call.coord),
+                involved_functions[function_name].returns_void,
+            )
+        )
+        return c_ast.Compound(items)
+
+    @staticmethod
+    def is_self_tail_call(function_name, return_expr):
+        """Checks whether the return statement tail calls its own function."""
+        return (
+            isinstance(return_expr.expr, c_ast.FuncCall)
+            and isinstance(return_expr.expr.name, c_ast.ID)
+            and return_expr.expr.name.name == function_name
+        )
+
+    @staticmethod
+    def convert_return_in_loop(
+        function_definition, return_expr, variable_names=None
+    ):
+        """
+        Converts the self tail calls of a function that only tail calls itself
+        into a jump back to the top of the function, so that it does not need
+        the block function at all. For example if the function foo has:
+            return foo(x + 1, y);
+        it converts this into:
+            x = x + 1;
+            goto foo_LABEL;
+        If an argument reads a parameter that is assigned before it, like in:
+            return foo(y, x);
+        the arguments are first saved in temporaries:
+            {
+              int x_TMP = y;
+              int y_TMP = x;
+              x = x_TMP;
+              y = y_TMP;
+              goto foo_LABEL;
+            }
+        The parameters of variable_names are assigned through the locals they
+        are copied into instead, see generate_loop_function. Any other return
+        statement is left as it is.
+        """
+        function_name = function_definition.decl.name
+        if not Block.is_self_tail_call(function_name, return_expr):
+            return [return_expr]
+        profiling.count("rewritten_returns")
+
+        variable_names = variable_names or dict()
+        params = utils.get_function_params(function_definition)
+        args = (
+            return_expr.expr.args.exprs
+            if return_expr.expr.args is not None
+            else []
+        )
+        assignments = [
+            (param, variable_names.get(param.name, param.name), arg)
+            for param, arg in zip(params, args)
+        ]
+        assignments = [
+            (param, name, arg)
+            for param, name, arg in assignments
+            if not (isinstance(arg, c_ast.ID) and arg.name == name)
+        ]
+        goto = c_ast.Goto(f"{function_name}_LABEL")
+        if not Block.need_temporaries(
+            [(name, arg) for _, name, arg in assignments]
+        ):
+            return [
+                c_ast.Assignment("=", c_ast.ID(name), arg)
+                for _, name, arg in assignments
+            ] + [goto]
+
+        temporaries, items = [], []
+        for param, name, arg in assignments:
+            temporary = utils.generate_param_variable(
+                param, f"{param.name}_TMP", arg
+            )
+            temporaries.append(temporary)
+            items.append(
+                c_ast.Assignment("=", c_ast.ID(name), c_ast.ID(temporary.name))
+            )
+        return [c_ast.Compound(temporaries + items + [goto])]
+
+    @staticmethod
+    def need_temporaries(assignments):
+        """
+        Checks whether assigning the arguments to the variables, given as
+        pairs of a name and an argument, one after another would make an
+        argument read a variable that has already been overwritten.
+        """
+        assigned_names = set()
+        for name, arg in assignments:
+            if assigned_names & utils.find_referenced_names(arg):
+                return True
+            assigned_names.add(name)
+        return False
+
+    @staticmethod
+    def generate_loop_function(function_definition):
+        """
+        Changes the body of a function that only tail calls itself so that its
+        self tail calls become jumps back to its top. For example:
+            int foo(int x) {
+              if (x == 0) return 0;
+              return foo(x - 1);
+            }
+        becomes:
+            int foo(int x) {
+              foo_LABEL:
+              {
+                if (x == 0) return 0;
+                x = x - 1;
+                goto foo_LABEL;
+              }
+            }
+        A parameter that cannot be assigned because it is const, or that is
+        hidden by a declaration of the same name in the body, so that a self
+        tail call could see the other variable, is copied into a local first,
+        named as in utils.get_param_variable_name, which the body uses and the
+        self tail calls assign instead:
+            int foo(const int x) {
+              int foo_x_PARAM = x;
+              foo_LABEL:
+              ...
+            }
+        In a function that returns void, the self calls that are statements
+        of their own in tail position become jumps as well.
+        """
+        function_name = function_definition.decl.name
+        declared_names = utils.find_declared_names(function_definition.body)
+        copied_params = [
+            param
+            for param in utils.get_function_params(function_definition)
+            if param.name in declared_names or utils.is_const_param(param)
+        ]
+        variable_names = {
+            param.name: utils.get_param_variable_name(
+                function_name, param.name
+            )
+            for param in copied_params
+        }
+        body = utils.return_tail_call_statements(
+            function_definition.body,
+            [
+                call
+                for call in utils.find_function_tail_calls(function_definition)
+                if Block.is_self_tail_call(function_name, c_ast.Return(call))
+            ],
+        )
+        body = utils.rename_identifiers(body, variable_names)
+        body_items = Block.traverse(
+            body.block_items,
+            lambda return_expr: Block.convert_return_in_loop(
+                function_definition, return_expr, variable_names
+            ),
+        )
+        function_definition.body = c_ast.Compound(
+            [
+                utils.generate_param_variable(
+                    param, variable_names[param.name], c_ast.ID(param.name)
+                )
+                for param in copied_params
+            ]
+            + [
+                c_ast.Label(
+                    f"{function_name}_LABEL",
+                    c_ast.Compound(body_items),
+                )
+            ],
+            function_definition.body.coord,
+        )
+
+    @staticmethod
+    def traverse(items, convert_return):
         """
         Recursively traverses the body of the function.
         This is necessary because the return statements of the functions need to
@@ -214,107 +620,528 @@ class Block:
         a block scope (E.g., switch case, if, while, for, etc.) is recursively
         checked whether it contains a return statement so that it is changed
         properly.
+
+        The original statements are never modified. A statement is copied only
+        if a return statement is rewritten somewhere inside it, and even then
+        only the nodes on the path to that return statement are copied while
+        the rest of its subtrees are shared with the original one.
+
+        convert_return receives each return statement and returns the list of
+        statements it is replaced with. Every statement that can hold another
+        one is traversed, at any depth: compound statements, if, while, do
+        while, for and switch statements, and case, default and labeled
+        statements.
         """
         new_items = []
         for item in items:
             if isinstance(item, c_ast.Return):
                 new_items.extend(
-                    Block.convert_return_in_block(
-                        function_name, item, func_def_map
-                    )
+                    Block.convert_tail_return(item, convert_return)
                 )
-            elif isinstance(item, c_ast.If):
-                item_clone = deepcopy(item)
-                if item.iftrue is not None:
-                    item_clone.iftrue.block_items = Block.traverse(
-                        item.iftrue.block_items, function_name, func_def_map
-                    )
-                if item.iffalse is not None:
-                    if isinstance(item.iffalse, c_ast.If):
-                        item_clone.iffalse = Block.traverse(
-                            [item.iffalse], function_name, func_def_map
-                        )[0]
-                    else:
-                        item_clone.iffalse.block_items = Block.traverse(
-                            item.iffalse.block_items,
-                            function_name,
-                            func_def_map,
-                        )
-                new_items.append(item_clone)
-            elif (
-                isinstance(item, c_ast.While)
-                or isinstance(item, c_ast.For)
-                or isinstance(item, c_ast.Switch)
-            ):
-                item_clone = deepcopy(item)
-                if item.stmt is not None:
-                    item_clone.stmt.block_items = Block.traverse(
-                        item.stmt.block_items, function_name, func_def_map
-                    )
-                new_items.append(item_clone)
-            elif isinstance(item, c_ast.Case):
-                item_clone = deepcopy(item)
-                if item.stmts is not None:
-                    item_clone.stmts.block_items = Block.traverse(
-                        item.stmts.block_items, function_name, func_def_map
-                    )
-                new_items.append(item_clone)
             else:
-                new_items.append(item)
+                new_items.append(
+                    Block.traverse_statement(item, convert_return)
+                )
         return new_items
 
     @staticmethod
-    def generate_function_case_body_in_block(function_info, func_def_map):
+    def traverse_statement(item, convert_return):
+        """
+        Rewrites the return statements inside a statement that has a block
+        scope. Returns the statement itself if nothing inside it changed, or a
+        shallow copy of it with its rewritten children otherwise.
+        """
+        if isinstance(item, c_ast.If):
+            iftrue = Block.traverse_body(item.iftrue, convert_return)
+            if isinstance(item.iffalse, c_ast.If):
+                iffalse = Block.traverse_statement(
+                    item.iffalse, convert_return
+                )
+            else:
+                iffalse = Block.traverse_body(item.iffalse, convert_return)
+            if iftrue is item.iftrue and iffalse is item.iffalse:
+                return item
+            profiling.count("copied_nodes")
+            return c_ast.If(item.cond, iftrue, iffalse, item.coord)
+        elif isinstance(
+            item, (c_ast.While, c_ast.DoWhile, c_ast.For, c_ast.Switch)
+        ):
+            stmt = Block.traverse_body(item.stmt, convert_return)
+            if stmt is item.stmt:
+                return item
+            profiling.count("copied_nodes")
+            if isinstance(item, c_ast.While):
+                return c_ast.While(item.cond, stmt, item.coord)
+            elif isinstance(item, c_ast.DoWhile):
+                return c_ast.DoWhile(item.cond, stmt, item.coord)
+            elif isinstance(item, c_ast.For):
+                return c_ast.For(
+                    item.init, item.cond, item.next, stmt, item.coord
+                )
+            return c_ast.Switch(item.cond, stmt, item.coord)
+        elif isinstance(item, (c_ast.Case, c_ast.Default)):
+            stmts = Block.traverse(item.stmts or [], convert_return)
+            if Block.are_same_items(stmts, item.stmts or []):
+                return item
+            profiling.count("copied_nodes")
+            if isinstance(item, c_ast.Case):
+                return c_ast.Case(item.expr, stmts, item.coord)
+            return c_ast.Default(stmts, item.coord)
+        elif isinstance(item, c_ast.Label):
+            stmt = Block.traverse_body(item.stmt, convert_return)
+            if stmt is item.stmt:
+                return item
+            profiling.count("copied_nodes")
+            return c_ast.Label(item.name, stmt, item.coord)
+        elif isinstance(item, c_ast.Compound):
+            return Block.traverse_body(item, convert_return)
+        return item
+
+    @staticmethod
+    def convert_tail_return(return_stmt, convert_return):
+        """
+        Converts the return statement with convert_return. If its value is
+        chosen by a conditional operator or is the last operand of a comma
+        operator with a call in tail position, it is split first so that each
+        of these calls gets a return statement of its own. For example:
+            return x ? foo(x) : bar(x);
+        is split into:
+            if (x) return foo(x); else return bar(x);
+        and return (x++, foo(x)); is split into:
+            x++;
+            return foo(x);
+        The return statement is left as it is if none of the return
+        statements it is split into are converted.
+        """
+        expr = return_stmt.expr
+        if not isinstance(
+            expr, (c_ast.TernaryOp, c_ast.ExprList)
+        ) or not utils.find_tail_position_calls([return_stmt]):
+            return convert_return(return_stmt)
+
+        if isinstance(expr, c_ast.TernaryOp):
+            iftrue_return = c_ast.Return(expr.iftrue, return_stmt.coord)
+            iffalse_return = c_ast.Return(expr.iffalse, return_stmt.coord)
+            iftrue = Block.convert_tail_return(iftrue_return, convert_return)
+            iffalse = Block.convert_tail_return(iffalse_return, convert_return)
+            if Block.are_same_items(
+                iftrue, [iftrue_return]
+            ) and Block.are_same_items(iffalse, [iffalse_return]):
+                return [return_stmt]
+            return [
+                c_ast.If(
+                    expr.cond,
+                    Block.wrap_statements(iftrue),
+                    Block.wrap_statements(iffalse),
+                    return_stmt.coord,
+                )
+            ]
+
+        last_return = c_ast.Return(expr.exprs[-1], return_stmt.coord)
+        items = Block.convert_tail_return(last_return, convert_return)
+        if Block.are_same_items(items, [last_return]):
+            return [return_stmt]
+        return list(expr.exprs[:-1]) + items
+
+    @staticmethod
+    def wrap_statements(items):
+        """Returns the statements as a single statement."""
+        if len(items) == 1:
+            return items[0]
+        return c_ast.Compound(items)
+
+    @staticmethod
+    def traverse_body(body, convert_return):
+        """
+        Rewrites the return statements inside the body of an if, while, for or
+        switch statement. The body is usually a compound statement, but it can
+        also be a single statement, like in if (x) return foo(x);
+        Returns the body itself if nothing inside it changed.
+        """
+        if body is None:
+            return None
+        if isinstance(body, c_ast.Compound):
+            if body.block_items is None:
+                return body
+            block_items = Block.traverse(body.block_items, convert_return)
+            if Block.are_same_items(block_items, body.block_items):
+                return body
+            profiling.count("copied_nodes")
+            return c_ast.Compound(block_items, body.coord)
+        items = Block.traverse([body], convert_return)
+        if Block.are_same_items(items, [body]):
+            return body
+        if len(items) == 1 and isinstance(items[0], c_ast.Compound):
+            return items[0]
+        profiling.count("copied_nodes")
+        return c_ast.Compound(items, body.coord)
+
+    @staticmethod
+    def are_same_items(new_items, items):
+        """Checks whether traversing a list of statements left it unchanged."""
+        return len(new_items) == len(items) and all(
+            new_item is item for new_item, item in zip(new_items, items)
+        )
+
+    @staticmethod
+    def generate_function_case_body_in_block(
+        function_info, involved_functions, frame_abi="copy"
+    ):
         """
         Generates the case statement body for each involved function.
         generate_function_case_in_block wraps a case statement around the result
         of this function.
+
+        The statements that can no longer run once the tail calls are
+        rewritten into jumps, like a break statement after a tail call, are
+        removed along with the labels that are not jumped to. A body whose
+        end can still be reached, like the body of a function that returns
+        void, ends with a return statement, so that the control does not
+        fall through to the case of the next function. In a function that
+        returns void, the calls that are statements of their own in tail
+        position are rewritten like the returned ones, see
+        utils.return_tail_call_statements.
+
+        With the direct frame ABI, the parameters in the body are renamed to
+        the locals of the block function that hold them, and the arguments
+        are only copied out of the frame when the function is entered from
+        its wrapper. Tail calls jump past this copying, to the body label,
+        which is only generated when some tail call jumps to it:
+            foo_x_PARAM = frame->foo.x;
+            foo_BODY:
+            {
+              ...
+            }
         """
-        argument_assignments = Block.generate_arguments_assignments(
-            function_info
+        function_definition = function_info.function_definition
+        function_name = function_definition.decl.name
+        body = function_definition.body
+        if function_info.returns_void:
+            body = utils.return_tail_call_statements(
+                body, utils.find_function_tail_calls(function_definition)
+            )
+        body_items = dead_code.prune_dead_code(
+            Block.traverse(
+                body.block_items or [],
+                lambda return_expr: Block.convert_return_in_block(
+                    function_name, return_expr, involved_functions, frame_abi
+                ),
+            )
         )
-        function_name = function_info.function_definition.decl.name
-        body_items = Block.traverse(
-            function_info.function_definition.body.block_items,
-            function_name,
-            func_def_map,
+        if dead_code.can_complete(body_items):
+            body_items.append(c_ast.Return(None))
+        if frame_abi != "direct":
+            argument_assignments = Block.generate_arguments_assignments(
+                function_info
+            )
+            return argument_assignments + body_items
+
+        params = utils.get_function_params(function_info.function_definition)
+        body = utils.rename_identifiers(
+            c_ast.Compound(body_items),
+            {
+                param.name: utils.get_param_variable_name(
+                    function_name, param.name
+                )
+                for param in params
+            },
         )
-        return argument_assignments + body_items
+        argument_assignments = [
+            c_ast.Assignment(
+                "=",
+                c_ast.ID(
+                    utils.get_param_variable_name(function_name, param.name)
+                ),
+                utils.generate_2d_struct_ref(
+                    GlobalParameters.block_call_union_instance_name,
+                    function_name,
+                    param.name,
+                    inner_ptr=True,
+                ),
+            )
+            for param in params
+        ]
+        if function_info.jumped_to:
+            body = c_ast.Label(function_info.body_label, body)
+        return argument_assignments + [body]
+
+    @staticmethod
+    def has_block_label(
+        function_info, involved_functions, dispatch, frame_abi="copy"
+    ):
+        """
+        Checks whether anything jumps to the label of the function in the
+        block function: the computed goto, the if statements of the if
+        dispatch, which fall through to the first function, and, with the
+        copy frame ABI, the tail calls to the function. The label is not
+        generated otherwise, so that compilers do not warn about it.
+        """
+        if dispatch == "goto":
+            return True
+        if dispatch == "if" and function_info is not next(
+            iter(involved_functions.values())
+        ):
+            return True
+        return frame_abi == "copy" and function_info.jumped_to
 
     @staticmethod
-    def generate_function_case_in_block(function_info, func_def_map):
+    def generate_function_case_in_block(
+        function_info, involved_functions, frame_abi="copy"
+    ):
         """Generates the case statement for each involved function."""
         case_body = Block.generate_function_case_body_in_block(
-            function_info, func_def_map
+            function_info, involved_functions, frame_abi
         )
         case_stmt = c_ast.Case(
             c_ast.ID(function_info.index_label), [c_ast.Compound(case_body)]
         )
-        label = c_ast.Label(function_info.block_label, case_stmt)
-        return label
+        if Block.has_block_label(
+            function_info, involved_functions, "switch", frame_abi
+        ):
+            case_stmt = c_ast.Label(function_info.block_label, case_stmt)
+        function_info.block_statement = case_stmt
+        return case_stmt
+
+    @staticmethod
+    def generate_function_labeled_body_in_block(
+        function_info, involved_functions, dispatch, frame_abi="copy"
+    ):
+        """
+        Generates the labeled body of each involved function for the dispatch
+        strategies that jump to the labels directly instead of using a switch
+        statement.
+        """
+        case_body = Block.generate_function_case_body_in_block(
+            function_info, involved_functions, frame_abi
+        )
+        statement = c_ast.Compound(case_body)
+        if Block.has_block_label(
+            function_info, involved_functions, dispatch, frame_abi
+        ):
+            statement = c_ast.Label(function_info.block_label, statement)
+        function_info.block_statement = statement
+        return statement
+
+    @staticmethod
+    def choose_dispatch(involved_functions, dispatch):
+        """
+        Resolves the auto dispatch strategy based on the number of involved
+        functions. A few functions are dispatched with a chain of if
+        statements, many functions with a computed goto and the rest with a
+        switch statement.
+        """
+        if dispatch != "auto":
+            return dispatch
+        if len(involved_functions) <= GlobalParameters.if_dispatch_max_size:
+            return "if"
+        if len(involved_functions) >= GlobalParameters.goto_dispatch_min_size:
+            return "goto"
+        return "switch"
 
     @staticmethod
-    def generate_block_function_definition(involved_functions, func_def_map):
-        """Generates the block function's body."""
+    def find_likely_function(involved_functions):
+        """
+        Finds the involved function the block function is most likely called
+        for, which is the only hot one of the execution profile the block was
+        generated with, see pgo.apply_profile. Returns None without a profile
+        or when no function or several functions are hot.
+        """
+        hot_functions = [
+            function_info
+            for function_info in involved_functions.values()
+            if function_info.hotness == "hot"
+        ]
+        if len(hot_functions) != 1 or len(involved_functions) == 1:
+            return None
+        return hot_functions[0]
+
+    @staticmethod
+    def generate_switch_dispatch(involved_functions, frame_abi="copy"):
+        """
+        Generates the body of the block function that dispatches to the
+        involved functions with a switch statement:
+            switch (index) {
+              foo_LABEL:
+              case foo_INDEX:
+                ...
+            }
+        The label of a function is only generated when a tail call jumps to
+        it, see has_block_label. When the block function is most likely called
+        for one of them, see find_likely_function, the index is expected to be
+        its index:
+            switch (__builtin_expect(index, foo_INDEX))
+        """
         functions_bodies = [
             Block.generate_function_case_in_block(
-                involved_functions[function], func_def_map
+                involved_functions[function], involved_functions, frame_abi
             )
             for function in involved_functions
         ]
         switch_body = c_ast.Compound(functions_bodies)
-        switch_stmt = c_ast.Switch(c_ast.ID("index"), switch_body)
-        body_items = [switch_stmt]
+        condition = c_ast.ID("index")
+        likely_function = Block.find_likely_function(involved_functions)
+        if likely_function is not None:
+            condition = utils.generate_expect(
+                condition, c_ast.ID(likely_function.index_label)
+            )
+        switch_stmt = c_ast.Switch(condition, switch_body)
+        return [switch_stmt]
+
+    @staticmethod
+    def generate_goto_dispatch(involved_functions, frame_abi="copy"):
+        """
+        Generates the body of the block function that dispatches to the
+        involved functions with a computed goto (the labels as values
+        extension of GCC and Clang):
+            static void *dispatch[] = {&&foo_LABEL, &&bar_LABEL};
+            goto *dispatch[index];
+            foo_LABEL:
+              ...
+        The table is ordered by the indices of the functions, whichever order
+        their bodies are in.
+        """
+        name = GlobalParameters.block_dispatch_table_name
+        table_type = c_ast.ArrayDecl(
+            c_ast.PtrDecl(
+                [],
+                c_ast.TypeDecl(name, [], None, c_ast.IdentifierType(["void"])),
+            ),
+            None,
+            [],
+        )
+        table_init = c_ast.InitList(
+            [
+                c_ast.UnaryOp("&&", c_ast.ID(function_info.block_label))
+                for function_info in sorted(
+                    involved_functions.values(),
+                    key=lambda function_info: function_info.index,
+                )
+            ]
+        )
+        table = c_ast.Decl(
+            name, [], [], ["static"], [], table_type, table_init, None
+        )
+        jump = utils.ComputedGoto(
+            c_ast.ArrayRef(c_ast.ID(name), c_ast.ID("index"))
+        )
+        functions_bodies = [
+            Block.generate_function_labeled_body_in_block(
+                function_info, involved_functions, "goto", frame_abi
+            )
+            for function_info in involved_functions.values()
+        ]
+        return [table, jump] + functions_bodies
+
+    @staticmethod
+    def generate_if_dispatch(involved_functions, frame_abi="copy"):
+        """
+        Generates the body of the block function that dispatches to the
+        involved functions with a chain of if statements. The first function
+        is reached by falling through the chain:
+            if (index == bar_INDEX) goto bar_LABEL;
+            {
+              ...
+            }
+            bar_LABEL:
+              ...
+        The jumps to the cold functions of the execution profile the block
+        was generated with, or to every other function when the first one is
+        the function the block function is most likely called for, see
+        find_likely_function, are expected not to be taken.
+        """
+        function_infos = list(involved_functions.values())
+        likely_function = Block.find_likely_function(involved_functions)
+        jumps = []
+        for function_info in function_infos[1:]:
+            condition = c_ast.BinaryOp(
+                "==",
+                c_ast.ID("index"),
+                c_ast.ID(function_info.index_label),
+            )
+            if (
+                function_info.hotness == "cold"
+                or likely_function is function_infos[0]
+            ):
+                condition = utils.generate_expect(condition, 0)
+            jumps.append(
+                c_ast.If(
+                    condition, c_ast.Goto(function_info.block_label), None
+                )
+            )
+        functions_bodies = [
+            Block.generate_function_labeled_body_in_block(
+                function_info, involved_functions, "if", frame_abi
+            )
+            for function_info in function_infos
+        ]
+        return jumps + functions_bodies
+
+    @staticmethod
+    def generate_block_function_definition(
+        involved_functions, dispatch, frame_abi="copy"
+    ):
+        """
+        Generates the block function's body. With the direct frame ABI, it
+        starts with the declarations of the locals that hold the parameters
+        of the involved functions.
+        """
+        dispatch = Block.choose_dispatch(involved_functions, dispatch)
+        if dispatch == "goto":
+            body_items = Block.generate_goto_dispatch(
+                involved_functions, frame_abi
+            )
+        elif dispatch == "if":
+            body_items = Block.generate_if_dispatch(
+                involved_functions, frame_abi
+            )
+        else:
+            body_items = Block.generate_switch_dispatch(
+                involved_functions, frame_abi
+            )
+        if frame_abi == "direct":
+            body_items = [
+                utils.generate_param_variable(
+                    param,
+                    utils.get_param_variable_name(function_name, param.name),
+                )
+                for function_name, function_info in involved_functions.items()
+                for param in utils.get_function_params(
+                    function_info.function_definition
+                )
+            ] + body_items
         body = c_ast.Compound(body_items)
         return body
 
     @staticmethod
-    def generate_block_function(involved_functions, func_def_map):
-        """Generates the block function in its entirety"""
-        function_declaration = Block.generate_block_function_declaration()
+    def generate_block_function(
+        involved_functions,
+        block_name=GlobalParameters.block_name,
+        union_name=GlobalParameters.block_call_union_name,
+        options=None,
+    ):
+        """
+        Generates the block function in its entirety. With an execution
+        profile, it is marked hot if any of the involved functions is hot, and
+        cold if all of them are cold, see pgo.apply_profile.
+        """
+        options = options or utils.TransformOptions()
+        function_declaration = Block.generate_block_function_declaration(
+            block_name, union_name
+        )
         function_body = Block.generate_block_function_definition(
-            involved_functions, func_def_map
+            involved_functions, options.dispatch, options.frame_abi
         )
+        if options.frame_abi == "direct":
+            function_declaration.storage = ["static"]
+            function_declaration.funcspec = ["inline"]
+        hotness = [
+            function_info.hotness
+            for function_info in involved_functions.values()
+        ]
+        if "hot" in hotness:
+            function_declaration.funcspec.append("__attribute__((hot))")
+        elif all(function_hotness == "cold" for function_hotness in hotness):
+            function_declaration.funcspec.append("__attribute__((cold))")
         block_function = c_ast.FuncDef(
             function_declaration, None, function_body
         )
@@ -326,8 +1153,7 @@ class Block:
         Generates an instance of the union that is passed to the block function
         """
         name = GlobalParameters.block_call_union_instance_name
-        type = deepcopy(block_call_union.type)
-        type.decls = None
+        type = c_ast.Union(block_call_union.type.name, None)
         type_declaration = c_ast.TypeDecl(name, [], None, type)
         instance = c_ast.Decl(
             name, [], [], [], [], type_declaration, None, None
@@ -335,7 +1161,9 @@ class Block:
         return instance
 
     @staticmethod
-    def generate_block_call_stmt(index_label):
+    def generate_block_call_stmt(
+        index_label, block_name=GlobalParameters.block_name
+    ):
         """
         Generates the statement that calls the block function.
         For example, if the function is called foo, this statement would be
@@ -349,7 +1177,5 @@ class Block:
             c_ast.UnaryOp("&", block_call_struct_name),
         ]
         args = c_ast.ExprList(expressions)
-        block_call_stmt = c_ast.FuncCall(
-            c_ast.ID(GlobalParameters.block_name), args
-        )
+        block_call_stmt = c_ast.FuncCall(c_ast.ID(block_name), args)
         return block_call_stmt
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import tempfile
+import pycparser
+import utils
+
+
+class TransformationCache:
+    """
+    A persistent, content-addressed cache of the results of the tail call
+    elimination process.
+
+    Each result is stored in its own file named after the hash of everything
+    the result depends on: the source code, its directives, the options, the
+    version of this program and the version of Pycparser. Reading an entry
+    updates its modification time, so when the cache grows beyond its maximum
+    size the least recently used entries are the ones that are evicted.
+
+    If incremental is set, the cache also keeps the incremental state of each
+    file, so that a file that changed only has the parts of its result that
+    depend on the changed code generated again.
+    """
+
+    default_max_size = 256 * 1024 * 1024
+    entry_extension = ".c"
+    state_extension = ".json"
+
+    def __init__(self, directory=None, max_size=None, incremental=False):
+        self.directory = directory or TransformationCache.default_directory()
+        self.max_size = (
+            max_size
+            if max_size is not None
+            else TransformationCache.default_max_size
+        )
+        self.incremental = incremental
+
+    @staticmethod
+    def default_directory():
+        """
+        Returns the directory the cache is kept in when none is given. It can
+        be changed through the TCE_CACHE_DIR environment variable.
+        """
+        if "TCE_CACHE_DIR" in os.environ:
+            return os.environ["TCE_CACHE_DIR"]
+        cache_home = os.environ.get(
+            "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+        )
+        return os.path.join(cache_home, "tail_call_elimination")
+
+    @staticmethod
+    def generate_key(
+        directives, code, options, filename="<source>", prelude=None
+    ):
+        """
+        Generates the key of the result of a file from its directives and the
+        rest of its code, as returned by utils.split_directives, and the
+        options it is converted with. With execution profiles, the name of
+        the file is part of the key too, as the line counts of the profiles
+        are looked up by it. With the preprocessor, the prelude, which is the
+        text its directives expand to, is part of the key as well, since the
+        code is parsed with the types of the included headers, which can
+        change without the file changing.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{utils.VERSION}\0{pycparser.__version__}\0".encode())
+        digest.update(f"{options.fingerprint()}\0".encode())
+        if options.pgo_profiles is not None:
+            digest.update(f"{os.path.basename(filename)}\0".encode())
+        if prelude is not None:
+            digest.update(f"{prelude}\0".encode())
+        for line in directives:
+            digest.update(line.encode())
+        digest.update(b"\0")
+        for line in code:
+            digest.update(line.encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def generate_state_key(filename, options, prelude=None):
+        """
+        Generates the key of the incremental state of a file from its path,
+        the options it is converted with and its prelude, see generate_key,
+        so that a change in the included headers starts from a new state.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{utils.VERSION}\0{pycparser.__version__}\0".encode())
+        digest.update(f"{options.fingerprint()}\0".encode())
+        if prelude is not None:
+            digest.update(f"{prelude}\0".encode())
+        digest.update(os.path.abspath(filename).encode())
+        return digest.hexdigest()
+
+    def get_entry_path(self, key, extension=entry_extension):
+        return os.path.join(self.directory, key[:2], key + extension)
+
+    def get(self, key, extension=entry_extension):
+        """
+        Returns the cached result for the given key or None if there is no
+        such result. Reading an entry marks it as recently used.
+        """
+        path = self.get_entry_path(key, extension)
+        try:
+            with open(path) as file:
+                content = file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return content
+
+    def put(self, key, content, extension=entry_extension):
+        """
+        Stores the result for the given key. The entry is written to a
+        temporary file first and then renamed, so that concurrent processes
+        never read a partially written entry.
+        """
+        path = self.get_entry_path(key, extension)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def get_state(self, key):
+        """
+        Returns the state stored as JSON for the given key, like the
+        incremental state of a file, or None if there is no such state or it
+        cannot be read.
+        """
+        content = self.get(key, TransformationCache.state_extension)
+        if content is None:
+            return None
+        try:
+            return json.loads(content)
+        except ValueError:
+            return None
+
+    def put_state(self, key, state):
+        """Stores the state for the given key as JSON."""
+        self.put(key, json.dumps(state), TransformationCache.state_extension)
+
+    def get_entries(self):
+        """Returns the path, size and last use time of every entry."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for subdirectory in os.scandir(self.directory):
+            if not subdirectory.is_dir():
+                continue
+            for entry in os.scandir(subdirectory.path):
+                if not entry.name.endswith(
+                    (
+                        TransformationCache.entry_extension,
+                        TransformationCache.state_extension,
+                    )
+                ):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the total size of the
+        cache is at most its maximum size. Returns the number of removed
+        entries.
+        """
+        entries = self.get_entries()
+        total_size = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            removed += 1
+        return removed
+
+    def get_stats(self):
+        """Returns a summary of the contents of the cache."""
+        entries = self.get_entries()
+        return {
+            "directory": self.directory,
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+            "max_size": self.max_size,
+        }
+
+    def clear(self):
+        """Removes every entry of the cache. Returns the number of entries."""
+        entries = self.get_entries()
+        for path, _, _ in entries:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        return len(entries)
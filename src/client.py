@@ -0,0 +1,156 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+
+
+class DaemonError(Exception):
+    """Raised when the daemon fails to remove the tail calls of a source."""
+
+
+def default_socket_path():
+    """
+    Returns the path of the socket the daemon listens on when none is given.
+    It can be changed through the TCE_SOCKET environment variable.
+    """
+    if "TCE_SOCKET" in os.environ:
+        return os.environ["TCE_SOCKET"]
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, f"tail_call_elimination-{os.getuid()}.sock")
+
+
+def request_transform(source, arguments, filename, socket_path=None):
+    """
+    Sends the source code to the daemon and returns the resulting source
+    code. Raises OSError if no daemon is listening on the socket and
+    DaemonError if the daemon could not remove the tail calls.
+    """
+    request = {"source": source, "arguments": arguments, "filename": filename}
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path or default_socket_path())
+        with connection.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode() + b"\n")
+            stream.flush()
+            line = stream.readline()
+    if not line:
+        raise ConnectionResetError("The daemon closed the connection.")
+    response = json.loads(line)
+    if not response["ok"]:
+        raise DaemonError(response["error"])
+    return response["output"]
+
+
+def transform_in_process(source, arguments, filename):
+    """
+    Removes the tail calls in this process. The tail call elimination modules
+    are only imported here, so that they are not loaded when the daemon is
+    used.
+    """
+    import main
+
+    options = main.create_options(main.parse_arguments(arguments))
+    return main.transform_source(source, options, filename=filename)
+
+
+def transform(source, arguments, filename, socket_path=None):
+    """
+    Removes the tail calls of the source code through the daemon, or in this
+    process if no daemon is running or the daemon closed the connection
+    without a response.
+    """
+    try:
+        return request_transform(source, arguments, filename, socket_path)
+    except (FileNotFoundError, ConnectionError):
+        return transform_in_process(source, arguments, filename)
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        description="Removes the tail calls of C source files through the "
+        "tail call elimination daemon, or in process if it is not running."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="C source files to be converted, or - to read a single file "
+        "from the standard input and write the result to the standard output",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="file the result of a single input is written to instead of "
+        "beside it, or - for the standard output",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="socket of the daemon (default: $TCE_SOCKET or a socket in "
+        "$XDG_RUNTIME_DIR or the temporary directory)",
+    )
+    parser.add_argument(
+        "forwarded_arguments",
+        nargs="*",
+        metavar="-- OPTIONS",
+        help="options of main.py, like --partition or --dispatch, given "
+        "after -- and forwarded to the daemon",
+    )
+    if argv is None:
+        argv = sys.argv[1:]
+    if "--" in argv:
+        separator = argv.index("--")
+        arguments = parser.parse_args(argv[:separator])
+        arguments.forwarded_arguments = argv[separator + 1 :]
+    else:
+        arguments = parser.parse_args(argv)
+    return arguments
+
+
+def main(argv=None):
+    """
+    Sends the source files to the daemon, which keeps a warm parser and the
+    whole tail call elimination process loaded, and writes the results the
+    same way main.py does. Only the standard library is needed to talk to the
+    daemon, so the client starts quickly. The arguments after --, like
+    --partition or --dispatch, are forwarded to the daemon and interpreted
+    the same way main.py interprets them.
+    """
+    arguments = parse_arguments(argv)
+    if arguments.output is not None and len(arguments.inputs) > 1:
+        print("--output accepts a single input only.")
+        return 1
+
+    for filename in arguments.inputs:
+        if filename == "-":
+            source = sys.stdin.read()
+        elif os.path.isfile(filename):
+            with open(filename) as file:
+                source = file.read()
+        else:
+            print(f"Input file does not exist: {filename}", file=sys.stderr)
+            return 1
+
+        try:
+            file_content = transform(
+                source,
+                arguments.forwarded_arguments,
+                "<stdin>" if filename == "-" else filename,
+                arguments.socket,
+            )
+        except DaemonError as error:
+            print(f"{filename}: {error}", file=sys.stderr)
+            return 1
+
+        if filename == "-" or arguments.output == "-":
+            sys.stdout.write(file_content)
+        else:
+            output = arguments.output or f"{filename[:-2]}_removed.c"
+            with open(output, "w") as file:
+                file.write(file_content)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
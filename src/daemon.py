@@ -0,0 +1,164 @@
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import batch
+import client
+import main
+
+
+def parse_request_arguments(arguments):
+    """
+    Parses the arguments of a request the same way main.py parses its command
+    line. Argparse exits when they are invalid, which would take down the
+    thread of the connection, so its error is raised as a ValueError instead,
+    and its messages are kept out of the log of the daemon.
+    """
+    messages = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(messages), contextlib.redirect_stderr(
+            messages
+        ):
+            return main.parse_arguments(arguments)
+    except SystemExit as exit:
+        lines = messages.getvalue().strip().splitlines()
+        if exit.code and lines:
+            raise ValueError(lines[-1]) from None
+        raise ValueError(
+            f"Arguments not supported by the daemon: {' '.join(arguments)}"
+        ) from None
+
+
+def transform_request(request):
+    """
+    Removes the tail calls of the source code of a request inside a worker
+    process. The arguments of the request are interpreted the same way the
+    command line arguments of main.py are.
+    """
+    options = main.create_options(
+        parse_request_arguments(request.get("arguments", []))
+    )
+    return main.transform_source(
+        request["source"],
+        options,
+        filename=request.get("filename", "<source>"),
+    )
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handles a connection to the daemon. Each line the client sends is a JSON
+    request with the source code, and each response is a JSON line with
+    either the resulting source code or the error that happened.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                output = self.server.executor.submit(
+                    transform_request, request
+                ).result()
+                response = {"ok": True, "output": output}
+            except Exception as error:
+                response = {
+                    "ok": False,
+                    "error": f"{type(error).__name__}: {error}",
+                }
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class TransformServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """
+    A server that listens on a Unix socket and removes the tail calls of the
+    sources it receives. Each connection is handled by its own thread, and
+    the work itself is done by a pool of warm worker processes so that
+    concurrent requests run in parallel.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, jobs=None):
+        super().__init__(socket_path, RequestHandler)
+        self.executor = ProcessPoolExecutor(
+            max_workers=jobs or batch.available_cores(),
+            initializer=batch.warm_up_worker,
+        )
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+def remove_stale_socket(socket_path):
+    """
+    Removes the socket file left behind by a daemon that did not exit
+    cleanly. Raises an error if another daemon is still listening on it.
+    """
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except ConnectionRefusedError:
+            os.remove(socket_path)
+            return
+    raise RuntimeError(f"A daemon is already listening on {socket_path}")
+
+
+def stop_on_signal(signal_number, frame):
+    sys.exit(0)
+
+
+def serve(socket_path=None, jobs=None):
+    """
+    Runs the daemon until it is interrupted or terminated. The socket file
+    is removed when the daemon stops.
+    """
+    socket_path = socket_path or client.default_socket_path()
+    remove_stale_socket(socket_path)
+    signal.signal(signal.SIGTERM, stop_on_signal)
+    with TransformServer(socket_path, jobs) as server:
+        print(f"Listening on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(socket_path)
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        description="Runs a daemon that keeps the tail call elimination "
+        "loaded and removes the tail calls of the sources client.py sends it."
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="socket to listen on (default: $TCE_SOCKET or a socket in "
+        "$XDG_RUNTIME_DIR or the temporary directory)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: the number of available "
+        "cores)",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments(sys.argv[1:])
+    serve(arguments.socket, arguments.jobs)
@@ -0,0 +1,280 @@
+from pycparser import c_ast
+import profiling
+import utils
+
+# The statements that transfer the control elsewhere, so that the statement
+# that follows them is never reached by falling through
+JUMP_STATEMENTS = (
+    c_ast.Return,
+    c_ast.Goto,
+    utils.ComputedGoto,
+    c_ast.Break,
+    c_ast.Continue,
+)
+
+# The statements the break and continue statements inside them refer to
+LOOP_STATEMENTS = (c_ast.While, c_ast.DoWhile, c_ast.For)
+
+
+def prune_dead_code(items):
+    """
+    Removes the statements that can never run from the statements of a
+    function body, along with the labels that no goto statement jumps to.
+    For example, once the tail calls of
+        while (1) {
+            return gar(12);
+            break;
+        }
+        return gar(7 + x);
+    are rewritten into gotos, the break statement and everything after the
+    loop are removed, as the loop can never end.
+
+    A statement is unreachable when the statement before it cannot complete,
+    because it jumps elsewhere or because all of its branches do, unless it
+    holds a label a goto jumps to or a case label of its switch statement.
+    Only the gotos of the reachable statements count, so the statements are
+    pruned first as if no label was jumped to, and again with the labels
+    the remaining gotos jump to, until they do not change. This way a loop
+    of gotos that can never be entered is removed as well. Like
+    Block.traverse, only the nodes on the paths to the removed statements
+    are copied, the rest is shared with the given statements.
+    """
+    used_labels = set()
+    while True:
+        pruned_items = prune_items(items, used_labels)[0]
+        reached_labels = find_used_labels(pruned_items)
+        if reached_labels == used_labels:
+            break
+        used_labels = reached_labels
+    if profiling.active_profiler is not None:
+        profiling.count(
+            "pruned_nodes", count_nodes(items) - count_nodes(pruned_items)
+        )
+    return pruned_items
+
+
+def can_complete(items):
+    """Checks whether the control can reach the end of the statements."""
+    return prune_items(items, find_used_labels(items))[1]
+
+
+def count_nodes(items):
+    """Counts the nodes of the statements, including the nested ones."""
+    count = 0
+    nodes = list(items)
+    while nodes:
+        current = nodes.pop()
+        count += 1
+        nodes.extend(child for _, child in current.children())
+    return count
+
+
+def find_used_labels(items):
+    """
+    Finds the names of the labels that are jumped to by goto statements, or
+    whose addresses are taken, inside the statements.
+    """
+    names = set()
+    nodes = list(items)
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.Goto):
+            names.add(current.name)
+        elif (
+            isinstance(current, c_ast.UnaryOp)
+            and current.op == "&&"
+            and isinstance(current.expr, c_ast.ID)
+        ):
+            names.add(current.expr.name)
+        nodes.extend(child for _, child in current.children())
+    return names
+
+
+def is_entry(item, used_labels):
+    """
+    Checks whether the control can enter the statement other than through
+    the statement before it, which is when it holds a label that is jumped
+    to or a case label of the switch statement it is in.
+    """
+    nodes = [(item, False)]
+    while nodes:
+        current, in_switch = nodes.pop()
+        if isinstance(current, c_ast.Label) and current.name in used_labels:
+            return True
+        if not in_switch and isinstance(current, (c_ast.Case, c_ast.Default)):
+            return True
+        in_switch = in_switch or isinstance(current, c_ast.Switch)
+        nodes.extend((child, in_switch) for _, child in current.children())
+    return False
+
+
+def prune_items(items, used_labels):
+    """
+    Removes the unreachable statements of a list of statements. Returns the
+    remaining statements and whether the control can reach the end of the
+    list. The declarations of an unreachable part are kept if a statement
+    after them can still be entered, as it can refer to them.
+    """
+    entries = [is_entry(item, used_labels) for item in items]
+    new_items = []
+    reachable = True
+    for index, item in enumerate(items):
+        if not reachable and not entries[index]:
+            if isinstance(item, (c_ast.Decl, c_ast.Typedef)) and any(
+                entries[index + 1 :]
+            ):
+                new_items.append(item)
+            continue
+        item, reachable = prune_statement(item, used_labels)
+        new_items.append(item)
+    return new_items, reachable
+
+
+def prune_statement(item, used_labels):
+    """
+    Removes the unreachable statements inside the statement. Returns the
+    statement itself if nothing inside it was removed, or a shallow copy of
+    it otherwise, and whether the control can complete it and reach the
+    statement after it.
+    """
+    if isinstance(item, JUMP_STATEMENTS):
+        return item, False
+    elif isinstance(item, c_ast.Compound):
+        if item.block_items is None:
+            return item, True
+        block_items, completes = prune_items(item.block_items, used_labels)
+        if are_same_items(block_items, item.block_items):
+            return item, completes
+        return c_ast.Compound(block_items, item.coord), completes
+    elif isinstance(item, c_ast.If):
+        iftrue, iftrue_completes = prune_body(item.iftrue, used_labels)
+        iffalse, iffalse_completes = prune_body(item.iffalse, used_labels)
+        completes = iftrue_completes or iffalse_completes
+        if iftrue is item.iftrue and iffalse is item.iffalse:
+            return item, completes
+        return c_ast.If(item.cond, iftrue, iffalse, item.coord), completes
+    elif isinstance(item, (c_ast.While, c_ast.For)):
+        stmt, _ = prune_body(item.stmt, used_labels)
+        completes = not is_always_true(item.cond) or has_jump(
+            stmt, c_ast.Break
+        )
+        if stmt is item.stmt:
+            return item, completes
+        if isinstance(item, c_ast.While):
+            return c_ast.While(item.cond, stmt, item.coord), completes
+        return (
+            c_ast.For(item.init, item.cond, item.next, stmt, item.coord),
+            completes,
+        )
+    elif isinstance(item, c_ast.DoWhile):
+        stmt, stmt_completes = prune_body(item.stmt, used_labels)
+        completes = has_jump(stmt, c_ast.Break) or (
+            not is_always_true(item.cond)
+            and (stmt_completes or has_jump(stmt, c_ast.Continue))
+        )
+        if stmt is item.stmt:
+            return item, completes
+        return c_ast.DoWhile(item.cond, stmt, item.coord), completes
+    elif isinstance(item, c_ast.Switch):
+        stmt, stmt_completes = prune_body(item.stmt, used_labels)
+        completes = (
+            stmt_completes
+            or has_jump(stmt, c_ast.Break)
+            or not has_default(stmt)
+        )
+        if stmt is item.stmt:
+            return item, completes
+        return c_ast.Switch(item.cond, stmt, item.coord), completes
+    elif isinstance(item, (c_ast.Case, c_ast.Default)):
+        stmts, completes = prune_items(item.stmts or [], used_labels)
+        if are_same_items(stmts, item.stmts or []):
+            return item, completes
+        if isinstance(item, c_ast.Case):
+            return c_ast.Case(item.expr, stmts, item.coord), completes
+        return c_ast.Default(stmts, item.coord), completes
+    elif isinstance(item, c_ast.Label):
+        stmt, completes = prune_statement(item.stmt, used_labels)
+        if item.name not in used_labels:
+            return stmt, completes
+        if stmt is item.stmt:
+            return item, completes
+        return c_ast.Label(item.name, stmt, item.coord), completes
+    return item, True
+
+
+def prune_body(body, used_labels):
+    """
+    Removes the unreachable statements inside the body of an if, while, for
+    or switch statement, which can be missing, like the else branch of an if
+    statement, in which case the control always completes it.
+    """
+    if body is None:
+        return None, True
+    return prune_statement(body, used_labels)
+
+
+def are_same_items(new_items, items):
+    """Checks whether pruning a list of statements left it unchanged."""
+    return len(new_items) == len(items) and all(
+        new_item is item for new_item, item in zip(new_items, items)
+    )
+
+
+def is_always_true(cond):
+    """
+    Checks whether the condition of a loop is missing, like in for (;;), or
+    is an integer constant other than zero, like in while (1).
+    """
+    if cond is None:
+        return True
+    if not isinstance(cond, c_ast.Constant) or cond.type not in (
+        "int",
+        "unsigned int",
+        "long int",
+        "unsigned long int",
+        "long long int",
+        "unsigned long long int",
+    ):
+        return False
+    try:
+        return int(cond.value.rstrip("uUlL"), 0) != 0
+    except ValueError:
+        # Octal constants like 010 are not valid Python literals
+        return cond.value.strip("0uUlL") != ""
+
+
+def has_jump(stmt, jump_type):
+    """
+    Checks whether the body of a loop or switch statement has a break or a
+    continue statement, as given by jump_type, that refers to it rather than
+    to a statement nested inside it. A continue statement inside a nested
+    switch statement still refers to the loop.
+    """
+    nested_types = LOOP_STATEMENTS
+    if jump_type is c_ast.Break:
+        nested_types = LOOP_STATEMENTS + (c_ast.Switch,)
+    nodes = [stmt] if stmt is not None else []
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, jump_type):
+            return True
+        if isinstance(current, nested_types):
+            continue
+        nodes.extend(child for _, child in current.children())
+    return False
+
+
+def has_default(stmt):
+    """
+    Checks whether the body of a switch statement has a default label of its
+    own, without which the control skips the whole body when no case matches.
+    """
+    nodes = [stmt] if stmt is not None else []
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.Default):
+            return True
+        if isinstance(current, c_ast.Switch):
+            continue
+        nodes.extend(child for _, child in current.children())
+    return False
@@ -0,0 +1,319 @@
+from pycparser import c_ast, c_generator
+from utils import GlobalParameters
+import utils
+
+# The sizes of the basic types on the LP64 data model of 64-bit Linux and
+# macOS, which their alignments are the same as. Every other data model
+# targeted in practice has the same or smaller sizes.
+POINTER_SIZE = 8
+FLOATING_TYPE_SIZES = {"float": 4, "double": 8}
+LONG_DOUBLE_SIZE = 16
+INTEGER_TYPE_SIZES = {"_Bool": 1, "char": 1, "short": 2, "int": 4}
+LONG_SIZE = 8
+
+# The sizes of the common typedef names of the standard headers, used when
+# their declarations are not parsed
+STANDARD_TYPEDEF_SIZES = {
+    "size_t": 8,
+    "ssize_t": 8,
+    "ptrdiff_t": 8,
+    "intptr_t": 8,
+    "uintptr_t": 8,
+    "int8_t": 1,
+    "uint8_t": 1,
+    "int16_t": 2,
+    "uint16_t": 2,
+    "int32_t": 4,
+    "uint32_t": 4,
+    "int64_t": 8,
+    "uint64_t": 8,
+}
+
+CACHE_LINE_SIZE = 64
+# The largest number of cache lines a frame is asserted to fit in
+MAX_ASSERTED_CACHE_LINES = 2
+
+
+class FrameLayout:
+    """
+    A class used to store the estimated size and alignment of the union of a
+    block function and of each of its call structs, in bytes, which are None
+    when the size of one of their fields is unknown.
+    """
+
+    def __init__(self, call_union_name, size, alignment, struct_sizes):
+        self.call_union_name = call_union_name
+        self.size = size
+        self.alignment = alignment
+        self.struct_sizes = struct_sizes
+
+    @property
+    def cache_lines(self):
+        if self.size is None:
+            return None
+        return max(1, -(-self.size // CACHE_LINE_SIZE))
+
+    def to_dict(self):
+        return {**vars(self), "cache_lines": self.cache_lines}
+
+    def generate_report(self):
+        """
+        Generates the comment written before the union with its estimated
+        size.
+        """
+        if self.size is None:
+            return (
+                f"/* union {self.call_union_name}: size unknown, the size "
+                f"of a field could not be estimated */"
+            )
+        lines = "line" if self.cache_lines == 1 else "lines"
+        return (
+            f"/* union {self.call_union_name}: about {self.size} bytes, "
+            f"{self.cache_lines} cache {lines} */"
+        )
+
+    def generate_assert(self):
+        """
+        Generates the static assertion that the union fits in the cache
+        lines its estimated size takes, if it takes at most
+        MAX_ASSERTED_CACHE_LINES of them, so that a change that makes the
+        frames larger is noticed when the result is compiled. Returns None
+        otherwise.
+        """
+        if self.cache_lines is None or (
+            self.cache_lines > MAX_ASSERTED_CACHE_LINES
+        ):
+            return None
+        limit = self.cache_lines * CACHE_LINE_SIZE
+        union_type = c_ast.Typename(
+            None,
+            [],
+            None,
+            c_ast.TypeDecl(
+                None, [], None, c_ast.Union(self.call_union_name, None)
+            ),
+        )
+        return c_ast.StaticAssert(
+            c_ast.BinaryOp(
+                "<=",
+                c_ast.UnaryOp("sizeof", union_type),
+                c_ast.Constant("int", str(limit)),
+            ),
+            c_ast.Constant(
+                "string",
+                f'"union {self.call_union_name} does not fit in {limit} '
+                f'bytes"',
+            ),
+        )
+
+    @staticmethod
+    def generate_result_asserts(call_structs):
+        """
+        Generates the static assertions that the result field of each of the
+        call structs of the union is at offset 0, see
+        order_call_struct_fields, with the offsetof macro of <stddef.h>:
+            _Static_assert(offsetof(struct foo_ios, result) == 0, "...");
+        Only the offset is checked. The types of the results of the functions
+        a tail call is eliminated between are the same, see
+        utils.returns_same_type.
+        """
+        asserts = []
+        for call_struct in call_structs:
+            struct_type = call_struct.type
+            if not any(
+                field.name == GlobalParameters.function_return_val_name
+                for field in struct_type.decls
+            ):
+                continue
+            offset = c_ast.FuncCall(
+                c_ast.ID("offsetof"),
+                c_ast.ExprList(
+                    [
+                        c_ast.Typename(
+                            None,
+                            [],
+                            None,
+                            c_ast.TypeDecl(
+                                None,
+                                [],
+                                None,
+                                c_ast.Struct(struct_type.name, None),
+                            ),
+                        ),
+                        c_ast.ID(GlobalParameters.function_return_val_name),
+                    ]
+                ),
+            )
+            asserts.append(
+                c_ast.StaticAssert(
+                    c_ast.BinaryOp("==", offset, c_ast.Constant("int", "0")),
+                    c_ast.Constant(
+                        "string",
+                        f'"the {GlobalParameters.function_return_val_name} of '
+                        f'struct {struct_type.name} is not at its start"',
+                    ),
+                )
+            )
+        return asserts
+
+
+def estimate_type_size(declaration_type, typedefs, structs):
+    """
+    Returns the estimated size and alignment of a declaration type, like the
+    type of a field of a call struct, or None if they are unknown, like for
+    the types declared by headers that are not parsed. The sizes of the data
+    model of POINTER_SIZE are used.
+    """
+    declaration_type = utils.resolve_typedefs(declaration_type, typedefs)
+    if isinstance(declaration_type, c_ast.PtrDecl):
+        return POINTER_SIZE, POINTER_SIZE
+    if isinstance(declaration_type, c_ast.ArrayDecl):
+        element = estimate_type_size(declaration_type.type, typedefs, structs)
+        if element is None or not isinstance(
+            declaration_type.dim, c_ast.Constant
+        ):
+            return None
+        try:
+            length = int(declaration_type.dim.value.rstrip("uUlL"), 0)
+        except ValueError:
+            return None
+        return element[0] * length, element[1]
+    if not isinstance(declaration_type, c_ast.TypeDecl):
+        return None
+
+    specifier = declaration_type.type
+    if isinstance(specifier, c_ast.IdentifierType):
+        size = estimate_basic_type_size(specifier.names)
+        return (size, size) if size is not None else None
+    if isinstance(specifier, c_ast.Enum):
+        return INTEGER_TYPE_SIZES["int"], INTEGER_TYPE_SIZES["int"]
+    if isinstance(specifier, (c_ast.Struct, c_ast.Union)):
+        if specifier.decls is None:
+            specifier = structs.get((type(specifier), specifier.name))
+        if specifier is None:
+            return None
+        return estimate_struct_size(specifier, typedefs, structs)
+    return None
+
+
+def estimate_basic_type_size(names):
+    """
+    Returns the size of a basic type given by the names of its specifiers,
+    like ["unsigned", "long"], or of a typedef name of the standard headers.
+    """
+    names = [name for name in names if name not in ("signed", "unsigned")]
+    if "_Complex" in names:
+        return None
+    if not names:
+        return INTEGER_TYPE_SIZES["int"]
+    if len(names) == 1 and names[0] in STANDARD_TYPEDEF_SIZES:
+        return STANDARD_TYPEDEF_SIZES[names[0]]
+    if "double" in names and "long" in names:
+        return LONG_DOUBLE_SIZE
+    for name, size in {**FLOATING_TYPE_SIZES, **INTEGER_TYPE_SIZES}.items():
+        if name in names and name != "int":
+            return size
+    if "long" in names:
+        return LONG_SIZE
+    if names == ["int"]:
+        return INTEGER_TYPE_SIZES["int"]
+    return None
+
+
+def estimate_struct_size(struct, typedefs, structs):
+    """
+    Returns the estimated size and alignment of a struct or union whose
+    members are known, with each member aligned as the data model requires.
+    Structs with bit fields are not estimated.
+    """
+    size, alignment = 0, 1
+    for member in struct.decls:
+        if member.bitsize is not None:
+            return None
+        member_size = estimate_type_size(member.type, typedefs, structs)
+        if member_size is None:
+            return None
+        alignment = max(alignment, member_size[1])
+        if isinstance(struct, c_ast.Union):
+            size = max(size, member_size[0])
+        else:
+            size = align_offset(size, member_size[1]) + member_size[0]
+    return align_offset(size, alignment), alignment
+
+
+def align_offset(offset, alignment):
+    return -(-offset // alignment) * alignment
+
+
+def get_type_text(declaration_type):
+    """Returns the type of a declaration as a string, without its name."""
+    return c_generator.CGenerator().visit(
+        c_ast.Typename(
+            None,
+            [],
+            None,
+            utils.rename_declaration_type(declaration_type, None),
+        )
+    )
+
+
+def order_call_struct_fields(call_struct, typedefs, structs):
+    """
+    Orders the parameter fields of a call struct by decreasing alignment, so
+    that little padding is needed between them, and then by their types, so
+    that the fields of the same type are at the same offsets in the call
+    structs of a union as far as possible. The fields whose sizes are unknown
+    come first, in their own order. The result field stays the first field,
+    as the result of a function is written to the frame by the function it
+    tail calls through the call struct of that function, which only works
+    when it is at offset 0 in every call struct, see
+    FrameLayout.generate_result_asserts.
+    """
+    fields = call_struct.type.decls
+    result_fields = [
+        field
+        for field in fields
+        if field.name == GlobalParameters.function_return_val_name
+    ]
+
+    def get_key(field):
+        size = estimate_type_size(field.type, typedefs, structs)
+        if size is None:
+            return float("-inf"), ""
+        return -size[1], get_type_text(field.type)
+
+    call_struct.type.decls = result_fields + sorted(
+        (field for field in fields if field not in result_fields), key=get_key
+    )
+
+
+def layout_block(block, typedefs, structs):
+    """
+    Orders the fields of the call structs of the block, see
+    order_call_struct_fields, and estimates the size of its union, using the
+    typedefs and structs declared at file scope, as returned by
+    utils.collect_file_scope_types. The FrameLayout is stored in the block
+    and returned.
+    """
+    struct_sizes = dict()
+    size, alignment = 0, 1
+    for function_name, function_info in block.involved_functions.items():
+        order_call_struct_fields(function_info.call_struct, typedefs, structs)
+        struct_size = estimate_struct_size(
+            function_info.call_struct.type, typedefs, structs
+        )
+        struct_sizes[function_name] = (
+            struct_size[0] if struct_size is not None else None
+        )
+        if struct_size is None or size is None:
+            size = None
+            continue
+        size = max(size, struct_size[0])
+        alignment = max(alignment, struct_size[1])
+    block.frame_layout = FrameLayout(
+        block.call_union_name,
+        size,
+        alignment if size is not None else None,
+        struct_sizes,
+    )
+    return block.frame_layout
@@ -0,0 +1,469 @@
+from pycparser import c_ast, c_generator, c_parser
+from block import Block
+import bisect
+import hashlib
+import re
+import utils
+
+# The tokens that decide where the top level declarations of the code end.
+# Comments, strings and characters are matched so that the punctuation inside
+# them is skipped.
+CHUNK_TOKEN_PATTERN = re.compile(
+    r"//[^\n]*|/\*.*?\*/|\"(?:\\.|[^\"\\\n])*\"|'(?:\\.|[^'\\\n])*'"
+    r"|[{}()\[\];=]",
+    re.DOTALL,
+)
+
+
+def split_chunks(text):
+    """
+    Splits the code into chunks of top level declarations, with each function
+    definition in its own chunk. Returns the list of the chunks, each with a
+    flag telling whether it is a function definition. The split only needs
+    to be right for ordinary code: a chunk that is cut in the wrong place
+    fails to parse, and the whole code is parsed at once instead.
+    """
+    chunks = []
+    start = depth = 0
+    last_token, last_token_end = None, 0
+    has_initializer = is_function = False
+    for match in CHUNK_TOKEN_PATTERN.finditer(text):
+        token = match.group()
+        if token[0] in "/\"'":
+            continue
+        if token in "([{":
+            if (
+                token == "{"
+                and depth == 0
+                and last_token == ")"
+                and not text[last_token_end : match.start()].strip()
+                and not has_initializer
+            ):
+                is_function = True
+            depth += 1
+        elif token in ")]}":
+            depth -= 1
+            if token == "}" and depth == 0 and is_function:
+                chunks.append((text[start : match.end()], True))
+                start = match.end()
+                has_initializer = is_function = False
+        elif depth == 0 and token == "=":
+            has_initializer = True
+        elif depth == 0 and token == ";":
+            chunks.append((text[start : match.end()], False))
+            start = match.end()
+            has_initializer = False
+        last_token, last_token_end = token, match.end()
+    if text[start:].strip():
+        chunks.append((text[start:], False))
+    return chunks
+
+
+def hash_node(node, called_functions=None):
+    """
+    Hashes the node and everything below it. The hash only depends on the
+    kinds of the nodes, their attributes and their structure, so it does not
+    change when the code is only moved around in the file or reformatted. The
+    names of the functions called by name inside the node are added to
+    called_functions if it is given.
+    """
+    parts = []
+    nodes = [("", node)]
+    while nodes:
+        child_name, current = nodes.pop()
+        parts.append(f"{child_name}:{type(current).__name__}")
+        for attribute in current.attr_names:
+            parts.append(repr(getattr(current, attribute)))
+        if (
+            called_functions is not None
+            and isinstance(current, c_ast.FuncCall)
+            and isinstance(current.name, c_ast.ID)
+        ):
+            called_functions.add(current.name.name)
+        children = current.children()
+        parts.append(str(len(children)))
+        nodes.extend(reversed(children))
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def hash_strings(*strings):
+    return hashlib.sha256("\0".join(strings).encode()).hexdigest()
+
+
+def fingerprint_function(function_definition):
+    """
+    Generates the fingerprint of a function: the hash of its declaration and
+    of the whole function, its prototype, the functions it tail calls, the
+    functions it calls anywhere in its body and the names it uses other than
+    to call them, which holds the functions whose addresses it takes. It
+    also records whether it has tail calls that are not made by name.
+    """
+    called_functions = set()
+    signature_hash = hash_node(function_definition.decl)
+    body_hash = hash_node(function_definition.body, called_functions)
+    tail_calls = []
+    has_indirect_tail_calls = False
+    for tail_call in utils.find_function_tail_calls(function_definition):
+        if not isinstance(tail_call.name, c_ast.ID):
+            has_indirect_tail_calls = True
+        elif tail_call.name.name not in tail_calls:
+            tail_calls.append(tail_call.name.name)
+    return {
+        "name": function_definition.decl.name,
+        "prototype": c_generator.CGenerator().visit(function_definition.decl),
+        "hash": hash_strings(signature_hash, body_hash),
+        "signature": signature_hash,
+        "tail_calls": tail_calls,
+        "indirect_tail_calls": has_indirect_tail_calls,
+        "calls": sorted(called_functions),
+        "references": sorted(
+            utils.find_address_taken_names(function_definition.body)
+        ),
+    }
+
+
+def generate_stub_body(fingerprint):
+    """
+    Generates the body of a function that was not parsed again because it did
+    not change. It only has the tail calls of the original body, in the same
+    order, so that the tail call graph and the involved functions found from
+    it are the same, after an expression that uses the names the original
+    body uses other than to call them, so that the same functions are found
+    to have their addresses taken. It is never part of the result.
+    """
+    items = []
+    if fingerprint["references"]:
+        items.append(
+            c_ast.ExprList(
+                [c_ast.ID(name) for name in fingerprint["references"]]
+            )
+        )
+    items.extend(
+        c_ast.Return(c_ast.FuncCall(c_ast.ID(name), None))
+        for name in fingerprint["tail_calls"]
+    )
+    return c_ast.Compound(items)
+
+
+class FragmentGenerator(utils.CodeGenerator):
+    """
+    A code generator that reuses the source code generated for a node in a
+    previous run when the node has a fragment key that was generated before.
+    The source code generated by CodeGenerator only depends on the node and
+    the indentation, so a fragment is valid as long as its key covers
+    everything its node was generated from.
+    """
+
+    def __init__(self, fragment_keys, previous_fragments):
+        super().__init__()
+        self.fragment_keys = fragment_keys
+        self.previous_fragments = previous_fragments
+        self.fragments = dict()
+
+    def visit(self, node):
+        key = self.fragment_keys.get(id(node))
+        if key is None:
+            return super().visit(node)
+        text = self.previous_fragments.get(key)
+        if text is None:
+            text = super().visit(node)
+        self.fragments[key] = text
+        return text
+
+
+class IncrementalState:
+    """
+    The state kept between the runs of the tail call elimination process on
+    the same file, so that only the parts of the result that depend on
+    changed code are parsed and generated again.
+
+    The code is split into chunks of top level declarations and function
+    definitions. Every function is fingerprinted with a hash of its AST and
+    its tail call edges, and the fingerprint is stored under the hash of the
+    text of its chunk. On the next run, a function whose chunk did not change
+    is parsed from its prototype only and given a stub body with the same
+    tail calls, which is enough to find the involved functions.
+
+    Every piece of the result that is generated from a function, like its
+    case in the block function, its call struct, its wrapper or the loop it
+    is rewritten into, is stored under a key made of the fingerprints it
+    depends on. The case of a function depends on the functions it tail
+    calls in the same block, so changing the signature of a function
+    regenerates the cases of its callers as well. The body of a function
+    that was not parsed is only parsed when one of its pieces has to be
+    generated again. Only the chunks and pieces used by the last run are
+    kept.
+    """
+
+    def __init__(self, previous=None, file_scope=None):
+        previous = previous or dict()
+        self.file_scope = file_scope or dict()
+        self.previous_chunks = previous.get("chunks", dict())
+        self.previous_fragments = previous.get("fragments", dict())
+        self.chunks = dict()
+        self.functions = dict()
+        self.ext_hashes = dict()
+        self.stub_chunks = dict()
+        self.typedef_positions = []
+        self.fragment_keys = dict()
+        self.case_keys = dict()
+        self.generator = None
+
+    def parse(self, code, filename="<source>"):
+        """
+        Parses the code, except for the bodies of the functions whose chunks
+        did not change, and fingerprints every top level declaration. If the
+        code cannot be parsed in chunks, it is parsed at once and nothing is
+        reused.
+        """
+        chunks = split_chunks(code)
+        pieces, chunk_lines = [], []
+        line = 1
+        for text, is_function in chunks:
+            key = hash_strings(text)
+            fingerprint = (
+                self.previous_chunks.get(key) if is_function else None
+            )
+            piece = text if fingerprint is None else fingerprint["prototype"]
+            pieces.append(piece + ";\n" if fingerprint else piece + "\n")
+            chunk_lines.append(line)
+            line += pieces[-1].count("\n")
+        try:
+            ast = utils.parse("".join(pieces), filename, self.file_scope)
+        except c_parser.ParseError:
+            self.previous_chunks = dict()
+            return self.parse_without_chunks(code, filename)
+
+        items_of_chunks = [[] for _ in chunks]
+        for item in ast.ext:
+            chunk_index = bisect.bisect_right(chunk_lines, item.coord.line) - 1
+            items_of_chunks[chunk_index].append(item)
+        for (text, is_function), items in zip(chunks, items_of_chunks):
+            fingerprint = self.previous_chunks.get(hash_strings(text))
+            if (
+                is_function
+                and fingerprint is not None
+                and (len(items) != 1 or items[0].name != fingerprint["name"])
+            ):
+                self.previous_chunks = dict()
+                return self.parse_without_chunks(code, filename)
+
+        ext = []
+        for (text, is_function), items in zip(chunks, items_of_chunks):
+            key = hash_strings(text)
+            if is_function and key in self.previous_chunks:
+                fingerprint = self.previous_chunks[key]
+                item = c_ast.FuncDef(
+                    items[0], None, generate_stub_body(fingerprint)
+                )
+                self.stub_chunks[fingerprint["name"]] = (text, len(ext))
+                self.add_function(item, fingerprint)
+                self.chunks[key] = fingerprint
+                ext.append(item)
+                continue
+            for item in items:
+                if isinstance(item, c_ast.FuncDef):
+                    fingerprint = fingerprint_function(item)
+                    self.add_function(item, fingerprint)
+                    if is_function and len(items) == 1:
+                        self.chunks[key] = fingerprint
+                else:
+                    self.add_declaration(item, len(ext))
+                ext.append(item)
+        ast.ext = ext
+        self.load_indirect_tail_calls(ast)
+        return ast
+
+    def load_indirect_tail_calls(self, ast):
+        """
+        Parses the bodies of the functions that were only parsed from their
+        prototypes and may have tail calls through function pointers, which
+        stub bodies do not have, if any function of the code has its address
+        taken. These are the functions with tail calls that are not made by
+        name, or that are made by a name that is not declared as a function.
+        """
+        if not self.stub_chunks:
+            return
+        func_def_map = utils.get_functions_def_map(ast)
+        if not utils.find_address_taken_functions(ast, func_def_map):
+            return
+        function_names = set(func_def_map)
+        for item in ast.ext:
+            if isinstance(item, c_ast.Decl) and isinstance(
+                item.type, c_ast.FuncDecl
+            ):
+                function_names.add(item.name)
+        for function_name in list(self.stub_chunks):
+            fingerprint = self.functions[function_name]
+            if fingerprint["indirect_tail_calls"] or any(
+                callee not in function_names
+                for callee in fingerprint["tail_calls"]
+            ):
+                self.load_body(func_def_map[function_name])
+
+    def parse_without_chunks(self, code, filename):
+        ast = utils.parse(code, filename, self.file_scope)
+        for position, item in enumerate(ast.ext):
+            if isinstance(item, c_ast.FuncDef):
+                self.add_function(item, fingerprint_function(item))
+            else:
+                self.add_declaration(item, position)
+        return ast
+
+    def add_function(self, function_definition, fingerprint):
+        self.functions[fingerprint["name"]] = fingerprint
+        self.ext_hashes[id(function_definition)] = fingerprint["hash"]
+
+    def add_declaration(self, declaration, position):
+        self.ext_hashes[id(declaration)] = hash_node(declaration)
+        if isinstance(declaration, c_ast.Typedef):
+            self.typedef_positions.append((position, declaration.name))
+
+    def load_body(self, function_definition):
+        """
+        Parses the body of a function that was only parsed from its prototype,
+        with the typedef names declared before it and in the included headers.
+        """
+        function_name = function_definition.decl.name
+        if function_name not in self.stub_chunks:
+            return
+        text, position = self.stub_chunks.pop(function_name)
+        file_scope = dict(self.file_scope)
+        for typedef_position, name in self.typedef_positions:
+            if typedef_position < position:
+                file_scope[name] = True
+        ast = utils.get_parser().parse_part(text, file_scope)
+        function_definition.body = ast.ext[0].body
+
+    def reuse_loop_function(self, function_definition):
+        """
+        Registers the loop the function is rewritten into. Returns True if it
+        was generated before, in which case it does not need to be generated
+        again.
+        """
+        fingerprint = self.functions[function_definition.decl.name]
+        key = hash_strings("loop", fingerprint["hash"])
+        self.fragment_keys[id(function_definition)] = key
+        if key in self.previous_fragments:
+            return True
+        self.load_body(function_definition)
+        return False
+
+    def get_case_key(self, function_name, block, options):
+        fingerprint = self.functions[function_name]
+        parts = [
+            "case",
+            fingerprint["hash"],
+            block.name,
+            block.call_union_name,
+            Block.choose_dispatch(block.involved_functions, options.dispatch),
+        ]
+        function_info = block.involved_functions[function_name]
+        parts.append(str(function_info.jumped_to))
+        parts.append(
+            str(function_info is next(iter(block.involved_functions.values())))
+        )
+        for callee in fingerprint["tail_calls"]:
+            if callee in block.involved_functions:
+                parts.append(callee)
+                parts.append(self.functions[callee]["signature"])
+        indirect_tail_calls = block.involved_functions[
+            function_name
+        ].indirect_tail_calls
+        for indirect_tail_call in indirect_tail_calls.values():
+            parts.append(
+                c_generator.CGenerator().visit(
+                    c_ast.Typename(
+                        None,
+                        [],
+                        None,
+                        utils.rename_declaration_type(
+                            indirect_tail_call.pointer_type, None
+                        ),
+                    )
+                )
+            )
+            for candidate in indirect_tail_call.candidates:
+                parts.append(candidate)
+                parts.append(self.functions[candidate]["signature"])
+        return hash_strings(*parts)
+
+    def prepare_block(self, block, options):
+        """
+        Finds the cases of the block function that were generated before and
+        empties the bodies of their functions, so that generating the block
+        function does not rewrite them again. The bodies are replaced by the
+        wrappers afterwards anyway. The functions called inside the block
+        function are recorded in the block, as they can no longer be found in
+        the emptied cases. It must be called before the block function is
+        generated.
+        """
+        block.called_functions = set()
+        for function_name, function_info in block.involved_functions.items():
+            fingerprint = self.functions[function_name]
+            block.called_functions.update(fingerprint["calls"])
+            key = self.get_case_key(function_name, block, options)
+            if key in self.previous_fragments:
+                function_info.function_definition.body.block_items = []
+            else:
+                self.load_body(function_info.function_definition)
+            self.case_keys[function_info.block_label] = key
+
+    def register_block(self, block):
+        """
+        Registers the cases, call structs and wrappers of the block. It must
+        be called after the block function is generated.
+        """
+        for function_info in block.involved_functions.values():
+            self.fragment_keys[id(function_info.block_statement)] = (
+                self.case_keys[function_info.block_label]
+            )
+        for function_name, function_info in block.involved_functions.items():
+            fingerprint = self.functions[function_name]
+            self.fragment_keys[id(function_info.call_struct)] = hash_strings(
+                "struct",
+                fingerprint["signature"],
+                *(
+                    field.name
+                    for field in function_info.call_struct.type.decls
+                ),
+            )
+            self.fragment_keys[id(function_info.function_definition)] = (
+                hash_strings(
+                    "wrapper",
+                    fingerprint["signature"],
+                    block.name,
+                    block.call_union_name,
+                )
+            )
+
+    def create_generator(self, ast):
+        """
+        Creates the code generator of the result. The top level declarations
+        and functions that are not registered as a piece of a block or a loop
+        are keyed by their own hash, and the bodies of the functions among
+        them that were not generated before are parsed.
+        """
+        for item in ast.ext:
+            if (
+                id(item) in self.fragment_keys
+                or id(item) not in self.ext_hashes
+            ):
+                continue
+            key = hash_strings("ext", self.ext_hashes[id(item)])
+            self.fragment_keys[id(item)] = key
+            if (
+                isinstance(item, c_ast.FuncDef)
+                and key not in self.previous_fragments
+            ):
+                self.load_body(item)
+        self.generator = FragmentGenerator(
+            self.fragment_keys, self.previous_fragments
+        )
+        return self.generator
+
+    def to_dict(self):
+        return {
+            "chunks": self.chunks,
+            "fragments": self.generator.fragments if self.generator else {},
+        }
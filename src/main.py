@@ -1,51 +1,732 @@
 import utils
 import os
-from pycparser import parse_file
-from block import Block
-from new_functions import NewFunctions
+import argparse
+import io
+import profiling
+import shlex
 import sys
 
+# The modules that only some of the modes need, like the batch conversion or
+# the cache, are imported by the functions that use them, and so are the
+# modules that generate the block functions, which a cached result does not
+# need. Converting a single file, often started by a build system for every
+# file, does not pay for loading them.
 
-def remove_tail_calls(filename):
+
+def transform_source(
+    source,
+    options=None,
+    cache=None,
+    filename="<source>",
+    report=None,
+    result=None,
+):
+    """
+    Calls all the functions for the steps of the tail call elimination process
+    on the given source code and returns the resulting source code. Nothing is
+    written to disk: the directives are removed in memory and the rest of the
+    code is given directly to a parser that is reused between calls.
+    """
+    stream = io.StringIO()
+    write_transformed_source(
+        stream, source, options, cache, filename, report, result
+    )
+    return stream.getvalue()
+
+
+def write_transformed_source(
+    stream,
+    source,
+    options=None,
+    cache=None,
+    filename="<source>",
+    report=None,
+    result=None,
+):
     """
-    Calls all the functions for the steps of the tail call elimination process.
+    Calls all the functions for the steps of the tail call elimination process
+    on the given source code and writes the resulting source code to the
+    stream one top level declaration at a time. If a cache is given and it
+    already has the result for the source code, the result is taken from the
+    cache instead, and otherwise the result is also kept in memory to be
+    stored in it. If the cache is incremental, the parts of the result that
+    do not depend on code that changed since the previous run on the same
+    file are taken from its incremental state. If a utils.TailCallReport is
+    given, the calls in tail position that could not be eliminated are
+    written to it. The whole code is parsed to find them, so neither the
+    cached result nor the incremental state is used. The same goes for an
+    api.TransformResult, which the blocks and the tail calls are recorded in
+    if it is given. With execution profiles, the incremental state is not used
+    either, as the profile changes the functions of the blocks.
     """
-    temp_filename = f"{filename[:-2]}_temp.c"
-    directives = utils.remove_and_save_directives(filename, temp_filename)
+    options = options or utils.TransformOptions()
+    tracked = report is not None or result is not None
+    line_numbers = [] if tracked or options.pgo_profiles is not None else None
+    with profiling.phase("strip_directives"):
+        directives, code = utils.split_directives(
+            source.splitlines(keepends=True), line_numbers
+        )
+
+    prelude_text = None
+    if options.preprocessor is not None and directives:
+        import prelude
 
-    ast = parse_file(temp_filename)
-    func_def_map = utils.get_functions_def_map(ast)
-    involved_functions = utils.identify_involved_functions(ast, func_def_map)
-    block_call_union = Block.generate_block_call_union(involved_functions)
-    block_function = Block.generate_block_function(
-        involved_functions, func_def_map
+        with profiling.phase("prelude"):
+            prelude_text = prelude.preprocess_directives(
+                directives, options.preprocessor, filename
+            )
+
+    if cache is not None:
+        cache_key = cache.generate_key(
+            directives, code, options, filename, prelude_text
+        )
+        cached_content = cache.get(cache_key) if not tracked else None
+        if cached_content is not None:
+            profiling.count("cache_hits")
+            stream.write(cached_content)
+            return
+
+    file_scope = None
+    if prelude_text is not None:
+        with profiling.phase("prelude"):
+            file_scope = prelude.parse_file_scope(prelude_text, cache)
+
+    state = None
+    with profiling.phase("parse"):
+        if (
+            cache is not None
+            and cache.incremental
+            and not tracked
+            and not options.accumulate
+            and options.pgo_profiles is None
+        ):
+            import incremental
+
+            state_key = cache.generate_state_key(
+                filename, options, prelude_text
+            )
+            state = incremental.IncrementalState(
+                cache.get_state(state_key), file_scope
+            )
+            ast = state.parse("".join(code), filename)
+        else:
+            ast = utils.parse("".join(code), filename, file_scope)
+    tail_calls = [] if tracked else None
+    blocks = eliminate_tail_calls(
+        ast,
+        options,
+        state,
+        tail_calls=tail_calls,
+        line_numbers={filename: line_numbers} if line_numbers else None,
     )
-    NewFunctions.change_function_definitions(
-        involved_functions, block_call_union
+    if report is not None:
+        report.write(filename, tail_calls, line_numbers)
+    if result is not None:
+        result.record(blocks, tail_calls, line_numbers)
+
+    with profiling.phase("code_generation"):
+        visitor = state.create_generator(ast) if state is not None else None
+        if cache is None:
+            utils.write_result(stream, directives, blocks, ast, visitor)
+            return
+        file_content = utils.generate_result(directives, blocks, ast, visitor)
+        stream.write(file_content)
+    cache.put(cache_key, file_content)
+    if state is not None:
+        cache.put_state(state_key, state.to_dict())
+
+
+def eliminate_tail_calls(
+    ast,
+    options,
+    state=None,
+    func_def_map=None,
+    tail_calls=None,
+    line_numbers=None,
+):
+    """
+    Eliminates the tail calls of the functions of the AST, which is changed
+    in place, and returns the blocks that hold the generated block functions.
+    Only the functions of func_def_map are considered, which are all the
+    functions defined in the AST unless it is given. The hooks of the
+    incremental state are called along the way if one is given. If a list
+    of tail_calls is given, the calls in tail position of the functions are
+    appended to it as utils.TailCall instances, with the reason each of them
+    could not be eliminated. If the options have execution profiles, the
+    blocks are prepared with them by pgo.apply_profile, which is given the
+    line_numbers of each file.
+    """
+    from block import Block
+    from new_functions import NewFunctions
+    import frame_layout
+
+    if func_def_map is None:
+        with profiling.phase("function_map"):
+            func_def_map = utils.get_functions_def_map(ast)
+    if options.accumulate:
+        import accumulator
+
+        with profiling.phase("accumulation"):
+            accumulated_functions = accumulator.introduce_accumulators(
+                ast, func_def_map
+            )
+    with profiling.phase("involved_functions"):
+        blocks, loop_functions = utils.partition_involved_functions(
+            ast, func_def_map, options
+        )
+    if tail_calls is not None:
+        declarations, _, _ = utils.collect_file_scope_types(ast)
+        tail_calls.extend(
+            utils.classify_tail_calls(
+                func_def_map, blocks, loop_functions, declarations
+            )
+        )
+    if options.pgo_profiles is not None:
+        import pgo
+
+        with profiling.phase("pgo"):
+            profile = pgo.load_profile(options.pgo_profiles)
+            for block in blocks:
+                pgo.apply_profile(block, profile, line_numbers)
+    profiling.count("functions", len(func_def_map))
+    profiling.count("blocks", len(blocks))
+    profiling.count("loop_functions", len(loop_functions))
+    profiling.count(
+        "involved_functions",
+        sum(len(block.involved_functions) for block in blocks),
     )
 
-    utils.write_result_to_disk(
-        directives,
-        involved_functions,
-        block_call_union,
-        block_function,
-        ast,
-        filename,
+    for function_definition in loop_functions:
+        with profiling.phase("block_generation"):
+            if state is None or not state.reuse_loop_function(
+                function_definition
+            ):
+                Block.generate_loop_function(function_definition)
+    with profiling.phase("frame_layout"):
+        _, typedefs, structs = utils.collect_file_scope_types(ast)
+        for block in blocks:
+            frame_layout.layout_block(block, typedefs, structs)
+    for block in blocks:
+        with profiling.phase("block_generation"):
+            if state is not None:
+                state.prepare_block(block, options)
+            block.call_union = Block.generate_block_call_union(
+                block.involved_functions, block.call_union_name
+            )
+            block.function = Block.generate_block_function(
+                block.involved_functions,
+                block.name,
+                block.call_union_name,
+                options,
+            )
+        with profiling.phase("wrapper_rewrite"):
+            NewFunctions.change_function_definitions(
+                block.involved_functions,
+                block.call_union,
+                block.name,
+                options.frame_abi,
+            )
+        if state is not None:
+            state.register_block(block)
+    if options.accumulate:
+        accumulator.remove_unused_accumulator_functions(
+            ast, blocks, accumulated_functions
+        )
+    return blocks
+
+
+def remove_tail_calls(
+    filename, options=None, cache=None, profile=None, report=None
+):
+    """
+    Removes the tail calls of the given file and writes the result beside it
+    with "_removed" appended to its name. If a profiling.ProfileOutput is
+    given, the conversion is profiled and the results are saved to it. If a
+    utils.TailCallReport is given, the tail calls that could not be
+    eliminated are written to it.
+    """
+    if profile is not None:
+        return profile.run(
+            filename,
+            remove_tail_calls,
+            filename,
+            options,
+            cache,
+            report=report,
+        )
+    with open(filename) as file:
+        source = file.read()
+    with utils.open_output_file(filename) as file:
+        write_transformed_source(
+            file, source, options, cache, filename, report
+        )
+        with profiling.phase("write"):
+            file.flush()
+
+
+def parse_arguments(argv):
+    """Parses the command line arguments of the program."""
+    parser = argparse.ArgumentParser(
+        description="Removes the tail calls of C source files. The result of "
+        "each file is written beside it with '_removed' appended to its name."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="C source files, directories (searched recursively) or glob "
+        "patterns of the files to be converted, or - to read a single file "
+        "from the standard input and write the result to the standard output",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="file the result of a single input is written to instead of "
+        "beside it, or - for the standard output",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes used when converting more than one "
+        "file (default: the number of available cores)",
+    )
+    parser.add_argument(
+        "--whole-program",
+        action="store_true",
+        help="convert the inputs as the files of one program, so that the "
+        "recursion cycles that span several files are merged into block "
+        "functions of a shared file, and the functions in their own files "
+        "call into it",
+    )
+    parser.add_argument(
+        "--blocks-output",
+        default=None,
+        help="file the block functions shared by the files of the program "
+        "are written to with --whole-program (default: "
+        "tail_call_blocks_removed.c in the directory that holds all the "
+        "inputs)",
+    )
+    parser.add_argument(
+        "--partition",
+        choices=utils.TransformOptions.partition_strategies,
+        default="single",
+        help="merge every function involved in a tail call into one block "
+        "function (single), or generate one block function per recursion "
+        "cycle and leave the other tail calls as plain calls (scc)",
+    )
+    parser.add_argument(
+        "--dispatch",
+        choices=utils.TransformOptions.dispatch_strategies,
+        default="switch",
+        help="how the block function jumps to the function it is called for: "
+        "a switch statement, a computed goto (GCC and Clang only), a chain "
+        "of if statements, or a choice based on the number of functions",
+    )
+    parser.add_argument(
+        "--frame-abi",
+        choices=utils.TransformOptions.frame_abis,
+        default="copy",
+        help="how the arguments are passed inside the block function: "
+        "through the call structs of the frame (copy), or in locals of the "
+        "block function that tail calls assign directly (direct)",
+    )
+    parser.add_argument(
+        "--no-loop-rewrite",
+        dest="loop_rewrite",
+        action="store_false",
+        help="merge functions that only tail call themselves into a block "
+        "function instead of rewriting them into loops",
+    )
+    parser.add_argument(
+        "--accumulate",
+        action="store_true",
+        help="rewrite functions whose recursive calls are combined with "
+        "their results by an associative operator, like n * fact(n - 1), "
+        "into tail recursive functions with an accumulator",
+    )
+    parser.add_argument(
+        "--pgo",
+        dest="pgo_profiles",
+        metavar="PROFILE",
+        action="append",
+        help="order the functions of the block functions by how often they "
+        "run in an execution profile of the program, and mark the hot and "
+        "cold ones and the rarely taken branches for the compiler. The "
+        "profile is a gcov JSON file (gcov --json-format), a .gcov file "
+        "(gcov -b) or lines of a function name and its number of calls. "
+        "Can be given several times, the counts are summed",
+    )
+    parser.add_argument(
+        "--preprocess",
+        action="store_true",
+        help="expand the directives with the C preprocessor and parse the "
+        "code with the types declared by the included headers. The expanded "
+        "headers are parsed once per process, and once for all runs with "
+        "--cache",
+    )
+    parser.add_argument(
+        "--cpp",
+        default="cpp",
+        help="command of the C preprocessor used by --preprocess (default: "
+        "cpp)",
+    )
+    parser.add_argument(
+        "-I",
+        dest="include_directories",
+        action="append",
+        default=[],
+        metavar="DIRECTORY",
+        help="directory searched for the included headers (implies "
+        "--preprocess)",
+    )
+    parser.add_argument(
+        "-D",
+        dest="defines",
+        action="append",
+        default=[],
+        metavar="NAME[=VALUE]",
+        help="macro defined for the preprocessor (implies --preprocess)",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="PATH",
+        help="profile the conversion of each file and save the results to "
+        "PATH: a JSON line per file with the time and memory of each phase "
+        "and counters of the work done, or a directory of cProfile dumps",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=profiling.ProfileOutput.formats,
+        default="json",
+        help="format of the results of --profile (default: json)",
+    )
+    parser.add_argument(
+        "--tail-call-report",
+        default=None,
+        metavar="PATH",
+        help="append a JSON line per file to PATH with the number of calls "
+        "in tail position, the number eliminated and the reason each of the "
+        "others was not",
+    )
+    parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help="only analyze the tail calls of the inputs and write a report "
+        "of each to --output or the standard output: the tail call graph, "
+        "the recursion cycles, the block functions, the calls that cannot be "
+        "eliminated and the estimated stack saved by the others",
+    )
+    parser.add_argument(
+        "--analysis-format",
+        choices=("json", "dot"),
+        default="json",
+        help="format of the reports of --analyze: a JSON line or a Graphviz "
+        "graph per file (default: json)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse the results of previous runs for files whose contents "
+        "did not change",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="directory of the cache (implies --cache, default: "
+        "$TCE_CACHE_DIR or ~/.cache/tail_call_elimination)",
     )
-    os.remove(temp_filename)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="keep the parts of the result generated for each function in "
+        "the cache and only generate again the parts that depend on changed "
+        "functions (implies --cache)",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=None,
+        help="maximum size of the cache in megabytes, the least recently "
+        "used results are evicted beyond it (default: 256)",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="print the number of entries and the size of the cache",
+    )
+    parser.add_argument(
+        "--cache-clear",
+        action="store_true",
+        help="remove every entry of the cache",
+    )
+    return parser.parse_args(argv)
 
 
-if __name__ == "__main__":
-    if len(sys.argv) > 2:
+def create_cache(arguments):
+    """Creates the cache requested by the command line arguments, if any."""
+    if not (
+        arguments.cache
+        or arguments.incremental
+        or arguments.cache_dir
+        or arguments.cache_stats
+        or arguments.cache_clear
+    ):
+        return None
+    import cache as cache_module
+
+    max_size = (
+        arguments.cache_max_size * 1024 * 1024
+        if arguments.cache_max_size is not None
+        else None
+    )
+    return cache_module.TransformationCache(
+        arguments.cache_dir, max_size, arguments.incremental
+    )
+
+
+def create_profile_output(arguments):
+    """Creates the profile output requested by the arguments, if any."""
+    if arguments.profile is None:
+        return None
+    return profiling.ProfileOutput(arguments.profile, arguments.profile_format)
+
+
+def create_report(arguments):
+    """Creates the tail call report requested by the arguments, if any."""
+    if arguments.tail_call_report is None:
+        return None
+    return utils.TailCallReport(arguments.tail_call_report)
+
+
+def create_options(arguments):
+    """Creates the transform options given by the command line arguments."""
+    preprocessor = None
+    if (
+        arguments.preprocess
+        or arguments.include_directories
+        or arguments.defines
+    ):
+        preprocessor = [
+            *shlex.split(arguments.cpp),
+            *(f"-I{directory}" for directory in arguments.include_directories),
+            *(f"-D{define}" for define in arguments.defines),
+        ]
+    return utils.TransformOptions(
+        partition=arguments.partition,
+        loop_rewrite=arguments.loop_rewrite,
+        dispatch=arguments.dispatch,
+        preprocessor=preprocessor,
+        frame_abi=arguments.frame_abi,
+        accumulate=arguments.accumulate,
+        pgo_profiles=arguments.pgo_profiles,
+    )
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    options = create_options(arguments)
+    cache = create_cache(arguments)
+    if arguments.cache_clear:
+        print(f"Removed {cache.clear()} cache entries.")
+    if arguments.cache_stats:
+        stats = cache.get_stats()
         print(
-            "Wrong number of arguments. The only accepted argument is the "
-            "address of the input source file to be converted."
+            f"Cache {stats['directory']}: {stats['entries']} entries, "
+            f"{stats['size']} of {stats['max_size']} bytes"
         )
-    elif len(sys.argv) < 2:
+    if not arguments.inputs:
+        if arguments.cache_clear or arguments.cache_stats:
+            return 0
         print("Input file not given.")
+        return 1
+    if options.pgo_profiles is not None:
+        import pgo
+
+        try:
+            pgo.load_profile(options.pgo_profiles)
+        except (OSError, ValueError) as error:
+            print(
+                f"Cannot load the execution profile: {error}", file=sys.stderr
+            )
+            return 1
+
+    try:
+        return convert_inputs(arguments, options, cache)
+    finally:
+        if cache is not None:
+            cache.evict()
+
+
+def convert_inputs(arguments, options, cache):
+    """Removes the tail calls of all the inputs given on the command line."""
+    if arguments.analyze:
+        return analyze_inputs(arguments, options)
+    if len(arguments.inputs) == 1 and (
+        arguments.inputs[0] == "-" or arguments.output is not None
+    ):
+        return convert_single_input(arguments, options, cache)
+    if arguments.output is not None or "-" in arguments.inputs:
+        print("The standard input and --output accept a single input only.")
+        return 1
+
+    if arguments.whole_program:
+        return convert_program(arguments, options)
+
+    if len(arguments.inputs) == 1 and os.path.isfile(arguments.inputs[0]):
+        remove_tail_calls(
+            filename=arguments.inputs[0],
+            options=options,
+            cache=cache,
+            profile=create_profile_output(arguments),
+            report=create_report(arguments),
+        )
+        return 0
+
+    import batch
+
+    filenames, missing_inputs = batch.collect_source_files(arguments.inputs)
+    for missing_input in missing_inputs:
+        print(f"Input file does not exist: {missing_input}")
+    if not filenames:
+        print("No input files found.")
+        return 1
+
+    failed = batch.report_results(
+        batch.transform_files(
+            filenames,
+            jobs=arguments.jobs,
+            options=options,
+            cache=cache,
+            profile=create_profile_output(arguments),
+            report=create_report(arguments),
+        )
+    )
+    return 1 if failed or missing_inputs else 0
+
+
+def analyze_inputs(arguments, options):
+    """
+    Writes the analysis report of each input given on the command line to
+    the file given by --output, or to the standard output, without
+    converting them. The messages go to the standard error, so that they do
+    not mix with the reports.
+    """
+    import analysis
+    import batch
+
+    if "-" in arguments.inputs:
+        if len(arguments.inputs) > 1:
+            print("The standard input accepts a single input only.")
+            return 1
+        filenames, missing_inputs = ["-"], []
+    else:
+        filenames, missing_inputs = batch.collect_source_files(
+            arguments.inputs
+        )
+    for missing_input in missing_inputs:
+        print(f"Input file does not exist: {missing_input}", file=sys.stderr)
+    if not filenames:
+        print("No input files found.", file=sys.stderr)
+        return 1
+
+    if arguments.output is None or arguments.output == "-":
+        stream = sys.stdout
     else:
-        filename = sys.argv[1]
-        if os.path.exists(filename):
-            remove_tail_calls(filename=filename)
+        stream = open(arguments.output, "w")
+    try:
+        for filename in filenames:
+            if filename == "-":
+                source = sys.stdin.read()
+                filename = "<stdin>"
+            else:
+                with open(filename) as file:
+                    source = file.read()
+            analysis.write_report(
+                stream,
+                analysis.analyze_source(source, options, filename),
+                arguments.analysis_format,
+            )
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 1 if missing_inputs else 0
+
+
+def convert_program(arguments, options):
+    """
+    Removes the tail calls of the inputs given on the command line as the
+    files of one program.
+    """
+    import batch
+    import whole_program
+
+    filenames, missing_inputs = batch.collect_source_files(arguments.inputs)
+    for missing_input in missing_inputs:
+        print(f"Input file does not exist: {missing_input}")
+    if not filenames:
+        print("No input files found.")
+        return 1
+
+    cycles = whole_program.remove_tail_calls(
+        filenames,
+        options=options,
+        jobs=arguments.jobs,
+        blocks_filename=arguments.blocks_output,
+    )
+    for cycle in cycles:
+        functions = ", ".join(cycle.function_names)
+        if cycle.reason is None:
+            print(f"MOVED\t{functions}")
         else:
-            print("Input file does not exist.")
+            print(f"KEPT\t{functions}: {cycle.reason}")
+    print(f"{len(filenames)} file(s) converted.")
+    return 1 if missing_inputs else 0
+
+
+def convert_single_input(arguments, options, cache):
+    """
+    Removes the tail calls of a single input that is read from the standard
+    input or whose result is written to the file given by --output. Either of
+    them can be - for the standard input or output, which lets the program be
+    used as a filter without touching the disk.
+    """
+    filename = arguments.inputs[0]
+    if filename == "-":
+        source = sys.stdin.read()
+        filename = "<stdin>"
+    elif os.path.isfile(filename):
+        with open(filename) as file:
+            source = file.read()
+    else:
+        print("Input file does not exist.", file=sys.stderr)
+        return 1
+
+    profile = create_profile_output(arguments)
+    report = create_report(arguments)
+    if profile is not None:
+        file_content = profile.run(
+            filename,
+            transform_source,
+            source,
+            options,
+            cache,
+            filename,
+            report,
+        )
+    else:
+        file_content = transform_source(
+            source, options, cache, filename, report
+        )
+    if arguments.output is None or arguments.output == "-":
+        sys.stdout.write(file_content)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(file_content)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,13 +13,23 @@ class NewFunctions:
     """
 
     @staticmethod
-    def change_function_definitions(involved_functions, block_call_union):
+    def change_function_definitions(
+        involved_functions,
+        block_call_union,
+        block_name=GlobalParameters.block_name,
+        frame_abi="copy",
+    ):
         """
         Changes the definitions of involved functions so that they call the
         block function with correct inputs and returns the result. This helps
         so that the code that calls these function will not be affected by the
         tail call elimination and the external interface of the functions
-        remain the same.
+        remain the same. With the direct frame ABI, the static ones among them
+        are made inline as well, so that their callers do not pay for a call
+        that only forwards the arguments to the block function. The ones that
+        are cold in the execution profile the block was generated with are
+        marked cold, so that their callers treat the paths to them as
+        unlikely.
         """
         block_call_union_instance = Block.generate_block_call_union_instance(
             block_call_union
@@ -31,16 +41,34 @@ class NewFunctions:
             )
             block_items.append(
                 Block.generate_block_call_stmt(
-                    involved_functions[function].index_label
+                    involved_functions[function].index_label, block_name
                 )
             )
-            block_items.append(
-                NewFunctions.generate_return_stmt_in_new_functions(function)
-            )
+            if not involved_functions[function].returns_void:
+                block_items.append(
+                    NewFunctions.generate_return_stmt_in_new_functions(
+                        function
+                    )
+                )
 
-            involved_functions[
+            function_definition = involved_functions[
                 function
-            ].function_definition.body.block_items = block_items
+            ].function_definition
+            function_definition.body.block_items = block_items
+            if (
+                frame_abi == "direct"
+                and "static" in function_definition.decl.storage
+                and "inline" not in function_definition.decl.funcspec
+            ):
+                function_definition.decl.funcspec = [
+                    *function_definition.decl.funcspec,
+                    "inline",
+                ]
+            if involved_functions[function].hotness == "cold":
+                function_definition.decl.funcspec = [
+                    *function_definition.decl.funcspec,
+                    "__attribute__((cold))",
+                ]
 
     @staticmethod
     def generate_params_assignments_in_frame(block_items, function_info):
@@ -0,0 +1,269 @@
+from pycparser import c_ast
+import gzip
+import json
+import os
+import re
+import utils
+
+# A function is hot when it runs at least this fraction of the times the
+# hottest function of the profile runs, and cold when it runs at most this
+# fraction of them
+HOT_FUNCTION_FRACTION = 0.1
+COLD_FUNCTION_FRACTION = 0.001
+# A branch of an if statement is unlikely when it is taken at most this
+# fraction of the times the if statement runs
+UNLIKELY_BRANCH_FRACTION = 0.01
+
+# The lines of a .gcov file: the execution count of a line of the source,
+# which is - for the lines without code and ##### or ===== for the lines that
+# never ran, followed by the number of the line. The counts of the lines
+# that ran only partly end with a *.
+GCOV_LINE_PATTERN = re.compile(r"^\s*(-|#####|=====|\d+)\*?:\s*(\d+):")
+GCOV_FUNCTION_PATTERN = re.compile(r"^function (\S+) called (\d+)")
+GCOV_SOURCE_PATTERN = re.compile(r"^\s*-:\s*0:Source:(.*)$")
+
+# The profiles loaded by this process, by the paths, modification times and
+# sizes of their files
+loaded_profiles = dict()
+
+
+class ExecutionProfile:
+    """
+    A class used to store the counts of an execution of the program: the
+    number of times each function was called, by name, and the number of
+    times each line of the sources ran, by the name of the source file,
+    without its directory, and the number of the line.
+    """
+
+    def __init__(self, function_counts=None, line_counts=None):
+        self.function_counts = function_counts or dict()
+        self.line_counts = line_counts or dict()
+
+    def merge(self, profile):
+        """Adds the counts of another profile, like one of another run."""
+        for function_name, count in profile.function_counts.items():
+            self.function_counts[function_name] = (
+                self.function_counts.get(function_name, 0) + count
+            )
+        for key, count in profile.line_counts.items():
+            self.line_counts[key] = self.line_counts.get(key, 0) + count
+
+    @property
+    def max_function_count(self):
+        return max(self.function_counts.values(), default=0)
+
+    def get_line_count(self, filename, line):
+        """
+        Returns the number of times the line of the source file ran, or None
+        if the profile does not have it.
+        """
+        return self.line_counts.get((os.path.basename(filename), line))
+
+    def get_hotness(self, function_name):
+        """
+        Returns "hot" or "cold" for the functions of the profile that are,
+        see HOT_FUNCTION_FRACTION and COLD_FUNCTION_FRACTION, and None for
+        the others, including the functions the profile does not have.
+        """
+        count = self.function_counts.get(function_name)
+        if count is None or self.max_function_count == 0:
+            return None
+        if count >= self.max_function_count * HOT_FUNCTION_FRACTION:
+            return "hot"
+        if count <= self.max_function_count * COLD_FUNCTION_FRACTION:
+            return "cold"
+        return None
+
+
+def load_profile(paths):
+    """
+    Loads the execution profiles at the given paths and merges them. Each of
+    them can be:
+        a gcov JSON file, as written by gcov --json-format, compressed with
+            gzip or not.
+        a .gcov file, as written by gcov, which has the calls of each
+            function when gcov is given --branch-probabilities.
+        a text file with a function name and the number of times it was
+            called on each line, like "foo 1200". Empty lines and the lines
+            that start with # are skipped.
+    A profile is only read once per process, unless its file changes.
+    """
+    profile = ExecutionProfile()
+    for path in paths:
+        status = os.stat(path)
+        key = (os.path.abspath(path), status.st_mtime_ns, status.st_size)
+        if key not in loaded_profiles:
+            loaded_profiles[key] = read_profile(path)
+        profile.merge(loaded_profiles[key])
+    return profile
+
+
+def read_profile(path):
+    """Reads the execution profile at the path, see load_profile."""
+    with open(path, "rb") as file:
+        content = file.read()
+    if content.startswith(b"\x1f\x8b"):
+        content = gzip.decompress(content)
+    text = content.decode()
+    if text.lstrip().startswith("{"):
+        return parse_gcov_json(json.loads(text))
+    lines = text.splitlines()
+    if any(GCOV_LINE_PATTERN.match(line) for line in lines):
+        return parse_gcov_text(lines)
+    return parse_function_counts(lines, path)
+
+
+def parse_gcov_json(data):
+    """Parses the execution profile of the JSON format of gcov."""
+    profile = ExecutionProfile()
+    for source in data.get("files", []):
+        filename = os.path.basename(source["file"])
+        profile.merge(
+            ExecutionProfile(
+                {
+                    function["name"]: function["execution_count"]
+                    for function in source.get("functions", [])
+                },
+                {
+                    (filename, line["line_number"]): line["count"]
+                    for line in source.get("lines", [])
+                },
+            )
+        )
+    return profile
+
+
+def parse_gcov_text(lines):
+    """Parses the execution profile of a .gcov file."""
+    profile = ExecutionProfile()
+    filename = None
+    for line in lines:
+        match = GCOV_SOURCE_PATTERN.match(line)
+        if match is not None:
+            filename = os.path.basename(match.group(1).strip())
+            continue
+        match = GCOV_FUNCTION_PATTERN.match(line)
+        if match is not None:
+            profile.function_counts[match.group(1)] = int(match.group(2))
+            continue
+        match = GCOV_LINE_PATTERN.match(line)
+        if match is None or match.group(1) == "-" or filename is None:
+            continue
+        count = 0 if match.group(1) in ("#####", "=====") else match.group(1)
+        profile.line_counts[(filename, int(match.group(2)))] = int(count)
+    return profile
+
+
+def parse_function_counts(lines, path):
+    """Parses the execution profile of function names and their counts."""
+    profile = ExecutionProfile()
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = line.split()
+        if len(fields) != 2 or not fields[1].isdigit():
+            raise ValueError(
+                f"{path}:{number}: expected a function name and a count"
+            )
+        profile.function_counts[fields[0]] = int(fields[1])
+    return profile
+
+
+def apply_profile(block, profile, line_numbers=None):
+    """
+    Prepares the block for its generation with the execution profile:
+        - The involved functions are ordered by the number of times they
+          were called, the most first, so that the cases of the hottest
+          functions are next to each other in the block function and the
+          dispatch tries them first.
+        - The FunctionInfo of each of them gets its count and whether it is
+          hot or cold, see ExecutionProfile.get_hotness, which the block
+          function and the wrappers are annotated with.
+        - The if statements of their bodies whose branch is rarely taken,
+          like the one of a tail call to an error handler, get their
+          condition wrapped in __builtin_expect, so that the compiler moves
+          that branch out of the way of the hot path. See
+          annotate_unlikely_branches.
+    line_numbers maps the name of each source file to the numbers of the
+    lines of its parsed code in the source, as filled in by
+    utils.split_directives, which the line counts of the profile refer to.
+    The indices of the functions are not changed.
+    """
+    for function_name, function_info in block.involved_functions.items():
+        function_info.execution_count = profile.function_counts.get(
+            function_name
+        )
+        function_info.hotness = profile.get_hotness(function_name)
+        annotate_unlikely_branches(
+            function_info.function_definition, profile, line_numbers or dict()
+        )
+    block.involved_functions = dict(
+        sorted(
+            block.involved_functions.items(),
+            key=lambda item: -(item[1].execution_count or 0),
+        )
+    )
+
+
+def annotate_unlikely_branches(function_definition, profile, line_numbers):
+    """
+    Wraps the conditions of the if statements of the function whose
+    branches are taken at most UNLIKELY_BRANCH_FRACTION of the times the
+    statement runs in __builtin_expect, changing them in place:
+        if (__builtin_expect(n < 0, 0))
+          return fail(n);
+    The counts of the lines of the condition and of the first statement of
+    the branch are compared, so the branch must start on a line of its own.
+    """
+    nodes = [function_definition.body]
+    while nodes:
+        current = nodes.pop()
+        nodes.extend(child for _, child in current.children())
+        if not isinstance(current, c_ast.If) or current.coord is None:
+            continue
+        count = get_line_count(current, profile, line_numbers)
+        if not count:
+            continue
+        for branch, expected in ((current.iftrue, 0), (current.iffalse, 1)):
+            branch_count = get_branch_count(
+                current, branch, profile, line_numbers
+            )
+            if (
+                branch_count is not None
+                and branch_count <= count * UNLIKELY_BRANCH_FRACTION
+            ):
+                current.cond = utils.generate_expect(current.cond, expected)
+                break
+
+
+def get_line_count(node, profile, line_numbers):
+    """
+    Returns the number of times the line of the node ran in the profile, or
+    None if it is unknown.
+    """
+    if node.coord is None:
+        return None
+    line = node.coord.line
+    numbers = line_numbers.get(node.coord.file)
+    if numbers:
+        line = numbers[line - 1]
+    return profile.get_line_count(node.coord.file, line)
+
+
+def get_branch_count(if_stmt, branch, profile, line_numbers):
+    """
+    Returns the number of times the first statement of a branch of the if
+    statement ran in the profile, or None if it is unknown or on the line of
+    the condition.
+    """
+    while isinstance(branch, c_ast.Compound) and branch.block_items:
+        branch = branch.block_items[0]
+    if (
+        branch is None
+        or isinstance(branch, c_ast.Compound)
+        or branch.coord is None
+        or branch.coord.line == if_stmt.coord.line
+    ):
+        return None
+    return get_line_count(branch, profile, line_numbers)
@@ -0,0 +1,123 @@
+from pycparser import c_ast
+import hashlib
+import os
+import subprocess
+import pycparser
+import utils
+
+# Definitions given to the preprocessor to remove the GNU extensions used by
+# the system headers that Pycparser does not support
+GNU_EXTENSION_DEFINES = (
+    "-D__attribute__(x)=",
+    "-D__extension__=",
+    "-D__asm__(x)=",
+    "-D__asm(x)=",
+    "-D__restrict=",
+    "-D__restrict__=",
+    "-D__inline=inline",
+    "-D__inline__=inline",
+    "-D__const=const",
+    "-D__signed__=signed",
+    "-D__volatile__=volatile",
+    "-D__typeof__(x)=int",
+    "-D__builtin_va_list=int",
+    "-D__int128=long long",
+    "-D__float128=long double",
+    "-D_Float32=float",
+    "-D_Float32x=double",
+    "-D_Float64=double",
+    "-D_Float64x=long double",
+    "-D_Float128=long double",
+    "-D_Noreturn=",
+)
+
+# The file scopes of the preludes parsed by this process, by the digest of
+# their expanded text
+parsed_preludes = dict()
+
+
+def preprocess_directives(directives, preprocessor, filename):
+    """
+    Expands the directives of a file, as returned by utils.split_directives,
+    with the given command line of the C preprocessor. Quoted includes are
+    searched in the directory of the file first. Returns the expanded text,
+    which holds the declarations of the included headers.
+    """
+    command = [
+        preprocessor[0],
+        "-P",
+        *GNU_EXTENSION_DEFINES,
+        *preprocessor[1:],
+        "-iquote",
+        os.path.dirname(os.path.abspath(filename)),
+        "-",
+    ]
+    completed = subprocess.run(
+        command, input="".join(directives), capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"The preprocessor failed on the directives of {filename}: "
+            f"{completed.stderr.strip()}"
+        )
+    return completed.stdout
+
+
+def get_declared_names(ast):
+    """
+    Maps the names declared at file scope by the declarations of the AST to
+    whether they are typedef names, the same way ScopedParser.file_scope does.
+    """
+    names = dict()
+    for item in ast.ext:
+        if isinstance(item, c_ast.Typedef):
+            names[item.name] = True
+        elif isinstance(item, c_ast.Decl) and item.name is not None:
+            names[item.name] = False
+    return names
+
+
+def generate_prelude_digest(text):
+    digest = hashlib.sha256()
+    digest.update(f"{utils.VERSION}\0{pycparser.__version__}\0".encode())
+    digest.update(text.encode())
+    return digest.hexdigest()
+
+
+def load_file_scope(directives, preprocessor, filename, cache=None):
+    """
+    Returns the names declared by the headers the directives of a file
+    include, mapped to whether they are typedef names, so that the rest of
+    the file can be parsed with the types of the headers known. See
+    parse_file_scope.
+    """
+    if not directives:
+        return dict()
+    return parse_file_scope(
+        preprocess_directives(directives, preprocessor, filename), cache
+    )
+
+
+def parse_file_scope(text, cache=None):
+    """
+    Returns the names declared by the text the directives of a file expand
+    to, as returned by preprocess_directives, mapped to whether they are
+    typedef names.
+
+    The expanded headers, which are usually much larger than the file itself,
+    are only parsed the first time they are seen. Their names are kept in this
+    process and, if a cache is given, on disk under the digest of the
+    expanded text, so that a change in any of the headers or of the defines
+    is noticed while every other file including the same headers reuses them.
+    """
+    key = generate_prelude_digest(text)
+    if key in parsed_preludes:
+        return parsed_preludes[key]
+
+    names = cache.get_state(key) if cache is not None else None
+    if names is None:
+        names = get_declared_names(utils.get_parser().parse(text, "<prelude>"))
+        if cache is not None:
+            cache.put_state(key, names)
+    parsed_preludes[key] = names
+    return names
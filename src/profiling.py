@@ -0,0 +1,151 @@
+import contextlib
+import os
+import time
+import utils
+
+# The profiler the phases and counters of the tail call elimination process
+# are recorded in, set while a Profiler is used as a context manager
+active_profiler = None
+
+
+class Profiler:
+    """
+    Records the wall time, the CPU time and the peak of the memory allocated
+    by each phase of the tail call elimination process, along with counters
+    like the number of involved functions or of rewritten return statements.
+    It is used as a context manager around the code to be profiled:
+        profiler = Profiler()
+        with profiler:
+            main.remove_tail_calls("main.c")
+        print(profiler.to_dict())
+    A phase that runs more than once, like the generation of the block
+    functions, adds up its times and keeps the highest of its peaks. The
+    memory is traced with tracemalloc, which slows the process down, unless
+    trace_memory is unset. Like cProfile and hashlib, tracemalloc is only
+    imported once a profiler is used, as loading it slows down the startup of
+    every conversion.
+    """
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.phases = dict()
+        self.counters = dict()
+        self.previous_profiler = None
+        self.started_tracing = False
+
+    def __enter__(self):
+        global active_profiler
+        import tracemalloc
+
+        self.previous_profiler = active_profiler
+        active_profiler = self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        return self
+
+    def __exit__(self, *exception):
+        global active_profiler
+        import tracemalloc
+
+        active_profiler = self.previous_profiler
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Measures the code run inside the context as the given phase."""
+        import tracemalloc
+
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            yield
+        finally:
+            record = self.phases.setdefault(
+                name, {"wall_time": 0.0, "cpu_time": 0.0, "peak_memory": 0}
+            )
+            record["wall_time"] += time.perf_counter() - start_time
+            record["cpu_time"] += time.process_time() - start_cpu_time
+            if self.trace_memory:
+                record["peak_memory"] = max(
+                    record["peak_memory"],
+                    tracemalloc.get_traced_memory()[1] - start_memory,
+                )
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def to_dict(self):
+        return {"phases": self.phases, "counters": self.counters}
+
+
+def phase(name):
+    """
+    Returns a context that measures the code run inside it as the given phase
+    of the active profiler, or that does nothing if no profiler is active.
+    """
+    if active_profiler is None:
+        return contextlib.nullcontext()
+    return active_profiler.phase(name)
+
+
+def count(name, amount=1):
+    """Adds the amount to the given counter of the active profiler, if any."""
+    if active_profiler is not None:
+        active_profiler.count(name, amount)
+
+
+class ProfileOutput:
+    """
+    Profiles the conversion of each file and saves the results to the given
+    path, in one of these formats:
+        json: a Profiler is used and its results are appended to the path as
+            a JSON line per file, so that the lines written by the workers of
+            a batch can be aggregated.
+        cprofile: the conversion is profiled with cProfile, and its stats are
+            dumped in the directory at the path in a file per input file,
+            which can be aggregated with pstats.Stats.
+    """
+
+    formats = ("json", "cprofile")
+
+    def __init__(self, path, format="json"):
+        self.path = path
+        self.format = format
+
+    def run(self, filename, function, *args, **kwargs):
+        """Calls the function that converts the file and profiles it."""
+        if self.format == "cprofile":
+            import cProfile
+
+            profile = cProfile.Profile()
+            result = profile.runcall(function, *args, **kwargs)
+            os.makedirs(self.path, exist_ok=True)
+            profile.dump_stats(
+                os.path.join(self.path, get_dump_name(filename))
+            )
+            return result
+
+        profiler = Profiler()
+        with profiler:
+            result = function(*args, **kwargs)
+        utils.append_json_line(
+            self.path, {"file": filename, **profiler.to_dict()}
+        )
+        return result
+
+
+def get_dump_name(filename):
+    """
+    Returns the name of the cProfile dump of the file, which is unique for
+    each path even if files in different directories have the same name.
+    """
+    import hashlib
+
+    digest = hashlib.sha1(os.path.abspath(filename).encode()).hexdigest()
+    return f"{os.path.basename(filename)}-{digest[:8]}.prof"
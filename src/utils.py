@@ -1,5 +1,91 @@
-from pycparser import c_ast, c_generator
-from copy import deepcopy
+from pycparser import c_ast, c_generator, c_parser
+import collections
+import contextlib
+import copy
+import io
+import json
+import os
+
+VERSION = "1.11.0"
+
+# The size of the buffer the result is written to disk through
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# The parser shared by every call of get_parser in this process
+shared_parser = None
+
+# The package of the lexer and parser tables shipped with the project. The
+# parsers of pycparser 2 load them instead of generating their tables, and
+# generate them into its directory, rather than into the working directory,
+# when they are out of date. Newer versions do not use tables.
+PARSER_TABLES_PACKAGE = "parser_tables"
+PARSER_TABLES_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), PARSER_TABLES_PACKAGE
+)
+
+
+class ScopedParser(c_parser.CParser):
+    """
+    A parser that can parse a part of a file on its own. The names that are
+    not declared in the parsed text are looked up in file_scope, which maps
+    the names declared at file scope by the previous parts of the file to
+    whether they are typedef names.
+    """
+
+    def __init__(self):
+        super().__init__(
+            lextab=f"{PARSER_TABLES_PACKAGE}.lextab",
+            yacctab=f"{PARSER_TABLES_PACKAGE}.yacctab",
+            taboutputdir=PARSER_TABLES_DIRECTORY,
+        )
+        self.file_scope = dict()
+
+    def _is_type_in_scope(self, name):
+        for scope in reversed(self._scope_stack):
+            if name in scope:
+                return scope[name]
+        return self.file_scope.get(name, False)
+
+    def parse_part(self, text, file_scope, filename=""):
+        """Parses the text with the given names declared at file scope."""
+        self.file_scope = file_scope
+        try:
+            return self.parse(text, filename)
+        finally:
+            self.file_scope = dict()
+
+
+class ComputedGoto(c_ast.Node):
+    """
+    A goto statement that jumps to the address of a label the expression
+    evaluates to, like goto *dispatch[index]; with the labels as values
+    extension of GCC and Clang, which pycparser has no node for. It is
+    generated by CodeGenerator.
+    """
+
+    __slots__ = ("expr", "coord", "__weakref__")
+
+    def __init__(self, expr, coord=None):
+        self.expr = expr
+        self.coord = coord
+
+    def children(self):
+        return (("expr", self.expr),)
+
+    def __iter__(self):
+        yield self.expr
+
+    attr_names = ()
+
+
+class CodeGenerator(c_generator.CGenerator):
+    """
+    The code generator of the results, which generates the nodes the tail
+    call elimination adds to the ones of pycparser as well.
+    """
+
+    def visit_ComputedGoto(self, n):
+        return "goto *" + self._parenthesize_unless_simple(n.expr) + ";"
 
 
 class FunctionInfo:
@@ -13,7 +99,98 @@ class FunctionInfo:
         self.index = index
         self.index_label = f"{function_definition.decl.name}_INDEX"
         self.block_label = f"{function_definition.decl.name}_LABEL"
+        # The label tail calls jump to with the direct frame ABI, past the
+        # copying of the arguments of the frame done on entry
+        self.body_label = f"{function_definition.decl.name}_BODY"
         self.call_struct = function_call_struct
+        self.returns_void = is_void_function(function_definition)
+        # The calls through function pointers in tail position of the
+        # function that can jump to functions of the same block, by call
+        self.indirect_tail_calls = dict()
+        # Whether a tail call of a function of the same block jumps to the
+        # function, see BlockInfo.mark_jumped_to_functions
+        self.jumped_to = False
+        # The statement of the function in the block function, once it is
+        # generated
+        self.block_statement = None
+        # The number of times the function was called and whether it is hot
+        # or cold in the execution profile the block is generated with, see
+        # pgo.apply_profile, or None without one
+        self.execution_count = None
+        self.hotness = None
+        # Whether the definition of the function is kept as a wrapper that
+        # calls the block function, see
+        # accumulator.remove_unused_accumulator_functions
+        self.has_wrapper = True
+
+
+class IndirectTailCall:
+    """
+    A class used to store a call through a function pointer in tail position,
+    along with the type of the pointer and the names of the functions whose
+    addresses are taken and have the signature of the pointer, which are the
+    functions it can call.
+    """
+
+    def __init__(self, call, pointer_type, candidates):
+        self.call = call
+        self.pointer_type = pointer_type
+        self.candidates = candidates
+
+
+class CallTypeResolver(c_ast.NodeVisitor):
+    """
+    Finds the types of the function pointers called by the given calls inside
+    a function definition. The declarations are followed in the scopes they
+    are visible in at each call, starting from the given file scope, which
+    maps the names declared at file scope to their types.
+    """
+
+    def __init__(self, calls, file_scope, typedefs, structs):
+        self.calls = calls
+        self.scopes = [file_scope]
+        self.typedefs = typedefs
+        self.structs = structs
+        self.pointer_types = dict()
+
+    def visit_FuncDef(self, node):
+        self.scopes.append(
+            {
+                param.name: param.type
+                for param in get_function_params(node)
+                if param.name is not None
+            }
+        )
+        self.visit(node.body)
+        self.scopes.pop()
+
+    def visit_Compound(self, node):
+        self.scopes.append(dict())
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def visit_For(self, node):
+        self.scopes.append(dict())
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def visit_Decl(self, node):
+        # The type is not visited, so the parameters of function pointers and
+        # the members of structs are not taken as declarations of the scope
+        if node.name is not None:
+            self.scopes[-1][node.name] = node.type
+        if node.init is not None:
+            self.visit(node.init)
+
+    def visit_FuncCall(self, node):
+        if node in self.calls:
+            self.pointer_types[node] = resolve_called_pointer_type(
+                node,
+                collections.ChainMap(*reversed(self.scopes)),
+                self.typedefs,
+                self.structs,
+            )
+        self.generic_visit(node)
 
 
 class GlobalParameters:
@@ -22,7 +199,266 @@ class GlobalParameters:
     block_call_union_instance_name = "frame"
     block_call_union_name = "block_call"
     function_return_val_name = "result"
+    empty_call_struct_field_name = "unused"
     block_name = "block"
+    block_dispatch_table_name = "dispatch"
+    indirect_call_target_name = "target_TMP"
+    accumulator_name = "accumulator_ACC"
+    # The largest number of functions the auto dispatch strategy dispatches
+    # with if statements, and the smallest it dispatches with a computed goto
+    if_dispatch_max_size = 3
+    goto_dispatch_min_size = 16
+
+
+class TransformOptions:
+    """
+    A class used to store the options that change how the tail calls are
+    eliminated.
+
+    partition decides which functions are merged into block functions:
+        single: every function that tail calls or is tail called by another
+            function is merged into one block function.
+        scc: one block function is generated for each recursion cycle of the
+            tail call graph, and tail calls that are not part of a cycle are
+            left as plain calls.
+
+    loop_rewrite decides whether functions that only tail call themselves are
+    rewritten in place into loops instead of being merged into a block
+    function.
+
+    dispatch decides how the block function jumps to the function it was
+    called for:
+        switch: a switch statement with a case for each function.
+        goto: a computed goto through a static table of label addresses,
+            which needs the labels as values extension of GCC and Clang.
+        if: a chain of if statements, for blocks with very few functions.
+        auto: one of the above based on the number of functions.
+
+    preprocessor is the command line of the C preprocessor, like ["cpp"],
+    that the directives are expanded with to find the typedef names declared
+    by the included headers. If it is None, the code is parsed without them.
+
+    accumulate rewrites the functions whose recursive calls are combined
+    with their results by an associative operator, like n * fact(n - 1), into
+    tail recursive functions with an accumulator before the tail calls are
+    eliminated.
+
+    frame_abi decides how the arguments of the involved functions are passed
+    inside the block function:
+        copy: each case copies the arguments out of its call struct in the
+            frame into locals, and each tail call copies them into the call
+            struct of the called function.
+        direct: the parameters of every function are locals of the block
+            function, which the case bodies use directly. The arguments are
+            copied out of the frame once on entry, and tail calls assign the
+            locals of the called function, which can stay in registers. The
+            block function is static inline, so that it can be inlined into
+            the wrappers, where the dispatch on the constant index folds
+            away, and the wrappers are inline themselves when they are
+            static.
+
+    pgo_profiles is the list of paths of the execution profiles of the
+    program, as accepted by pgo.load_profile, that the involved functions are
+    ordered by and the block functions and the rarely taken branches are
+    annotated with. The profiles are not used if it is None.
+    """
+
+    partition_strategies = ("single", "scc")
+    dispatch_strategies = ("switch", "goto", "if", "auto")
+    frame_abis = ("copy", "direct")
+
+    def __init__(
+        self,
+        partition="single",
+        loop_rewrite=True,
+        dispatch="switch",
+        preprocessor=None,
+        frame_abi="copy",
+        accumulate=False,
+        pgo_profiles=None,
+    ):
+        if partition not in TransformOptions.partition_strategies:
+            raise ValueError(f"Unknown partition strategy: {partition}")
+        if dispatch not in TransformOptions.dispatch_strategies:
+            raise ValueError(f"Unknown dispatch strategy: {dispatch}")
+        if frame_abi not in TransformOptions.frame_abis:
+            raise ValueError(f"Unknown frame ABI: {frame_abi}")
+        self.partition = partition
+        self.loop_rewrite = loop_rewrite
+        self.dispatch = dispatch
+        self.frame_abi = frame_abi
+        self.accumulate = accumulate
+        self.preprocessor = (
+            list(preprocessor) if preprocessor is not None else None
+        )
+        self.pgo_profiles = (
+            list(pgo_profiles) if pgo_profiles is not None else None
+        )
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    def fingerprint(self):
+        """
+        Returns a string that changes whenever any of the options change,
+        including the content of the execution profiles.
+        """
+        options = self.to_dict()
+        if self.pgo_profiles is not None:
+            import hashlib
+
+            options["pgo_profiles"] = []
+            for path in self.pgo_profiles:
+                with open(path, "rb") as file:
+                    digest = hashlib.sha256(file.read()).hexdigest()
+                options["pgo_profiles"].append([path, digest])
+        return json.dumps(options, sort_keys=True)
+
+
+class TailCall:
+    """
+    A class used to store a call in tail position and the reason why it was
+    not eliminated, which is None if it was. The candidates of a call through
+    a function pointer are the names of the functions it can call, which are
+    empty when they are unknown, and they are None for a call by the name of
+    a function.
+    """
+
+    def __init__(self, function_name, call, reason=None, candidates=None):
+        self.function_name = function_name
+        self.callee_name = (
+            call.name.name if isinstance(call.name, c_ast.ID) else None
+        )
+        self.line = call.coord.line if call.coord is not None else None
+        self.reason = reason
+        self.candidates = candidates
+
+    def to_dict(self):
+        return dict(vars(self))
+
+
+def generate_tail_call_records(tail_calls, line_numbers=None):
+    """
+    Returns the tail calls as dictionaries, with their lines mapped back to
+    the lines of the source by the line numbers of the parsed code, as
+    filled in by split_directives, if they are given.
+    """
+    records = []
+    for tail_call in tail_calls:
+        record = tail_call.to_dict()
+        if line_numbers and record["line"] is not None:
+            record["line"] = line_numbers[record["line"] - 1]
+        records.append(record)
+    return records
+
+
+class TailCallReport:
+    """
+    Saves the tail calls that could not be eliminated in each converted file
+    to the JSON lines file at the given path, along with the number of calls
+    in tail position and the number of them that were eliminated.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, filename, tail_calls, line_numbers=None):
+        """
+        Writes the record of the file. The line numbers of the parsed code,
+        as filled in by split_directives, map the lines of the tail calls
+        back to the lines of the source.
+        """
+        not_eliminated = [
+            record
+            for record in generate_tail_call_records(tail_calls, line_numbers)
+            if record["reason"] is not None
+        ]
+        append_json_line(
+            self.path,
+            {
+                "file": filename,
+                "tail_calls": len(tail_calls),
+                "eliminated": len(tail_calls) - len(not_eliminated),
+                "not_eliminated": not_eliminated,
+            },
+        )
+
+
+class BlockInfo:
+    """
+    A class used to store information about a block function and the
+    functions merged into it.
+    """
+
+    def __init__(
+        self,
+        involved_functions,
+        name=GlobalParameters.block_name,
+        call_union_name=GlobalParameters.block_call_union_name,
+    ):
+        self.involved_functions = involved_functions
+        self.name = name
+        self.call_union_name = call_union_name
+        self.call_union = None
+        self.function = None
+        # The names of the functions called inside the block function, when
+        # they are known before it is generated
+        self.called_functions = None
+        # The frame_layout.FrameLayout of the union, once it is laid out
+        self.frame_layout = None
+        self.mark_jumped_to_functions()
+
+    def mark_jumped_to_functions(self):
+        """
+        Marks the functions of the block that the tail calls of the functions
+        of the block jump to, directly or through function pointers, so that
+        only their labels are generated in the block function. It must be
+        called before the bodies of the functions are changed.
+        """
+        for function_info in self.involved_functions.values():
+            for call in find_function_tail_calls(
+                function_info.function_definition
+            ):
+                if call in function_info.indirect_tail_calls:
+                    names = function_info.indirect_tail_calls[call].candidates
+                elif (
+                    isinstance(call.name, c_ast.ID)
+                    and call.name.name in self.involved_functions
+                    and returns_same_type(
+                        function_info.function_definition,
+                        self.involved_functions[
+                            call.name.name
+                        ].function_definition,
+                    )
+                ):
+                    names = [call.name.name]
+                else:
+                    continue
+                for name in names:
+                    if name in self.involved_functions:
+                        self.involved_functions[name].jumped_to = True
+
+    def to_dict(self):
+        """
+        Returns the names of the block function and of its union, the index
+        of each function merged into it and the layout of its union, if it
+        was laid out.
+        """
+        return {
+            "name": self.name,
+            "call_union_name": self.call_union_name,
+            "functions": {
+                function_name: function_info.index
+                for function_name, function_info in (
+                    self.involved_functions.items()
+                )
+            },
+            "frame_layout": (
+                self.frame_layout.to_dict()
+                if self.frame_layout is not None
+                else None
+            ),
+        }
 
 
 def generate_function_call_struct(function):
@@ -38,64 +474,359 @@ def generate_function_call_struct(function):
             int x;
             int y;
         }
+    The parameters are stored with their adjusted types and without their
+    own qualifiers, as generate_param_variable declares them, so that arrays
+    are stored as pointers and const parameters can be assigned. Functions
+    that return void have no result field.
     """
     name = f"{function.decl.name}_ios"
-    return_type = deepcopy(function.decl.type.type)
-    return_type.declname = GlobalParameters.function_return_val_name
-    return_variable = c_ast.Decl(
-        GlobalParameters.function_return_val_name,
-        [],
-        [],
-        [],
-        [],
-        return_type,
-        None,
-        None,
-    )
-    decls = [return_variable]
-    if function.decl.type.args is not None:
-        decls += function.decl.type.args.params
+    decls = []
+    if not is_void_function(function):
+        return_type = rename_declaration_type(
+            function.decl.type.type, GlobalParameters.function_return_val_name
+        )
+        decls.append(
+            c_ast.Decl(
+                GlobalParameters.function_return_val_name,
+                [],
+                [],
+                [],
+                [],
+                return_type,
+                None,
+                None,
+            )
+        )
+    for param in get_function_params(function):
+        decls.append(generate_param_variable(param, param.name))
+    if not decls:
+        # A struct needs at least one member, even for void foo(void)
+        decls.append(
+            c_ast.Decl(
+                GlobalParameters.empty_call_struct_field_name,
+                [],
+                [],
+                [],
+                [],
+                c_ast.TypeDecl(
+                    GlobalParameters.empty_call_struct_field_name,
+                    [],
+                    None,
+                    c_ast.IdentifierType(["char"]),
+                ),
+                None,
+                None,
+            )
+        )
     struct_type = c_ast.Struct(name, decls)
     struct = c_ast.Decl(None, [], [], [], [], struct_type, None, None)
     return struct
 
 
+def is_void_function(function_definition):
+    return_type = function_definition.decl.type.type
+    return (
+        isinstance(return_type, c_ast.TypeDecl)
+        and isinstance(return_type.type, c_ast.IdentifierType)
+        and return_type.type.names == ["void"]
+    )
+
+
+def get_return_type(function_definition):
+    """
+    Returns the return type of the function as a string, like "unsigned int"
+    or "struct vm *".
+    """
+    return c_generator.CGenerator().visit(
+        c_ast.Typename(
+            None,
+            [],
+            None,
+            rename_declaration_type(function_definition.decl.type.type, None),
+        )
+    )
+
+
+def returns_same_type(function_definition, other_definition):
+    """
+    Checks whether two functions return the same type. A tail call to a
+    function that returns another type converts the value it returns, so it
+    can only be eliminated between functions that return the same type, as
+    the called function writes its result to the frame with its own type and
+    the wrapper of the caller reads it with the type of the caller.
+    """
+    return get_return_type(function_definition) == get_return_type(
+        other_definition
+    )
+
+
+def rename_declaration_type(declaration_type, name):
+    """
+    Returns the type of a declaration with its declared name changed to the
+    given name. For example, for the type of int *foo it returns the type of
+    int *name. Only the nodes from the top of the type down to the TypeDecl
+    that holds the name are copied, the rest of the type is shared with the
+    given one.
+    """
+    if isinstance(declaration_type, c_ast.TypeDecl):
+        return c_ast.TypeDecl(
+            name,
+            declaration_type.quals,
+            declaration_type.align,
+            declaration_type.type,
+        )
+    elif isinstance(declaration_type, c_ast.PtrDecl):
+        return c_ast.PtrDecl(
+            declaration_type.quals,
+            rename_declaration_type(declaration_type.type, name),
+        )
+    elif isinstance(declaration_type, c_ast.ArrayDecl):
+        return c_ast.ArrayDecl(
+            rename_declaration_type(declaration_type.type, name),
+            declaration_type.dim,
+            declaration_type.dim_quals,
+        )
+    return c_ast.FuncDecl(
+        declaration_type.args,
+        rename_declaration_type(declaration_type.type, name),
+    )
+
+
+def get_param_variable_name(function_name, param_name):
+    """
+    Returns the name of the local of the block function that holds the
+    parameter of an involved function with the direct frame ABI.
+    """
+    return f"{function_name}_{param_name}_PARAM"
+
+
+def generate_param_variable(param, name, init=None):
+    """
+    Generates the declaration of a local with the given name that can hold
+    the value of the parameter, like the locals of the block function that
+    hold the parameters of the involved functions with the direct frame ABI.
+    Its type is the type of the parameter once adjusted, so arrays and
+    functions become pointers, and without its own qualifiers, so that it can
+    be assigned.
+    """
+    declaration_type = param.type
+    if isinstance(declaration_type, c_ast.ArrayDecl):
+        declaration_type = c_ast.PtrDecl(
+            declaration_type.dim_quals, declaration_type.type
+        )
+    elif isinstance(declaration_type, c_ast.FuncDecl):
+        declaration_type = c_ast.PtrDecl([], declaration_type)
+    declaration_type = rename_declaration_type(declaration_type, name)
+    declaration_type.quals = [
+        qual for qual in declaration_type.quals if qual != "const"
+    ]
+    return c_ast.Decl(name, [], [], [], [], declaration_type, init, None)
+
+
+def generate_expect(expression, expected):
+    """
+    Generates a call of __builtin_expect that tells the compiler the
+    expression is most likely the expected value, so that the code of the
+    unlikely case is placed out of the way of the likely one. The expected
+    value is either a node, or 0 or 1 for a condition, which is compared with
+    0 first, as __builtin_expect takes a long:
+        __builtin_expect((a < b) != 0, 1)
+    """
+    if isinstance(expected, int):
+        expression = c_ast.BinaryOp(
+            "!=", expression, c_ast.Constant("int", "0")
+        )
+        expected = c_ast.Constant("int", str(expected))
+    return c_ast.FuncCall(
+        c_ast.ID("__builtin_expect"), c_ast.ExprList([expression, expected])
+    )
+
+
+def rename_identifiers(node, renames):
+    """
+    Returns the node with the identifiers that have a name of renames renamed
+    to its new name. A name is not renamed inside the scope of a declaration
+    of the same name that hides it. Like Block.traverse, only the nodes on
+    the paths to the renamed identifiers are copied, the rest is shared with
+    the given node.
+    """
+    if not renames or node is None:
+        return node
+    if isinstance(node, c_ast.ID):
+        if node.name in renames:
+            return c_ast.ID(renames[node.name], node.coord)
+        return node
+    if isinstance(node, c_ast.StructRef):
+        name = rename_identifiers(node.name, renames)
+        if name is node.name:
+            return node
+        return c_ast.StructRef(name, node.type, node.field, node.coord)
+    if isinstance(node, c_ast.Compound):
+        block_items, scope_renames = [], renames
+        for item in node.block_items or []:
+            block_items.append(rename_identifiers(item, scope_renames))
+            if isinstance(item, c_ast.Decl) and item.name in scope_renames:
+                scope_renames = {
+                    name: new_name
+                    for name, new_name in scope_renames.items()
+                    if name != item.name
+                }
+        if all(
+            new_item is item
+            for new_item, item in zip(block_items, node.block_items or [])
+        ):
+            return node
+        return c_ast.Compound(block_items, node.coord)
+    if isinstance(node, c_ast.For) and isinstance(node.init, c_ast.DeclList):
+        init = rename_identifiers(node.init, renames)
+        declared_names = {decl.name for decl in node.init.decls}
+        renames = {
+            name: new_name
+            for name, new_name in renames.items()
+            if name not in declared_names
+        }
+        cond = rename_identifiers(node.cond, renames)
+        next = rename_identifiers(node.next, renames)
+        stmt = rename_identifiers(node.stmt, renames)
+        if (
+            init is node.init
+            and cond is node.cond
+            and next is node.next
+            and stmt is node.stmt
+        ):
+            return node
+        return c_ast.For(init, cond, next, stmt, node.coord)
+
+    new_children = dict()
+    for child_name, child in node.children():
+        new_child = rename_identifiers(child, renames)
+        if new_child is not child:
+            new_children[child_name] = new_child
+    if not new_children:
+        return node
+    new_node = copy.copy(node)
+    for child_name, new_child in new_children.items():
+        if "[" not in child_name:
+            setattr(new_node, child_name, new_child)
+            continue
+        attribute, index = child_name[:-1].split("[")
+        children = getattr(new_node, attribute)
+        if children is getattr(node, attribute):
+            children = list(children)
+            setattr(new_node, attribute, children)
+        children[int(index)] = new_child
+    return new_node
+
+
 def generate_function_info(function, index):
     """Generates the instance of FunctionInfo class for the given function."""
     function_call_struct = generate_function_call_struct(function)
     return FunctionInfo(function, index, function_call_struct)
 
 
-def remove_and_save_directives(filename, temp_filename):
+def get_function_params(function_definition):
+    """
+    Returns the declarations of the named parameters of the function. It is
+    empty for functions declared like foo() or foo(void).
+    """
+    args = function_definition.decl.type.args
+    if args is None:
+        return []
+    return [param for param in args.params if isinstance(param, c_ast.Decl)]
+
+
+def find_referenced_names(node):
+    """Finds the names of all the identifiers used inside the node."""
+    names = set()
+    nodes = [node]
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.ID):
+            names.add(current.name)
+        nodes.extend(child for _, child in current.children())
+    return names
+
+
+def find_declared_names(node):
+    """
+    Finds the names of all the variables, functions, types and enumeration
+    constants declared inside the node, in any of its scopes.
+    """
+    names = set()
+    nodes = [node]
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, (c_ast.Decl, c_ast.Typedef, c_ast.Enumerator)):
+            names.add(current.name)
+        nodes.extend(child for _, child in current.children())
+    names.discard(None)
+    return names
+
+
+def is_const_param(param):
+    """
+    Checks whether the parameter itself is const qualified, like in
+    foo(const int x) or foo(int *const p), so that it cannot be assigned.
+    """
+    if isinstance(param.type, c_ast.ArrayDecl):
+        return "const" in param.type.dim_quals
+    return "const" in getattr(param.type, "quals", [])
+
+
+def split_directives(lines, line_numbers=None):
     """
-    Removes the directives from the given file as Pycparser does not support
-    directives and saves them in a list in order to add them to the final
-    result. It also discards commented code.
+    Separates the directives from the rest of the given source lines as
+    Pycparser does not support directives. It also discards commented code.
+    Returns the list of directives and the list of the remaining lines. If a
+    list of line_numbers is given, the number of each remaining line in the
+    source is appended to it.
     """
     directives, new_file = [], []
     is_comment = False
-    with open(filename) as file:
-        for line in file:
-            if line.strip():
-                if is_comment:
-                    if line.strip()[0:2] == "*/":
-                        is_comment = False
-                    continue
-                if line.strip()[0] == "/":
-                    if line.strip()[1] == "*":
-                        is_comment = (
-                            True if line.strip()[-2:] != "*/" else False
-                        )
-                    continue
-                if line.strip()[0] == "#":
-                    directives.append(line)
-                else:
-                    new_file.append(line)
+    for number, line in enumerate(lines, 1):
+        if line.strip():
+            if is_comment:
+                if line.strip()[0:2] == "*/":
+                    is_comment = False
+                continue
+            if line.strip()[0] == "/":
+                if line.strip()[1] == "*":
+                    is_comment = True if line.strip()[-2:] != "*/" else False
+                continue
+            if line.strip()[0] == "#":
+                directives.append(line)
+            else:
+                new_file.append(line)
+                if line_numbers is not None:
+                    line_numbers.append(number)
+    return directives, new_file
+
+
+def get_parser():
+    """
+    Returns the parser of the source code. It is created on the first call
+    and reused afterwards, so that its setup is paid once per process.
+    """
+    global shared_parser
+    if shared_parser is None:
+        shared_parser = ScopedParser()
+    return shared_parser
+
+
+def parse(code, filename="<source>", file_scope=None):
+    """
+    Parses the code with the shared parser. The names declared outside of
+    the code, like the typedef names of the included headers, can be given
+    as the file scope of ScopedParser.
+    """
+    if file_scope:
+        return get_parser().parse_part(code, file_scope, filename)
+    return get_parser().parse(code, filename)
 
-    with open(temp_filename, "w") as file:
-        file.writelines(new_file)
 
-    return directives
+def get_output_filename(filename):
+    """Returns the name of the file the result of a file is saved to."""
+    return f"{filename[:-2]}_removed.c"
 
 
 def get_functions_def_map(ast):
@@ -111,85 +842,1046 @@ def get_functions_def_map(ast):
     return func_def_map
 
 
-def identify_involved_functions(ast, func_def_map):
+def identify_involved_functions(
+    ast, func_def_map, excluded_functions=(), indirect_tail_calls=None
+):
     """
     Identify the functions that either tail call another function or are
     tail called by another function in order to add them to the block function.
+    Every call in tail position is considered, at any depth of the function
+    body, as found by find_tail_calls. The excluded functions are left out,
+    as they are handled separately, and so are the functions that are not in
+    func_def_map, like the functions defined in other files. A call through a
+    function pointer involves its candidates, if indirect_tail_calls, as
+    returned by resolve_indirect_tail_calls, is given.
     """
+    indirect_tail_calls = indirect_tail_calls or dict()
     involved_functions = dict()
     index = 0
     for item in ast.ext:
         if (
-            isinstance(item, c_ast.FuncDef)
-            and item.body.block_items is not None
+            not isinstance(item, c_ast.FuncDef)
+            or item.decl.name not in func_def_map
+            or item.decl.name in excluded_functions
         ):
-            for block_item in item.body.block_items:
-                if isinstance(block_item, c_ast.Return) and isinstance(
-                    block_item.expr, c_ast.FuncCall
-                ):
-                    caller_function_name = item.decl.name
-                    called_function_name = block_item.expr.name.name
-                    if caller_function_name not in involved_functions:
-                        involved_functions[caller_function_name] = (
-                            generate_function_info(item, index)
-                        )
-                        index += 1
-                    if called_function_name not in involved_functions:
-                        involved_functions[called_function_name] = (
-                            generate_function_info(
-                                func_def_map[called_function_name], index
-                            )
+            continue
+        caller_function_name = item.decl.name
+        for tail_call in find_function_tail_calls(item):
+            for called_function_name in get_tail_callees(
+                tail_call,
+                item,
+                func_def_map,
+                indirect_tail_calls.get(caller_function_name, dict()),
+            ):
+                if caller_function_name not in involved_functions:
+                    involved_functions[caller_function_name] = (
+                        generate_function_info(item, index)
+                    )
+                    index += 1
+                if called_function_name not in involved_functions:
+                    involved_functions[called_function_name] = (
+                        generate_function_info(
+                            func_def_map[called_function_name], index
                         )
-                        index += 1
-                    break
+                    )
+                    index += 1
     return involved_functions
 
 
-def write_result_to_disk(
-    directives,
-    involved_functions,
-    block_call_union,
-    block_function,
-    ast,
-    filename,
+def find_tail_calls(items, returns_void=False):
+    """
+    Finds the calls of functions by their names in tail position among the
+    given statements. See find_tail_position_calls.
+    """
+    return [
+        call
+        for call in find_tail_position_calls(items, returns_void)
+        if isinstance(call.name, c_ast.ID)
+    ]
+
+
+def find_tail_position_calls(items, returns_void=False):
+    """
+    Finds the calls in tail position among the given statements, which are
+    the calls whose value is returned by a return statement, directly or
+    through a branch of a conditional operator or the last operand of a comma
+    operator. If the statements are the body of a function that returns
+    void, the calls that are statements of their own after which the
+    function returns are in tail position too, like the last statement of
+    the body or a call followed by return;. The statements are searched at
+    any depth, in the same way Block.traverse rewrites them.
+    """
+    tail_calls = []
+    collect_statements_tail_calls(
+        items, tail_calls, returns_void, returns_void
+    )
+    return tail_calls
+
+
+def find_function_tail_calls(function_definition):
+    """Finds the calls in tail position of the body of the function."""
+    return find_tail_position_calls(
+        function_definition.body.block_items or [],
+        is_void_function(function_definition),
+    )
+
+
+def collect_statements_tail_calls(
+    items, tail_calls, returns_void=False, at_end=False, break_exits=False
+):
+    """
+    Adds the calls in tail position inside the list of statements to
+    tail_calls. at_end tells whether the function returns once the last of
+    them runs, and break_exits whether a break statement among them makes it
+    return, as it leaves a switch statement at the end of the function.
+    """
+    for position, item in enumerate(items):
+        if position + 1 < len(items):
+            next_item = items[position + 1]
+            item_at_end = returns_void and (
+                (
+                    isinstance(next_item, c_ast.Return)
+                    and next_item.expr is None
+                )
+                or (break_exits and isinstance(next_item, c_ast.Break))
+            )
+        else:
+            item_at_end = at_end
+        collect_tail_calls(
+            item, tail_calls, returns_void, item_at_end, break_exits
+        )
+
+
+def collect_tail_calls(
+    item, tail_calls, returns_void=False, at_end=False, break_exits=False
 ):
-    """Write the final result of the tail call elimination process to disk."""
-    file_content = ""
-    visitor = c_generator.CGenerator()
-
-    for directive in directives:
-        file_content += directive
-
-    file_content += "\n"
-    for function in involved_functions:
-        function_info = involved_functions[function]
-        file_content += (
-            f"""#define {function_info.index_label} {function_info.index}\n"""
-        )
-
-    file_content += "\n"
-    for function in involved_functions:
-        file_content += (
-            "extern "
-            + visitor.visit(
-                involved_functions[function].function_definition.decl
+    """
+    Adds the calls in tail position inside the statement to tail_calls. See
+    collect_statements_tail_calls for at_end and break_exits.
+    """
+    if isinstance(item, c_ast.Return):
+        collect_returned_calls(item.expr, tail_calls)
+    elif isinstance(item, c_ast.FuncCall):
+        if at_end:
+            tail_calls.append(item)
+    elif isinstance(item, c_ast.Compound):
+        collect_statements_tail_calls(
+            item.block_items or [],
+            tail_calls,
+            returns_void,
+            at_end,
+            break_exits,
+        )
+    elif isinstance(item, c_ast.If):
+        for branch in (item.iftrue, item.iffalse):
+            collect_tail_calls(
+                branch, tail_calls, returns_void, at_end, break_exits
+            )
+    elif isinstance(item, (c_ast.While, c_ast.DoWhile, c_ast.For)):
+        collect_tail_calls(item.stmt, tail_calls, returns_void)
+    elif isinstance(item, c_ast.Switch):
+        collect_tail_calls(item.stmt, tail_calls, returns_void, at_end, at_end)
+    elif isinstance(item, (c_ast.Case, c_ast.Default)):
+        collect_statements_tail_calls(
+            item.stmts or [], tail_calls, returns_void, at_end, break_exits
+        )
+    elif isinstance(item, c_ast.Label):
+        collect_tail_calls(
+            item.stmt, tail_calls, returns_void, at_end, break_exits
+        )
+
+
+def return_tail_call_statements(item, calls):
+    """
+    Returns the statement with the calls of the given list that are
+    statements of their own inside it, as found by find_tail_position_calls
+    in a function that returns void, turned into return statements, so that
+    they are rewritten like the other tail calls:
+        foo(x);
+    becomes:
+        return foo(x);
+    Like Block.traverse, only the statements on the paths to these calls are
+    copied, the rest is shared with the given statement.
+    """
+    if isinstance(item, c_ast.FuncCall):
+        if any(call is item for call in calls):
+            return c_ast.Return(item, item.coord)
+        return item
+    if not isinstance(
+        item,
+        (
+            c_ast.Compound,
+            c_ast.If,
+            c_ast.While,
+            c_ast.DoWhile,
+            c_ast.For,
+            c_ast.Switch,
+            c_ast.Case,
+            c_ast.Default,
+            c_ast.Label,
+        ),
+    ):
+        return item
+    changes = dict()
+    for name in ("block_items", "stmts", "stmt", "iftrue", "iffalse"):
+        child = getattr(item, name, None)
+        if isinstance(child, list):
+            new_child = [
+                return_tail_call_statements(statement, calls)
+                for statement in child
+            ]
+            if all(new is old for new, old in zip(new_child, child)):
+                continue
+            changes[name] = new_child
+        elif child is not None:
+            new_child = return_tail_call_statements(child, calls)
+            if new_child is not child:
+                changes[name] = new_child
+    if not changes:
+        return item
+    item = copy.copy(item)
+    for name, child in changes.items():
+        setattr(item, name, child)
+    return item
+
+
+def collect_returned_calls(expr, tail_calls):
+    """Adds the calls whose value the expression evaluates to to tail_calls."""
+    if isinstance(expr, c_ast.FuncCall):
+        tail_calls.append(expr)
+    elif isinstance(expr, c_ast.TernaryOp):
+        collect_returned_calls(expr.iftrue, tail_calls)
+        collect_returned_calls(expr.iffalse, tail_calls)
+    elif isinstance(expr, c_ast.ExprList):
+        collect_returned_calls(expr.exprs[-1], tail_calls)
+
+
+def find_address_taken_names(node):
+    """
+    Finds the names of the identifiers used inside the node other than to
+    call them by name, like foo in handlers[0] = foo or &foo. The members of
+    structs, as in vm->foo, are not identifiers of their own.
+    """
+    names = set()
+    nodes = [node]
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.ID):
+            names.add(current.name)
+        for child_name, child in current.children():
+            if (
+                isinstance(current, c_ast.FuncCall)
+                and child_name == "name"
+                and isinstance(child, c_ast.ID)
+            ) or (
+                isinstance(current, c_ast.StructRef) and child_name == "field"
+            ):
+                continue
+            nodes.append(child)
+    return names
+
+
+def find_address_taken_functions(ast, func_def_map):
+    """
+    Finds the names of the functions of func_def_map whose addresses are
+    taken anywhere in the source. Only these functions can be called through
+    a function pointer.
+    """
+    return find_address_taken_names(ast) & func_def_map.keys()
+
+
+def get_function_signature(function_type):
+    """
+    Returns the type of a function as a string without the names of the
+    function and its parameters, like "int (struct vm *, int)" for int
+    foo(struct vm *vm, int x). Functions with the same signature can be
+    called through the same function pointer.
+    """
+    generator = c_generator.CGenerator()
+    params = []
+    if function_type.args is not None:
+        for param in function_type.args.params:
+            if isinstance(param, c_ast.EllipsisParam):
+                params.append("...")
+            else:
+                params.append(
+                    generator.visit(
+                        c_ast.Typename(
+                            None,
+                            [],
+                            None,
+                            rename_declaration_type(param.type, None),
+                        )
+                    )
+                )
+    if params == ["void"]:
+        params = []
+    return_type = generator.visit(
+        c_ast.Typename(
+            None, [], None, rename_declaration_type(function_type.type, None)
+        )
+    )
+    return f"{return_type} ({', '.join(params)})"
+
+
+def resolve_typedefs(declaration_type, typedefs):
+    """
+    Returns the type a declaration type stands for once the typedef names it
+    is declared with, if any, are replaced by their types.
+    """
+    while (
+        isinstance(declaration_type, c_ast.TypeDecl)
+        and isinstance(declaration_type.type, c_ast.IdentifierType)
+        and len(declaration_type.type.names) == 1
+        and declaration_type.type.names[0] in typedefs
+    ):
+        declaration_type = typedefs[declaration_type.type.names[0]]
+    return declaration_type
+
+
+def resolve_expression_type(expr, scope, typedefs, structs):
+    """
+    Finds the type of an expression that names a function pointer, like fp,
+    handlers[op], *fp or vm->handler, from the declarations in scope. Returns
+    None if its type cannot be found.
+    """
+    if isinstance(expr, c_ast.ID):
+        declaration_type = scope.get(expr.name)
+    elif isinstance(expr, c_ast.Cast):
+        declaration_type = expr.to_type.type
+    elif isinstance(expr, c_ast.ArrayRef):
+        declaration_type = resolve_expression_type(
+            expr.name, scope, typedefs, structs
+        )
+        if not isinstance(declaration_type, (c_ast.ArrayDecl, c_ast.PtrDecl)):
+            return None
+        declaration_type = declaration_type.type
+    elif isinstance(expr, c_ast.UnaryOp) and expr.op == "*":
+        declaration_type = resolve_expression_type(
+            expr.expr, scope, typedefs, structs
+        )
+        if not isinstance(declaration_type, (c_ast.ArrayDecl, c_ast.PtrDecl)):
+            return None
+        declaration_type = declaration_type.type
+    elif isinstance(expr, c_ast.StructRef):
+        declaration_type = resolve_expression_type(
+            expr.name, scope, typedefs, structs
+        )
+        if expr.type == "->":
+            if not isinstance(declaration_type, c_ast.PtrDecl):
+                return None
+            declaration_type = resolve_typedefs(
+                declaration_type.type, typedefs
             )
-            + ";\n"
+        if not isinstance(declaration_type, c_ast.TypeDecl) or not isinstance(
+            declaration_type.type, (c_ast.Struct, c_ast.Union)
+        ):
+            return None
+        struct = declaration_type.type
+        if struct.decls is None:
+            struct = structs.get((type(struct), struct.name))
+        if struct is None:
+            return None
+        declaration_type = next(
+            (
+                member.type
+                for member in struct.decls
+                if member.name == expr.field.name
+            ),
+            None,
         )
+    else:
+        return None
+    if declaration_type is None:
+        return None
+    return resolve_typedefs(declaration_type, typedefs)
+
+
+def resolve_called_pointer_type(call, scope, typedefs, structs):
+    """
+    Returns the type of the function pointer the call is made through, if the
+    call is made through a function pointer and its type can be found.
+    Dereferencing a function pointer, like in (*fp)(x), does not change the
+    function it calls.
+    """
+    expr = call.name
+    while isinstance(expr, c_ast.UnaryOp) and expr.op == "*":
+        expr = expr.expr
+    pointer_type = resolve_expression_type(expr, scope, typedefs, structs)
+    if isinstance(pointer_type, c_ast.PtrDecl) and isinstance(
+        resolve_typedefs(pointer_type.type, typedefs), c_ast.FuncDecl
+    ):
+        return pointer_type
+    return None
+
+
+def collect_file_scope_types(ast):
+    """
+    Collects the declarations made at file scope: the types of the declared
+    names, the types of the typedef names and the structs and unions with
+    their members, keyed by their kind and name.
+    """
+    declarations, typedefs, structs = dict(), dict(), dict()
+    nodes = []
+    for item in ast.ext:
+        if isinstance(item, c_ast.Typedef):
+            typedefs[item.name] = item.type
+        elif isinstance(item, c_ast.Decl) and item.name is not None:
+            declarations[item.name] = item.type
+        if not isinstance(item, c_ast.FuncDef):
+            nodes.append(item)
+    while nodes:
+        current = nodes.pop()
+        if (
+            isinstance(current, (c_ast.Struct, c_ast.Union))
+            and current.decls is not None
+        ):
+            structs[(type(current), current.name)] = current
+        nodes.extend(child for _, child in current.children())
+    return declarations, typedefs, structs
+
 
-    for function in involved_functions:
-        file_content += (
-            "\n"
-            + visitor.visit(involved_functions[function].call_struct)
-            + ";\n"
+def resolve_indirect_tail_calls(ast, func_def_map):
+    """
+    Finds the calls through function pointers in tail position of the
+    functions of func_def_map that can be resolved to a known set of
+    functions: the functions whose addresses are taken and whose signatures
+    are the same as the type of the pointer. Returns a mapping from the name
+    of each function with such calls to the IndirectTailCall of each of
+    them, by call. The candidates are kept in the order of the definitions.
+    The calls of functions that return another type than the candidates are
+    left out, see returns_same_type.
+    """
+    calls_of_functions = dict()
+    for function_name, function_definition in func_def_map.items():
+        calls = [
+            call
+            for call in find_function_tail_calls(function_definition)
+            if not isinstance(call.name, c_ast.ID)
+            or call.name.name not in func_def_map
+        ]
+        if calls:
+            calls_of_functions[function_name] = calls
+    if not calls_of_functions:
+        return dict()
+    address_taken_functions = find_address_taken_functions(ast, func_def_map)
+    if not address_taken_functions:
+        return dict()
+
+    functions_of_signatures = dict()
+    for function_name, function_definition in func_def_map.items():
+        if function_name in address_taken_functions:
+            functions_of_signatures.setdefault(
+                get_function_signature(function_definition.decl.type), []
+            ).append(function_name)
+    declarations, typedefs, structs = collect_file_scope_types(ast)
+    indirect_tail_calls = dict()
+    for function_name, calls in calls_of_functions.items():
+        resolver = CallTypeResolver(
+            set(calls), declarations, typedefs, structs
         )
+        resolver.visit(func_def_map[function_name])
+        for call in calls:
+            pointer_type = resolver.pointer_types.get(call)
+            if pointer_type is None:
+                continue
+            function_type = resolve_typedefs(pointer_type.type, typedefs)
+            candidates = functions_of_signatures.get(
+                get_function_signature(function_type)
+            )
+            if candidates and returns_same_type(
+                func_def_map[function_name], func_def_map[candidates[0]]
+            ):
+                indirect_tail_calls.setdefault(function_name, dict())[call] = (
+                    IndirectTailCall(call, pointer_type, candidates)
+                )
+    return indirect_tail_calls
+
+
+def assign_indirect_tail_calls(involved_functions, indirect_tail_calls):
+    """
+    Gives each function merged into a block function its indirect tail calls
+    that can jump to functions merged into the same block function, with
+    only those functions as their candidates.
+    """
+    for function_name, function_info in involved_functions.items():
+        for call, indirect_tail_call in indirect_tail_calls.get(
+            function_name, dict()
+        ).items():
+            candidates = [
+                candidate
+                for candidate in indirect_tail_call.candidates
+                if candidate in involved_functions
+            ]
+            if candidates:
+                function_info.indirect_tail_calls[call] = IndirectTailCall(
+                    call, indirect_tail_call.pointer_type, candidates
+                )
+
+
+def get_tail_callees(
+    call, caller_definition, func_def_map, indirect_tail_calls
+):
+    """
+    Returns the names of the functions of func_def_map a call in tail
+    position of the caller can call: the function it calls by name, unless
+    it returns another type than the caller, see returns_same_type, or the
+    candidates of a call through a function pointer found by
+    resolve_indirect_tail_calls.
+    """
+    if isinstance(call.name, c_ast.ID) and call.name.name in func_def_map:
+        if not returns_same_type(
+            caller_definition, func_def_map[call.name.name]
+        ):
+            return []
+        return [call.name.name]
+    if call in indirect_tail_calls:
+        return indirect_tail_calls[call].candidates
+    return []
 
-    file_content += "\n" + visitor.visit(block_call_union) + ";\n"
-    file_content += "\n" + visitor.visit(block_function) + "\n"
-    file_content += "\n" + visitor.visit(ast) + "\n"
 
-    with open(f"{filename[:-2]}_removed.c", "w") as file:
-        file.write(file_content)
+def build_tail_call_graph(func_def_map, indirect_tail_calls=None):
+    """
+    Builds the tail call graph of the functions. It maps the name of every
+    function to the names of the functions it tail calls, in the order of
+    their first tail call. Functions that are not defined in the source, like
+    library functions, are left out of the graph. A call through a function
+    pointer is an edge to each of its candidates, if indirect_tail_calls, as
+    returned by resolve_indirect_tail_calls, is given.
+    """
+    indirect_tail_calls = indirect_tail_calls or dict()
+    graph = dict()
+    for function_name, function_definition in func_def_map.items():
+        callees = []
+        for tail_call in find_function_tail_calls(function_definition):
+            for called_function_name in get_tail_callees(
+                tail_call,
+                function_definition,
+                func_def_map,
+                indirect_tail_calls.get(function_name, dict()),
+            ):
+                if called_function_name not in callees:
+                    callees.append(called_function_name)
+        graph[function_name] = callees
+    return graph
+
+
+def find_variable_names(function_definition, declarations=None):
+    """
+    Finds the names of the variables a call by name inside the function can
+    be made through, like a function pointer parameter: the parameters and
+    the local variables of the function and the variables of the file scope
+    declarations, as returned by collect_file_scope_types, as opposed to
+    the names of functions.
+    """
+    names = {param.name for param in get_function_params(function_definition)}
+    nodes = [function_definition.body]
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.Decl) and not isinstance(
+            current.type, c_ast.FuncDecl
+        ):
+            names.add(current.name)
+        nodes.extend(child for _, child in current.children())
+    names.update(
+        name
+        for name, declaration_type in (declarations or dict()).items()
+        if not isinstance(declaration_type, c_ast.FuncDecl)
+    )
+    names.discard(None)
+    return names
+
+
+def classify_tail_calls(
+    func_def_map,
+    blocks,
+    loop_functions,
+    declarations=None,
+    resolved_tail_calls=None,
+):
+    """
+    Finds the calls in tail position of the functions and decides whether
+    each of them is eliminated by the given blocks and loop functions, as
+    returned by partition_involved_functions. A call by the name of a
+    variable, like a function pointer parameter, is an indirect call, which
+    is told apart from a call of a function that is not defined in the file
+    with the file scope declarations, as returned by
+    collect_file_scope_types. The candidates of an indirect call are the
+    functions it jumps to in its block, if it is eliminated, or the ones
+    found by resolve_indirect_tail_calls otherwise, if resolved_tail_calls,
+    as returned by it, is given. It must be called before the functions are
+    changed. Returns the list of TailCall instances.
+    """
+    resolved_tail_calls = resolved_tail_calls or dict()
+    block_of = {
+        function_name: block
+        for block in blocks
+        for function_name in block.involved_functions
+    }
+    loop_function_names = {
+        function_definition.decl.name for function_definition in loop_functions
+    }
+    tail_calls = []
+    for function_name, function_definition in func_def_map.items():
+        block = block_of.get(function_name)
+        indirect_tail_calls = (
+            block.involved_functions[function_name].indirect_tail_calls
+            if block is not None
+            else dict()
+        )
+        variable_names = None
+        for call in find_function_tail_calls(function_definition):
+            if call in indirect_tail_calls:
+                tail_calls.append(
+                    TailCall(
+                        function_name,
+                        call,
+                        candidates=indirect_tail_calls[call].candidates,
+                    )
+                )
+                continue
+            if (
+                isinstance(call.name, c_ast.ID)
+                and call.name.name not in func_def_map
+                and variable_names is None
+            ):
+                variable_names = find_variable_names(
+                    function_definition, declarations
+                )
+            reason, candidates = None, None
+            if not isinstance(call.name, c_ast.ID) or call.name.name in (
+                variable_names or ()
+            ):
+                reason = "indirect call with no known target in the block"
+                resolved_tail_call = resolved_tail_calls.get(
+                    function_name, dict()
+                ).get(call)
+                candidates = (
+                    resolved_tail_call.candidates
+                    if resolved_tail_call is not None
+                    else []
+                )
+            elif call.name.name not in func_def_map:
+                reason = "callee not defined in the file"
+            elif not returns_same_type(
+                function_definition, func_def_map[call.name.name]
+            ):
+                reason = "callee returns another type than the caller"
+            elif function_name in loop_function_names:
+                if call.name.name != function_name:
+                    reason = "not a self tail call of a loop function"
+            elif block is None or block is not block_of.get(call.name.name):
+                reason = "functions not merged into the same block function"
+            tail_calls.append(
+                TailCall(function_name, call, reason, candidates)
+            )
+    return tail_calls
+
+
+def find_strongly_connected_components(graph):
+    """
+    Finds the strongly connected components of the graph with Tarjan's
+    algorithm. The recursion of the algorithm is replaced by an explicit
+    stack, so that long chains of functions do not hit Python's recursion
+    limit. The components are returned in reverse topological order, meaning
+    that a component comes after every component it has an edge to.
+    """
+    index_of, low_link = dict(), dict()
+    stack, on_stack = [], set()
+    components = []
+    next_index = 0
+    for root in graph:
+        if root in index_of:
+            continue
+        work = [(root, iter(graph[root]))]
+        index_of[root] = low_link[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index_of:
+                    index_of[successor] = low_link[successor] = next_index
+                    next_index += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(graph[successor])))
+                    break
+                elif successor in on_stack:
+                    low_link[node] = min(low_link[node], index_of[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+                if low_link[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def find_recursion_cycles(graph):
+    """
+    Finds the strongly connected components of the tail call graph that are
+    recursion cycles, meaning they either have more than one function or a
+    single function that tail calls itself. The functions of each cycle are
+    kept in the order of the graph, which is the order of their definitions.
+    """
+    order = {function_name: i for i, function_name in enumerate(graph)}
+    cycles = []
+    for component in find_strongly_connected_components(graph):
+        if len(component) > 1 or component[0] in graph[component[0]]:
+            cycles.append(sorted(component, key=order.get))
+    cycles.sort(key=lambda cycle: order[cycle[0]])
+    return cycles
+
+
+def find_self_recursive_functions(graph, options):
+    """
+    Finds the functions that can be rewritten into loops: the functions that
+    tail call themselves and are not part of a larger recursion cycle. With
+    the single partition, they must also not tail call or be tail called by
+    any other function, as those functions are all merged into the block
+    function. With the scc partition, their other tail calls are plain calls.
+    """
+    if not options.loop_rewrite:
+        return []
+    tail_called_by_others = {
+        callee
+        for function_name, callees in graph.items()
+        for callee in callees
+        if callee != function_name
+    }
+    self_recursive_functions = []
+    for cycle in find_recursion_cycles(graph):
+        if len(cycle) > 1:
+            continue
+        function_name = cycle[0]
+        if options.partition == "single" and (
+            graph[function_name] != [function_name]
+            or function_name in tail_called_by_others
+        ):
+            continue
+        self_recursive_functions.append(function_name)
+    return self_recursive_functions
+
+
+def partition_involved_functions(ast, func_def_map, options):
+    """
+    Decides which functions are merged into which block function according
+    to the partition option. Returns the list of the blocks and the list of
+    the definitions of the functions that are rewritten into loops instead.
+    The calls through function pointers in tail position are tail call edges
+    to the functions they can call, and the ones that can jump inside their
+    block function are given to the FunctionInfo of their caller.
+    """
+    indirect_tail_calls = resolve_indirect_tail_calls(ast, func_def_map)
+    graph = build_tail_call_graph(func_def_map, indirect_tail_calls)
+    loop_functions = find_self_recursive_functions(graph, options)
+    loop_function_definitions = [
+        func_def_map[function_name] for function_name in loop_functions
+    ]
+    if options.partition == "single":
+        involved_functions = identify_involved_functions(
+            ast, func_def_map, loop_functions, indirect_tail_calls
+        )
+        assign_indirect_tail_calls(involved_functions, indirect_tail_calls)
+        blocks = [BlockInfo(involved_functions)] if involved_functions else []
+        return blocks, loop_function_definitions
+
+    blocks = []
+    cycles = [
+        cycle
+        for cycle in find_recursion_cycles(graph)
+        if cycle[0] not in loop_functions
+    ]
+    for i, cycle in enumerate(cycles):
+        involved_functions = {
+            function_name: generate_function_info(
+                func_def_map[function_name], index
+            )
+            for index, function_name in enumerate(cycle)
+        }
+        assign_indirect_tail_calls(involved_functions, indirect_tail_calls)
+        blocks.append(
+            BlockInfo(
+                involved_functions,
+                f"{GlobalParameters.block_name}_{i}",
+                f"{GlobalParameters.block_call_union_name}_{i}",
+            )
+        )
+    return blocks, loop_function_definitions
+
+
+def find_called_functions(node):
+    """Finds the names of the functions called by name inside the node."""
+    called_functions = set()
+    nodes = [node]
+    while nodes:
+        current = nodes.pop()
+        if isinstance(current, c_ast.FuncCall) and isinstance(
+            current.name, c_ast.ID
+        ):
+            called_functions.add(current.name.name)
+        nodes.extend(child for _, child in current.children())
+    return called_functions
+
+
+def get_functions_called_by_blocks(blocks, ast):
+    """
+    Returns the definitions of the functions of the source that are called
+    inside the block functions but are not merged into any of them. They need
+    to be declared before the block functions, as their definitions come
+    after them in the result.
+    """
+    involved_functions, called_functions = set(), set()
+    for block in blocks:
+        involved_functions.update(block.involved_functions)
+        if block.called_functions is not None:
+            called_functions.update(block.called_functions)
+        else:
+            called_functions.update(find_called_functions(block.function))
+    return [
+        function_definition
+        for function_name, function_definition in get_functions_def_map(
+            ast
+        ).items()
+        if function_name in called_functions
+        and function_name not in involved_functions
+    ]
+
+
+def write_result(stream, directives, blocks, ast, visitor=None):
+    """
+    Writes the final result of the tail call elimination process as source
+    code to the stream. The result is written one piece at a time, down to
+    each top level declaration of the file, so that the whole result is never
+    held in memory at once. A code generator other than CodeGenerator can be
+    given as the visitor, as long as it generates the nodes it adds.
+
+    The call structs and unions of the blocks come right before the first
+    function definition of the file, so that they can use the types declared
+    before it, and the block functions come after the last top level
+    declaration that is not a function definition, so that they can use the
+    global variables of the file, like the tables of function pointers their
+    indirect tail calls are made through. <stddef.h> is included before the
+    first union for the offsetof of its assertions.
+    """
+    visitor = visitor or CodeGenerator()
+    stream.writelines(directives)
+    first_function_position, blocks_position = get_block_positions(ast)
+    includes_stddef = False
+    if first_function_position > 0:
+        stream.write("\n")
+        write_declarations(stream, visitor, ast.ext[:first_function_position])
+
+    for block in blocks:
+        stream.write("\n")
+        for function in block.involved_functions:
+            function_info = block.involved_functions[function]
+            stream.write(
+                f"#define {function_info.index_label} {function_info.index}\n"
+            )
+
+    for block in blocks:
+        stream.write("\n")
+        for function in block.involved_functions:
+            if not block.involved_functions[function].has_wrapper:
+                continue
+            declaration = block.involved_functions[
+                function
+            ].function_definition.decl
+            storage = "" if "static" in declaration.storage else "extern "
+            stream.write(storage + visitor.visit(declaration) + ";\n")
+
+    for function_definition in get_functions_called_by_blocks(blocks, ast):
+        stream.write(visitor.visit(function_definition.decl) + ";\n")
+
+    for block in blocks:
+        for function in block.involved_functions:
+            stream.write(
+                "\n"
+                + visitor.visit(block.involved_functions[function].call_struct)
+                + ";\n"
+            )
+
+        stream.write("\n")
+        frame_asserts = []
+        if block.frame_layout is not None:
+            result_asserts = block.frame_layout.generate_result_asserts(
+                function_info.call_struct
+                for function_info in block.involved_functions.values()
+            )
+            if result_asserts and not includes_stddef:
+                stream.write("#include <stddef.h>\n")
+                includes_stddef = True
+            stream.write(block.frame_layout.generate_report() + "\n")
+            frame_assert = block.frame_layout.generate_assert()
+            if frame_assert is not None:
+                frame_asserts.append(frame_assert)
+            frame_asserts.extend(result_asserts)
+        stream.write(visitor.visit(block.call_union) + ";\n")
+        for frame_assert in frame_asserts:
+            stream.write(visitor.visit(frame_assert) + ";\n")
+        if blocks_position > first_function_position:
+            stream.write(visitor.visit(block.function.decl) + ";\n")
+        else:
+            stream.write("\n")
+            write_function_definition(stream, visitor, block.function)
+        stream.write("\n")
+
+    stream.write("\n")
+    write_declarations(
+        stream, visitor, ast.ext[first_function_position:blocks_position]
+    )
+    if blocks_position > first_function_position:
+        for block in blocks:
+            stream.write("\n")
+            write_function_definition(stream, visitor, block.function)
+            stream.write("\n")
+    write_declarations(stream, visitor, ast.ext[blocks_position:])
+    stream.write("\n")
+
+
+def get_block_positions(ast):
+    """
+    Returns the position of the first function definition among the top
+    level declarations of the AST, where the call structs and unions of the
+    blocks go, and the position the block functions go to, which is after
+    every top level declaration that is not a function definition.
+    """
+    first_function_position = next(
+        (
+            position
+            for position, ext in enumerate(ast.ext)
+            if isinstance(ext, c_ast.FuncDef)
+        ),
+        len(ast.ext),
+    )
+    blocks_position = first_function_position
+    for position, ext in enumerate(ast.ext):
+        if not isinstance(ext, c_ast.FuncDef):
+            blocks_position = max(blocks_position, position + 1)
+    return first_function_position, blocks_position
+
+
+def write_declarations(stream, visitor, items):
+    """
+    Writes the top level declarations to the stream, the same as visiting the
+    whole FileAST would, one declaration at a time.
+    """
+    for ext in items:
+        if isinstance(ext, c_ast.FuncDef):
+            stream.write(visitor.visit(ext))
+        elif isinstance(ext, c_ast.Pragma):
+            stream.write(visitor.visit(ext) + "\n")
+        else:
+            stream.write(visitor.visit(ext) + ";\n")
+
+
+def write_function_definition(stream, visitor, function_definition):
+    """
+    Writes the function definition to the stream the same way visiting it
+    would generate it, but one statement of its body at a time. This keeps
+    the block function, whose size grows with the number of involved
+    functions, from being generated as a single string.
+    """
+    stream.write(visitor.visit(function_definition.decl) + "\n")
+    visitor.indent_level = 0
+    write_statement(stream, visitor, function_definition.body)
+    stream.write("\n")
+
+
+def write_statement(stream, visitor, statement):
+    """
+    Writes the statement to the stream the same way the visitor generates
+    it. Compound statements and switch statements with a compound body, like
+    the one that dispatches the cases of the block function, are written one
+    inner statement at a time.
+    """
+    if isinstance(statement, c_ast.Compound):
+        stream.write(visitor._make_indent() + "{\n")
+        visitor.indent_level += 2
+        for item in statement.block_items or []:
+            write_statement(stream, visitor, item)
+        visitor.indent_level -= 2
+        stream.write(visitor._make_indent() + "}\n")
+    elif isinstance(statement, c_ast.Switch) and isinstance(
+        statement.stmt, c_ast.Compound
+    ):
+        stream.write(
+            visitor._make_indent()
+            + "switch ("
+            + visitor.visit(statement.cond)
+            + ")\n"
+        )
+        write_statement(stream, visitor, statement.stmt)
+        stream.write("\n")
+    else:
+        stream.write(visitor._generate_stmt(statement))
+
+
+def generate_result(directives, blocks, ast, visitor=None):
+    """
+    Generate the final result of the tail call elimination process as source
+    code. A code generator other than CodeGenerator can be given as the
+    visitor, see write_result.
+    """
+    stream = io.StringIO()
+    write_result(stream, directives, blocks, ast, visitor)
+    return stream.getvalue()
+
+
+@contextlib.contextmanager
+def open_output_file(filename, output_filename=None):
+    """
+    Opens the file the result of the given file is saved to for writing,
+    unless another output file is given. The result is written to a
+    temporary file beside it, which replaces it only once the whole result
+    is written, so that a failed conversion does not leave a partial result
+    behind.
+    """
+    output_filename = output_filename or get_output_filename(filename)
+    temporary_filename = f"{output_filename}.{os.getpid()}.tmp"
+    try:
+        with open(
+            temporary_filename, "w", buffering=OUTPUT_BUFFER_SIZE
+        ) as file:
+            yield file
+        os.replace(temporary_filename, output_filename)
+    except BaseException:
+        if os.path.exists(temporary_filename):
+            os.remove(temporary_filename)
+        raise
+
+
+def write_result_to_disk(directives, blocks, ast, filename, visitor=None):
+    """
+    Write the final result of the tail call elimination process to disk,
+    streaming it through a buffered file.
+    """
+    with open_output_file(filename) as file:
+        write_result(file, directives, blocks, ast, visitor)
+
+
+def append_json_line(path, record):
+    """
+    Appends the record to the JSON lines file with a single write, so that
+    the records of concurrent worker processes are not interleaved.
+    """
+    line = (json.dumps(record) + "\n").encode()
+    descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(descriptor, line)
+    finally:
+        os.close(descriptor)
 
 
 def generate_2d_struct_ref(
@@ -0,0 +1,536 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pycparser import c_ast, c_generator
+import copy
+import os
+import re
+import batch
+from block import Block
+import frame_layout
+import main
+from new_functions import NewFunctions
+import pgo
+import prelude
+import utils
+from utils import GlobalParameters
+
+# The name of the translation unit the block functions of the recursion
+# cycles that span several files are written to, unless another is given
+DEFAULT_BLOCKS_FILENAME = "tail_call_blocks_removed.c"
+
+INCLUDE_PATTERN = re.compile(r"\s*#\s*include")
+QUOTED_INCLUDE_PATTERN = re.compile(r'(\s*#\s*include\s*)"([^"]+)"(.*)', re.S)
+
+
+class TranslationUnit:
+    """
+    A class used to store a source file of the program along with its
+    directives, its AST and the numbers of the lines of its parsed code in
+    the source, as filled in by utils.split_directives.
+    """
+
+    def __init__(self, filename, directives, ast, line_numbers=None):
+        self.filename = filename
+        self.directives = directives
+        self.ast = ast
+        self.line_numbers = line_numbers
+        self.func_def_map = utils.get_functions_def_map(ast)
+        # The names of the functions moved to the blocks translation unit
+        self.moved_functions = []
+
+
+class CrossFileCycle:
+    """
+    A class used to store a recursion cycle of the tail call graph whose
+    functions are defined in more than one file, along with the declarations
+    its functions need in the blocks translation unit. If the cycle cannot be
+    moved there, the reason is stored instead.
+    """
+
+    def __init__(self, function_names):
+        self.function_names = function_names
+        self.type_declarations = []
+        self.declarations = []
+        self.reason = None
+
+
+def parse_unit(filename, options=None):
+    """Parses a source file of the program into a TranslationUnit."""
+    options = options or utils.TransformOptions()
+    with open(filename) as file:
+        source = file.read()
+    line_numbers = []
+    directives, code = utils.split_directives(
+        source.splitlines(keepends=True), line_numbers
+    )
+    file_scope = None
+    if options.preprocessor is not None:
+        file_scope = prelude.load_file_scope(
+            directives, options.preprocessor, filename
+        )
+    ast = utils.parse("".join(code), filename, file_scope)
+    return TranslationUnit(filename, directives, ast, line_numbers)
+
+
+def parse_units(filenames, options=None, jobs=None):
+    """
+    Parses the source files of the program in parallel, with one worker
+    process per available core unless jobs is given.
+    """
+    jobs = jobs or batch.available_cores()
+    if jobs == 1 or len(filenames) == 1:
+        return [parse_unit(filename, options) for filename in filenames]
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(filenames))
+    ) as executor:
+        return list(
+            executor.map(partial(parse_unit, options=options), filenames)
+        )
+
+
+def is_static(declaration):
+    return "static" in declaration.storage
+
+
+def is_type_declaration(item):
+    """
+    Checks whether the top level declaration only declares a type, like a
+    typedef or the definition of a struct, a union or an enum.
+    """
+    return isinstance(item, c_ast.Typedef) or (
+        isinstance(item, c_ast.Decl)
+        and item.name is None
+        and isinstance(item.type, (c_ast.Struct, c_ast.Union, c_ast.Enum))
+    )
+
+
+def get_type_declaration_key(item, text):
+    """
+    Returns the key that identifies what the type declaration declares, so
+    that two files that declare the same type differently are noticed.
+    """
+    if isinstance(item, c_ast.Typedef):
+        return ("typedef", item.name)
+    if item.type.name is not None:
+        return (type(item.type).__name__, item.type.name)
+    return ("anonymous", text)
+
+
+def get_file_scope_declarations(unit):
+    """
+    Maps the names declared at the file scope of the unit, other than the
+    type names, to their last declaration or definition.
+    """
+    declarations = dict()
+    for item in unit.ast.ext:
+        if isinstance(item, c_ast.FuncDef):
+            declarations[item.decl.name] = item.decl
+        elif (
+            isinstance(item, c_ast.Decl)
+            and item.name is not None
+            and not is_type_declaration(item)
+        ):
+            declarations[item.name] = item
+    return declarations
+
+
+def build_program_index(units):
+    """
+    Maps the name of every function with external linkage defined in the
+    program to the unit it is defined in. Static functions are left out, as
+    they can only be called from their own file.
+    """
+    index = dict()
+    for unit in units:
+        for function_name, function_definition in unit.func_def_map.items():
+            if not is_static(function_definition.decl):
+                index.setdefault(function_name, unit)
+    return index
+
+
+def build_program_tail_call_graph(units, index):
+    """
+    Builds the tail call graph of the functions with external linkage of the
+    whole program. A tail call to a name that a file defines as a static
+    function refers to that function, so it is not an edge of the graph, and
+    neither is a tail call to a function that returns another type, see
+    utils.returns_same_type.
+    """
+    graph = dict()
+    for function_name, unit in index.items():
+        static_functions = {
+            name
+            for name, function_definition in unit.func_def_map.items()
+            if is_static(function_definition.decl)
+        }
+        callees = []
+        function_definition = unit.func_def_map[function_name]
+        for tail_call in utils.find_tail_calls(
+            function_definition.body.block_items or [],
+            utils.is_void_function(function_definition),
+        ):
+            called_function_name = tail_call.name.name
+            if (
+                called_function_name in index
+                and called_function_name not in static_functions
+                and called_function_name not in callees
+                and utils.returns_same_type(
+                    function_definition,
+                    index[called_function_name].func_def_map[
+                        called_function_name
+                    ],
+                )
+            ):
+                callees.append(called_function_name)
+        graph[function_name] = callees
+    return graph
+
+
+def find_cross_file_cycles(units, index):
+    """
+    Finds the recursion cycles of the program whose functions are defined in
+    more than one file. The cycles inside a single file are left to the
+    conversion of that file.
+    """
+    graph = build_program_tail_call_graph(units, index)
+    return [
+        CrossFileCycle(cycle)
+        for cycle in utils.find_recursion_cycles(graph)
+        if len({id(index[function_name]) for function_name in cycle}) > 1
+    ]
+
+
+def can_forward_parameters(function_definition):
+    """
+    Checks whether the parameters of the function can be forwarded by a
+    wrapper, which is not possible for variadic or K&R style functions.
+    """
+    if function_definition.param_decls:
+        return False
+    args = function_definition.decl.type.args
+    if args is None:
+        return True
+    return not any(
+        isinstance(param, c_ast.EllipsisParam) for param in args.params
+    )
+
+
+def generate_external_declaration(declaration):
+    """
+    Generates the declaration of a function or a variable of another file
+    that refers to its definition: a prototype without inline, or an extern
+    declaration without an initializer.
+    """
+    declaration = copy.copy(declaration)
+    declaration.funcspec = []
+    if not isinstance(declaration.type, c_ast.FuncDecl):
+        declaration.storage = ["extern"]
+        declaration.init = None
+    return declaration
+
+
+def plan_cycle(cycle, index, generator, declared_types):
+    """
+    Collects the declarations the functions of the cycle need in the blocks
+    translation unit: the type declarations of their files and the
+    declarations of the names of their files they use. The cycle cannot be
+    moved if one of its functions uses a static name of its file, cannot have
+    its parameters forwarded, or if its files declare the same type
+    differently than the files of the previous cycles.
+    """
+    units = []
+    for function_name in cycle.function_names:
+        unit = index[function_name]
+        if unit not in units:
+            units.append(unit)
+        function_definition = unit.func_def_map[function_name]
+        if not can_forward_parameters(function_definition):
+            cycle.reason = f"{function_name} has variadic or K&R parameters"
+            return False
+        declarations = get_file_scope_declarations(unit)
+        for name in sorted(utils.find_referenced_names(function_definition)):
+            declaration = declarations.get(name)
+            if declaration is None:
+                continue
+            if is_static(declaration):
+                cycle.reason = (
+                    f"{function_name} uses the static {name} of "
+                    f"{unit.filename}"
+                )
+                return False
+            cycle.declarations.append(
+                generate_external_declaration(declaration)
+            )
+
+    new_types = dict()
+    for unit in units:
+        for item in unit.ast.ext:
+            if not is_type_declaration(item):
+                continue
+            text = generator.visit(item)
+            key = get_type_declaration_key(item, text)
+            previous_text = declared_types.get(key, new_types.get(key))
+            if previous_text is None:
+                new_types[key] = text
+                cycle.type_declarations.append(item)
+            elif previous_text != text:
+                cycle.reason = (
+                    f"{unit.filename} declares {key[1]} differently than "
+                    "another file of the cycle"
+                )
+                return False
+    declared_types.update(new_types)
+    return True
+
+
+def generate_entry_name(function_name):
+    return f"{function_name}_ENTRY"
+
+
+def rename_function_declaration(declaration, name):
+    declaration = copy.copy(declaration)
+    declaration.name = name
+    declaration.type = utils.rename_declaration_type(declaration.type, name)
+    return declaration
+
+
+def generate_cycle_block(cycle, index, block_index, options):
+    """
+    Generates the block function of the cycle and the entry functions that
+    call it, one for each function of the cycle. The entry functions are
+    generated like the wrappers of a single file, but named after
+    generate_entry_name so that the functions in their own files can become
+    wrappers that call them. The definitions in the files are not changed.
+    With execution profiles, the block is prepared with them like the blocks
+    of a single file, see pgo.apply_profile.
+    """
+    involved_functions = dict()
+    for function_index, function_name in enumerate(cycle.function_names):
+        definition = index[function_name].func_def_map[function_name]
+        function_definition = c_ast.FuncDef(
+            copy.copy(definition.decl),
+            None,
+            c_ast.Compound(definition.body.block_items, definition.body.coord),
+        )
+        involved_functions[function_name] = utils.generate_function_info(
+            function_definition, function_index
+        )
+    block = utils.BlockInfo(
+        involved_functions,
+        f"program_{GlobalParameters.block_name}_{block_index}",
+        f"program_{GlobalParameters.block_call_union_name}_{block_index}",
+    )
+    _, typedefs, structs = utils.collect_file_scope_types(
+        c_ast.FileAST(cycle.type_declarations + cycle.declarations)
+    )
+    frame_layout.layout_block(block, typedefs, structs)
+    if options.pgo_profiles is not None:
+        pgo.apply_profile(
+            block,
+            pgo.load_profile(options.pgo_profiles),
+            {unit.filename: unit.line_numbers for unit in index.values()},
+        )
+    block.call_union = Block.generate_block_call_union(
+        block.involved_functions, block.call_union_name
+    )
+    block.function = Block.generate_block_function(
+        block.involved_functions, block.name, block.call_union_name, options
+    )
+    block.function.decl.storage = ["static"]
+    NewFunctions.change_function_definitions(
+        block.involved_functions,
+        block.call_union,
+        block.name,
+        options.frame_abi,
+    )
+    for function_name, function_info in block.involved_functions.items():
+        function_info.function_definition.decl = rename_function_declaration(
+            function_info.function_definition.decl,
+            generate_entry_name(function_name),
+        )
+    return block
+
+
+def relocate_directive(directive, unit, directory):
+    """
+    Changes the path of a quoted include of the unit so that it is found
+    from the given directory, if the included file is beside the unit.
+    """
+    match = QUOTED_INCLUDE_PATTERN.match(directive)
+    if match is None:
+        return directive
+    path = os.path.join(
+        os.path.dirname(os.path.abspath(unit.filename)), match.group(2)
+    )
+    if not os.path.isfile(path):
+        return directive
+    relative_path = os.path.relpath(path, directory)
+    return f'{match.group(1)}"{relative_path}"{match.group(3)}'
+
+
+def merge_directives(units, directory):
+    """
+    Merges the directives of the units into the directives of the blocks
+    translation unit. Repeated includes are left out, while the other
+    directives are kept in the order of the units, so that the conditional
+    directives of each unit stay balanced.
+    """
+    directives, includes = [], set()
+    for unit in units:
+        for directive in unit.directives:
+            directive = relocate_directive(directive, unit, directory)
+            if INCLUDE_PATTERN.match(directive):
+                if directive.strip() in includes:
+                    continue
+                includes.add(directive.strip())
+            directives.append(directive)
+    return directives
+
+
+def write_blocks_unit(stream, cycles, index, options, directory):
+    """
+    Writes the blocks translation unit of the cycles: the directives and the
+    type declarations of their files, the declarations their functions use,
+    and the block functions along with their entry functions.
+    """
+    generator = utils.CodeGenerator()
+    units = []
+    for cycle in cycles:
+        for function_name in cycle.function_names:
+            if index[function_name] not in units:
+                units.append(index[function_name])
+    stream.writelines(merge_directives(units, directory))
+
+    stream.write("\n")
+    written_declarations = set()
+    for cycle in cycles:
+        for item in cycle.type_declarations + cycle.declarations:
+            text = generator.visit(item)
+            if text not in written_declarations:
+                written_declarations.add(text)
+                stream.write(text + ";\n")
+
+    blocks = [
+        generate_cycle_block(cycle, index, block_index, options)
+        for block_index, cycle in enumerate(cycles)
+    ]
+    entries = [
+        function_info.function_definition
+        for block in blocks
+        for function_info in block.involved_functions.values()
+    ]
+    utils.write_result(stream, [], blocks, c_ast.FileAST(entries), generator)
+
+
+def replace_with_wrapper(unit, function_name):
+    """
+    Replaces the body of the function in its file with a call to its entry
+    function in the blocks translation unit, which is declared before it.
+    """
+    function_definition = unit.func_def_map[function_name]
+    entry_name = generate_entry_name(function_name)
+    entry_declaration = generate_external_declaration(
+        rename_function_declaration(function_definition.decl, entry_name)
+    )
+    entry_declaration.storage = ["extern"]
+    unit.ast.ext.insert(
+        unit.ast.ext.index(function_definition), entry_declaration
+    )
+
+    params = utils.get_function_params(function_definition)
+    call = c_ast.FuncCall(
+        c_ast.ID(entry_name),
+        (
+            c_ast.ExprList([c_ast.ID(param.name) for param in params])
+            if params
+            else None
+        ),
+    )
+    statement = (
+        call
+        if utils.is_void_function(function_definition)
+        else c_ast.Return(call)
+    )
+    function_definition.body = c_ast.Compound([statement])
+    unit.moved_functions.append(function_name)
+
+
+def write_unit(unit, options):
+    """
+    Removes the tail calls inside the unit, leaving out the functions moved
+    to the blocks translation unit, and writes its result beside it. The
+    block functions of the unit are made static, so that they do not clash
+    with the block functions of the other files when the program is linked.
+    """
+    func_def_map = {
+        function_name: function_definition
+        for function_name, function_definition in unit.func_def_map.items()
+        if function_name not in unit.moved_functions
+    }
+    blocks = main.eliminate_tail_calls(
+        unit.ast,
+        options,
+        func_def_map=func_def_map,
+        line_numbers={unit.filename: unit.line_numbers},
+    )
+    for block in blocks:
+        block.function.decl.storage = ["static"]
+    utils.write_result_to_disk(
+        unit.directives, blocks, unit.ast, unit.filename
+    )
+
+
+def get_blocks_filename(filenames):
+    """
+    Returns the default path of the blocks translation unit, in the deepest
+    directory that holds all the files of the program.
+    """
+    directory = os.path.commonpath(
+        [os.path.dirname(os.path.abspath(filename)) for filename in filenames]
+    )
+    return os.path.join(directory, DEFAULT_BLOCKS_FILENAME)
+
+
+def remove_tail_calls(
+    filenames, options=None, jobs=None, blocks_filename=None
+):
+    """
+    Removes the tail calls of the whole program made of the given files. The
+    files are parsed in parallel, and the tail call graph of the functions
+    of every file is built to find the recursion cycles that span several
+    files. The functions of each such cycle are merged into a block function
+    in a shared translation unit, and in their own files they become thin
+    wrappers that call into it, so that every file can still be compiled
+    separately. The rest of each file is converted as it would be on its
+    own. Returns the cross-file cycles, along with the reasons why some of
+    them could not be moved.
+    """
+    options = options or utils.TransformOptions()
+    blocks_filename = blocks_filename or get_blocks_filename(filenames)
+    units = parse_units(filenames, options, jobs)
+    index = build_program_index(units)
+    cycles = find_cross_file_cycles(units, index)
+
+    generator = c_generator.CGenerator()
+    declared_types = dict()
+    moved_cycles = [
+        cycle
+        for cycle in cycles
+        if plan_cycle(cycle, index, generator, declared_types)
+    ]
+    if moved_cycles:
+        with utils.open_output_file(blocks_filename, blocks_filename) as file:
+            write_blocks_unit(
+                file,
+                moved_cycles,
+                index,
+                options,
+                os.path.dirname(os.path.abspath(blocks_filename)),
+            )
+        for cycle in moved_cycles:
+            for function_name in cycle.function_names:
+                replace_with_wrapper(index[function_name], function_name)
+
+    for unit in units:
+        write_unit(unit, options)
+    return cycles
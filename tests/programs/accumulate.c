@@ -0,0 +1,53 @@
+#include <stdio.h>
+
+typedef unsigned long ulong;
+
+int fact(int n) {
+    if (n <= 1) {
+        return 1;
+    }
+    return n * fact(n - 1);
+}
+
+ulong sum(ulong n) {
+    return n == 0 ? 0 : n + sum(n - 1);
+}
+
+int sum_parts(int n, int k) {
+    if (n <= 0) {
+        return k;
+    }
+    if (n % 2) {
+        return (n & 3) + sum_parts(n - 1, k);
+    }
+    return sum_parts(n - 1, k) + 1;
+}
+
+unsigned and_all(unsigned n) {
+    if (n == 0) {
+        return ~0u;
+    }
+    return (n | 0xF0F0) & and_all(n - 1);
+}
+
+int xor_all(int n) {
+    return n ? (n ^ 5) ^ (3 ^ xor_all(n - 1)) : 7;
+}
+
+int mixed(int n) {
+    if (n < 1) {
+        return 1;
+    }
+    return n + mixed(n - 1) * 2;
+}
+
+int fib(int n) {
+    return n < 2 ? n : fib(n - 1) + fib(n - 2);
+}
+
+int main() {
+    printf("%d %lu %d\n", fact(10), sum(10000), sum_parts(10000, 4));
+    printf("%u %d %d %d\n", and_all(10000), xor_all(10001), mixed(10),
+           fib(20));
+    return 0;
+}
@@ -0,0 +1,59 @@
+#include <stdio.h>
+
+typedef struct vm VM;
+typedef int (*handler_t)(VM *);
+
+struct vm {
+    const unsigned char *code;
+    int pc;
+    long acc;
+    long steps;
+    handler_t next;
+};
+
+int op_inc(VM *vm);
+int op_dec(VM *vm);
+int op_jmp(VM *vm);
+int op_halt(VM *vm);
+
+static handler_t handlers[] = {op_inc, op_dec, op_jmp, op_halt};
+
+int dispatch(VM *vm) {
+    vm->steps++;
+    return handlers[vm->code[vm->pc]](vm);
+}
+
+int op_inc(VM *vm) {
+    vm->acc += 2;
+    vm->pc++;
+    return dispatch(vm);
+}
+
+int op_dec(VM *vm) {
+    vm->acc--;
+    vm->pc++;
+    return dispatch(vm);
+}
+
+int op_jmp(VM *vm) {
+    handler_t next;
+    if (vm->steps >= 30000) {
+        vm->pc++;
+        return dispatch(vm);
+    }
+    vm->pc = 0;
+    next = vm->steps % 2 ? op_inc : op_dec;
+    return next(vm);
+}
+
+int op_halt(VM *vm) {
+    return (int) (vm->acc % 1000003);
+}
+
+int main() {
+    static const unsigned char program[] = {0, 1, 0, 2, 3};
+    VM vm = {program, 0, 0, 0, 0};
+    int result = dispatch(&vm);
+    printf("%d %ld\n", result, vm.steps);
+    return 0;
+}
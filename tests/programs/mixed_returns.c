@@ -0,0 +1,59 @@
+#include <stdio.h>
+
+short small_half(int n);
+
+int small(int n) {
+    if (n > 100) {
+        return 65543;
+    }
+    return small_half(n + 1);
+}
+
+short small_half(int n) {
+    if (n == 50) {
+        return 7;
+    }
+    return small(n + 1);
+}
+
+double precise(int n);
+
+float rough(int n) {
+    if (n <= 0) {
+        return 1.5f;
+    }
+    return precise(n - 1);
+}
+
+double precise(int n) {
+    if (n <= 0) {
+        return 2.25;
+    }
+    return rough(n - 1);
+}
+
+void tick(int n);
+
+int counter;
+
+int tock(int n) {
+    counter++;
+    if (n <= 0) {
+        return counter;
+    }
+    tick(n - 1);
+    return 0;
+}
+
+void tick(int n) {
+    counter += 2;
+    tock(n);
+}
+
+int main() {
+    printf("%d %d %d\n", small(0), small(60), small_half(0));
+    printf("%g %g %g\n", rough(11), rough(12), precise(13));
+    tick(1000);
+    printf("%d\n", counter);
+    return 0;
+}
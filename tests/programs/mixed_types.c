@@ -0,0 +1,49 @@
+#include <stdio.h>
+
+int g(long x, char c);
+
+int f(int n) {
+    if (n == 0) {
+        return 42;
+    }
+    return g(n - 1, 'a');
+}
+
+int g(long x, char c) {
+    if (x == 0) {
+        return 7 + c - 'a';
+    }
+    return f((int) x - 1);
+}
+
+double scale(short s, double d, int n);
+
+double step(int n, double d) {
+    if (n == 0) {
+        return d;
+    }
+    return scale((short) n, d + 0.5, n - 1);
+}
+
+double scale(short s, double d, int n) {
+    return step(n, d * 1.0 + (s % 2) * 0.25);
+}
+
+long far(char c, long total, int n);
+
+long near(int n, long total) {
+    if (n <= 0) {
+        return total;
+    }
+    return far((char) (n % 100), total + n, n - 1);
+}
+
+long far(char c, long total, int n) {
+    return near(n, total * 3 % 1000003 + c);
+}
+
+int main() {
+    printf("%d %d %d\n", f(4), f(5), f(10001));
+    printf("%g %ld\n", step(1001, 0.0), near(10000, 1));
+    return 0;
+}
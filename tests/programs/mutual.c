@@ -0,0 +1,76 @@
+#include <stdio.h>
+
+int is_odd(unsigned n);
+
+int is_even(unsigned n) {
+    if (n == 0) {
+        return 1;
+    }
+    return is_odd(n - 1);
+}
+
+int is_odd(unsigned n) {
+    if (n == 0) {
+        return 0;
+    }
+    return is_even(n - 1);
+}
+
+long collatz_odd(long n, int steps);
+
+long collatz_even(long n, int steps) {
+    if (n == 1) {
+        return steps;
+    }
+    if (n % 2) {
+        return collatz_odd(n, steps);
+    }
+    return collatz_even(n / 2, steps + 1);
+}
+
+long collatz_odd(long n, int steps) {
+    return n % 2 ? collatz_even(3 * n + 1, steps + 1) : collatz_even(n, steps);
+}
+
+int count_down(int n, int acc) {
+    if (n == 0) {
+        return acc;
+    }
+    {
+        int m = n - 1;
+        {
+            int n = m;
+            return count_down(n, acc + 1);
+        }
+    }
+}
+
+int twice(const int n, int acc) {
+    if (n == 0) {
+        return acc;
+    }
+    return twice(n - 1, acc + 2);
+}
+
+long sum_array(int a[], int k, long s) {
+    if (k == 0) {
+        return s;
+    }
+    return sum_array(a + 1, k - 1, s + a[0]);
+}
+
+int swap(int x, int y, int k) {
+    if (k == 0) {
+        return x * 10 + y;
+    }
+    return swap(y, x, k - 1);
+}
+
+int main() {
+    int a[] = {1, 2, 3, 4};
+    printf("%d %d\n", is_even(10000), is_odd(7777));
+    printf("%ld %ld\n", collatz_even(27, 0), collatz_odd(97, 0));
+    printf("%d %d %ld %d\n", count_down(5, 0), twice(5, 0),
+           sum_array(a, 4, 0), swap(1, 2, 3));
+    return 0;
+}
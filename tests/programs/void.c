@@ -0,0 +1,60 @@
+#include <stdio.h>
+
+int count;
+
+void pong(int n, char c, double d);
+
+void ping(int n, char c, double d) {
+    count++;
+    if (n <= 0) {
+        return;
+    }
+    pong(n - 1, c, d * 1.0);
+}
+
+void pong(int n, char c, double d) {
+    count += 2;
+    if (n <= 0) {
+        return;
+    }
+    return ping(n - 1, c + 1, d);
+}
+
+void alternate(int n, int k) {
+    count++;
+    switch (k) {
+    case 0:
+        if (n) {
+            alternate(n - 1, 1);
+        }
+        break;
+    default:
+        alternate(n, 0);
+    }
+}
+
+void loop(int n) {
+    if (n == 0) {
+        return;
+    }
+    count++;
+    loop(n - 1);
+}
+
+void no_tail_call(int n) {
+    for (int i = 0; i < 2; i++) {
+        count++;
+    }
+    if (n) {
+        printf("%s", "");
+    }
+}
+
+int main() {
+    ping(10001, 'a', 2.0);
+    alternate(10000, 0);
+    loop(10000);
+    no_tail_call(1);
+    printf("%d\n", count);
+    return 0;
+}
@@ -0,0 +1,229 @@
+"""
+Converts C programs with every mode of the tail call elimination, compiles
+the results with the local C compiler and checks that they print the same
+output as the original programs.
+
+The programs are the example of c_files and the programs of the programs
+directory, which print everything they compute. The compiler is the one of
+$CC, or gcc, and the tests are skipped if it is not installed.
+"""
+
+import glob
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+TESTS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIRECTORY = os.path.join(TESTS_DIRECTORY, "..", "src")
+sys.path.insert(0, SOURCE_DIRECTORY)
+
+import main as tail_call_elimination  # noqa: E402
+import utils  # noqa: E402
+
+COMPILER = os.environ.get("CC", "gcc")
+RUN_TIMEOUT = 60
+
+# The warnings the converted programs must compile without, as they would be
+# the fault of the conversion: the static functions it leaves uncalled and
+# the labels of the block functions nothing jumps to
+CONVERTED_FLAGS = ["-Wunused-function", "-Wunused-label", "-Werror"]
+
+PROGRAMS = sorted(
+    glob.glob(os.path.join(TESTS_DIRECTORY, "..", "c_files", "*.c"))
+    + glob.glob(os.path.join(TESTS_DIRECTORY, "programs", "*.c"))
+)
+PROGRAMS = [path for path in PROGRAMS if not path.endswith("_removed.c")]
+
+# The options of each mode, as arguments of utils.TransformOptions
+MODES = {
+    "default": {},
+    "scc": {"partition": "scc"},
+    "goto": {"dispatch": "goto"},
+    "if": {"dispatch": "if"},
+    "direct": {"frame_abi": "direct"},
+    "direct_scc_goto": {
+        "frame_abi": "direct",
+        "partition": "scc",
+        "dispatch": "goto",
+    },
+    "no_loop_rewrite": {"loop_rewrite": False},
+    "accumulate": {"accumulate": True},
+    "accumulate_scc": {"accumulate": True, "partition": "scc"},
+}
+
+# The edits each program gets between the runs of the incremental
+# conversion, as pairs of the text to replace and its replacement
+INCREMENTAL_EDITS = {
+    "main.c": [('printf("foo\\n");', 'printf("foo!\\n");')],
+    "mutual.c": [
+        ("return is_odd(n - 1);", "return n > 5000 ? 1 : is_odd(n - 1);"),
+        ("return x * 10 + y;", "return x * 100 + y;"),
+    ],
+    "indirect.c": [
+        ("vm->acc += 2;", "vm->acc += 3;"),
+        (
+            "int op_halt(VM *vm) {",
+            "int op_halt(VM *vm) {\n"
+            "    if (vm->acc < 0) {\n"
+            "        return op_dec(vm);\n"
+            "    }",
+        ),
+    ],
+}
+
+pytestmark = pytest.mark.skipif(
+    shutil.which(COMPILER) is None, reason=f"{COMPILER} is not installed"
+)
+
+
+def get_program_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def compile_and_run(source_path, binary_path, flags=("-w",)):
+    """
+    Compiles the C file with the given flags and runs the binary. Returns its
+    exit status and output.
+    """
+    compilation = subprocess.run(
+        [COMPILER, *flags, source_path, "-o", binary_path],
+        capture_output=True,
+        text=True,
+    )
+    assert compilation.returncode == 0, compilation.stderr
+    execution = subprocess.run(
+        [binary_path], capture_output=True, text=True, timeout=RUN_TIMEOUT
+    )
+    return execution.returncode, execution.stdout
+
+
+@pytest.fixture(scope="session")
+def original_outputs(tmp_path_factory):
+    """The exit status and output of every original program, by path."""
+    directory = tmp_path_factory.mktemp("original")
+    return {
+        path: compile_and_run(path, str(directory / get_program_name(path)))
+        for path in PROGRAMS
+    }
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("path", PROGRAMS, ids=get_program_name)
+def test_conversion(path, mode, original_outputs, tmp_path):
+    with open(path) as file:
+        source = file.read()
+    converted = tail_call_elimination.transform_source(
+        source, utils.TransformOptions(**MODES[mode]), filename=path
+    )
+    converted_path = tmp_path / f"{get_program_name(path)}_removed.c"
+    converted_path.write_text(converted)
+    assert (
+        compile_and_run(
+            str(converted_path), str(tmp_path / "converted"), CONVERTED_FLAGS
+        )
+        == original_outputs[path]
+    )
+
+
+def convert_with_main(arguments):
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(SOURCE_DIRECTORY, "main.py"),
+            *arguments,
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    [path for path in PROGRAMS if os.path.basename(path) in INCREMENTAL_EDITS],
+    ids=get_program_name,
+)
+def test_incremental_conversion(path, tmp_path):
+    """
+    Converts the program incrementally after each of its edits, and checks
+    that the result is the same as the result of converting it from scratch
+    and prints the same output as the edited program.
+    """
+    with open(path) as file:
+        source = file.read()
+    program_path = tmp_path / os.path.basename(path)
+    result_path = tmp_path / f"{get_program_name(path)}_removed.c"
+    incremental_arguments = [
+        str(program_path),
+        "--cache",
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--incremental",
+    ]
+    program_path.write_text(source)
+    convert_with_main(incremental_arguments)
+    for old, new in INCREMENTAL_EDITS[os.path.basename(path)]:
+        assert old in source
+        source = source.replace(old, new, 1)
+        program_path.write_text(source)
+        convert_with_main(incremental_arguments)
+        incremental_result = result_path.read_text()
+        convert_with_main([str(program_path)])
+        assert incremental_result == result_path.read_text()
+        assert compile_and_run(
+            str(result_path), str(tmp_path / "converted"), CONVERTED_FLAGS
+        ) == compile_and_run(str(program_path), str(tmp_path / "original"))
+
+
+# A program whose parse depends on the header it includes: (scale) + v is a
+# cast while scale is a typedef name and an addition once it is a constant
+HEADER_PROGRAM = """#include <stdio.h>
+#include "scale.h"
+
+int shift(int v, int n) {
+    if (n == 0) {
+        return (scale) + v;
+    }
+    return shift(v + 1, n - 1);
+}
+
+int main() {
+    printf("%d\\n", shift(1, 10));
+    return 0;
+}
+"""
+
+HEADER_VERSIONS = ["typedef int scale;\n", "enum { scale = 3 };\n"]
+
+
+@pytest.mark.skipif(shutil.which("cpp") is None, reason="cpp is not installed")
+@pytest.mark.parametrize("incremental", [False, True])
+def test_cached_conversion_with_changed_header(incremental, tmp_path):
+    """
+    Converts the program with the preprocessor and the cache after each
+    change of the header it includes, and checks that the result is the same
+    as the result of converting it without the cache and prints the same
+    output as the program.
+    """
+    program_path = tmp_path / "header.c"
+    result_path = tmp_path / "header_removed.c"
+    program_path.write_text(HEADER_PROGRAM)
+    cached_arguments = [
+        str(program_path),
+        "--preprocess",
+        "--cache",
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        *(["--incremental"] if incremental else []),
+    ]
+    for header in HEADER_VERSIONS:
+        (tmp_path / "scale.h").write_text(header)
+        convert_with_main(cached_arguments)
+        cached_result = result_path.read_text()
+        convert_with_main([str(program_path), "--preprocess"])
+        assert cached_result == result_path.read_text()
+        assert compile_and_run(
+            str(result_path), str(tmp_path / "converted"), CONVERTED_FLAGS
+        ) == compile_and_run(str(program_path), str(tmp_path / "original"))